@@ -0,0 +1,95 @@
+import os
+
+import pytest
+
+from vtool import data
+from vtool.process_manager import process
+
+
+@pytest.fixture
+def process_inst(tmp_path):
+    data.DataFolderIndex.clear()
+
+    process_inst = process.Process('test_process')
+    process_inst.set_directory(str(tmp_path))
+    process_inst.create()
+
+    yield process_inst
+
+    data.DataFolderIndex.clear()
+
+
+def test_data_folders(process_inst):
+    process_inst.create_data('skin', 'maya.skin_weights')
+    process_inst.create_data('build', 'maya.ascii')
+
+    assert sorted(process_inst.get_data_folders()) == ['build', 'skin']
+    assert process_inst.get_data_type('skin') == 'maya.skin_weights'
+    assert process_inst.get_data_type('build') == 'maya.ascii'
+    assert process_inst.is_data_folder('skin')
+    assert not process_inst.is_data_folder('missing')
+
+
+def test_unchanged_directory_is_not_scanned_again(process_inst):
+    process_inst.create_data('skin', 'maya.skin_weights')
+    process_inst.get_data_folders()
+
+    scan_count = data.DataFolderIndex.scan_count
+
+    for inc in range(20):
+        process_inst.get_data_folders()
+        process_inst.get_data_type('skin')
+        process_inst.is_data_folder('skin')
+
+    assert data.DataFolderIndex.scan_count == scan_count
+
+
+def test_edits_are_picked_up(process_inst):
+    process_inst.create_data('skin', 'maya.skin_weights')
+    process_inst.create_data('build', 'maya.ascii')
+    assert process_inst.get_data_type('skin') == 'maya.skin_weights'
+
+    process_inst.rename_data('skin', 'weights')
+    assert sorted(process_inst.get_data_folders()) == ['build', 'weights']
+    assert process_inst.get_data_type('weights') == 'maya.skin_weights'
+
+    process_inst.delete_data('build')
+    assert process_inst.get_data_folders() == ['weights']
+
+    data_folder = data.DataFolder('weights', process_inst.get_data_path())
+    data_folder.set_data_type('maya.deform_weights')
+    assert process_inst.get_data_type('weights') == 'maya.deform_weights'
+
+
+def test_folder_made_outside_vetala(process_inst):
+    data_path = process_inst.get_data_path()
+    process_inst.get_data_folders()
+
+    os.makedirs(os.path.join(data_path, 'external'))
+    mtime = os.stat(data_path).st_mtime_ns
+    os.utime(data_path, ns=(mtime + 1000000000, mtime + 1000000000))
+
+    assert 'external' in process_inst.get_data_folders()
+    assert process_inst.get_data_type('external') is None
+
+
+def test_code_folders(process_inst):
+    process_inst.create_code('rig', 'script.python')
+    process_inst.create_code('utils', 'script.python')
+
+    names = process_inst.get_code_names()
+
+    assert 'rig' in names and 'utils' in names
+    assert process_inst.get_code_type('rig') == 'script.python'
+    assert process_inst.is_code_folder('rig')
+    assert not process_inst.is_code_folder('missing')
+
+
+def test_version_count(tmp_path):
+    version_folder = tmp_path / '.version'
+    version_folder.mkdir()
+    for name in ('version.1', 'version.2', 'version.default', 'comments.txt'):
+        (version_folder / name).write_text('')
+
+    assert data.DataFolderIndex.get_version_count(str(version_folder)) == 2
+    assert data.DataFolderIndex.get_version_count(str(tmp_path / 'missing')) == 0
@@ -0,0 +1,44 @@
+from vtool import data
+
+
+def test_available_types():
+    types = data.DataManager.get_available_types()
+
+    assert types[:3] == ['maya.ascii', 'maya.binary', 'maya.shotgun']
+    assert 'maya.skin_weights' in types
+    assert len(types) == len(set(types)) == 24
+
+
+def test_type_instance_creates_one_instance():
+    data.DataManager.get_available_types()
+    count = data.DataManager.instance_count
+
+    instance = data.DataManager.get_type_instance('maya.skin_weights')
+
+    assert isinstance(instance, data.SkinWeightData)
+    assert data.DataManager.instance_count == count + 1
+    assert data.DataManager.get_type_instance('missing.type') is None
+    assert data.DataManager.instance_count == count + 1
+
+
+def test_register_type(monkeypatch):
+    monkeypatch.setattr(data.DataManager, 'data_classes', None)
+
+    class StudioData(data.CustomData):
+        def _data_type(self):
+            return 'studio.custom'
+
+    assert data.DataManager.register_type(StudioData) == 'studio.custom'
+    assert data.DataManager.get_available_types()[-1] == 'studio.custom'
+    assert isinstance(data.DataManager.get_type_instance('studio.custom'), StudioData)
+
+    assert data.DataManager.register_type(StudioData, 'maya.skin_weights') == 'maya.skin_weights'
+    assert isinstance(data.DataManager.get_type_instance('maya.skin_weights'), StudioData)
+    assert len(data.DataManager.get_available_types()) == 25
+
+
+def test_existing_manager_calls():
+    manager = data.DataManager()
+
+    assert manager.get_available_types() == data.DataManager.get_available_types()
+    assert isinstance(manager.get_type_instance('script.python'), data.ScriptPythonData)
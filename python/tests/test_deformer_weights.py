@@ -0,0 +1,174 @@
+import pytest
+
+from vtool.maya_lib import api
+from vtool.maya_lib import blendshape
+from vtool.maya_lib import deform
+
+
+class FakePlug(object):
+
+    def __init__(self, values):
+        self.values = values
+
+    def getExistingArrayAttributeIndices(self):
+        return sorted(self.values)
+
+    def elementByLogicalIndex(self, index):
+        return FakeElement(self.values[index])
+
+
+class FakeElement(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def asFloat(self):
+        return self.value
+
+
+class FakeScene(object):
+    """
+    Stands in for cmds and api.get_plug with sparse weight multis on meshes.
+    """
+
+    def __init__(self):
+        self.multis = {}
+        self.vertex_counts = {}
+        self.calls = {'get_plug': 0, 'getAttr': 0, 'polyEvaluate': 0}
+        self.set_attrs = []
+
+    def get_plug(self, attribute_name):
+        self.calls['get_plug'] += 1
+        return FakePlug(self.multis[attribute_name])
+
+    def getAttr(self, attribute_name):
+        self.calls['getAttr'] += 1
+        multi, index = attribute_name[:-1].rsplit('[', 1)
+
+        if ':' not in index:
+            return self.multis[multi].get(int(index), 1.0)
+
+        start, end = [int(value) for value in index.split(':')]
+        values = [self.multis[multi].get(inc, 1.0) for inc in range(start, end + 1)]
+
+        # like maya a single value comes back on its own
+        if len(values) == 1:
+            return values[0]
+        return values
+
+    def polyEvaluate(self, mesh, vertex=False):
+        self.calls['polyEvaluate'] += 1
+        if mesh in self.vertex_counts:
+            return self.vertex_counts[mesh]
+        return "Nothing counted : no polygonal object is selected."
+
+    def setAttr(self, attribute_name, *values, **kwargs):
+        self.set_attrs.append((attribute_name, values, kwargs))
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    scene = FakeScene()
+
+    monkeypatch.setattr(api, 'get_plug', scene.get_plug)
+    monkeypatch.setattr(api, 'cmds', scene, raising=False)
+    monkeypatch.setattr(deform, 'cmds', scene, raising=False)
+    monkeypatch.setattr(blendshape, 'cmds', scene, raising=False)
+
+    return scene
+
+
+def _per_vertex(scene, attribute_name, count):
+    """
+    The reads get_deformer_weights and BlendShape ran before, one getAttr per vertex.
+    """
+    return [scene.getAttr('%s[%s]' % (attribute_name, inc)) for inc in range(count)]
+
+
+def test_get_weights_matches_per_vertex_reads(scene):
+    scene.multis['cluster1.weightList[0].weights'] = {0: 0.5, 2: 0.0, 5: 0.25, 9: 0.75}
+
+    weights = api.get_weights('cluster1.weightList[0].weights', 6)
+
+    assert weights == [0.5, 1.0, 0.0, 1.0, 1.0, 0.25]
+    assert scene.calls == {'get_plug': 0, 'getAttr': 1, 'polyEvaluate': 0}
+    assert weights == _per_vertex(scene, 'cluster1.weightList[0].weights', 6)
+
+
+def test_get_weights_single(scene):
+    scene.multis['cluster1.weightList[0].weights'] = {0: 0.5}
+
+    assert api.get_weights('cluster1.weightList[0].weights', 1) == [0.5]
+
+
+def test_get_weights_short_range(scene, monkeypatch):
+    scene.multis['cluster1.weightList[0].weights'] = {1: 0.5, 3: 0.25}
+
+    # a range that skips unset indices falls back to the plug
+    monkeypatch.setattr(scene, 'getAttr', lambda attribute_name: [0.5, 0.25])
+
+    assert api.get_weights('cluster1.weightList[0].weights', 4, default=0.0) == [0.0, 0.5, 0.0, 0.25]
+    assert scene.calls['get_plug'] == 1
+
+
+def test_get_weights_empty(scene):
+    scene.multis['blendShape1.inputTarget[0].baseWeights'] = {1: 0.5}
+
+    assert api.get_weights('blendShape1.inputTarget[0].baseWeights', 0) == []
+    assert scene.calls['getAttr'] == 0
+
+
+def test_deformer_weights(scene, monkeypatch):
+    monkeypatch.setattr(deform, 'get_mesh_at_deformer_index', lambda deformer, index: 'mesh%s' % index)
+    scene.vertex_counts['mesh1'] = 4
+    scene.multis['cluster1.weightList[1].weights'] = {1: 0.2, 3: 0.4}
+
+    assert deform.get_deformer_weights('cluster1', 1) == [1.0, 0.2, 1.0, 0.4]
+    assert scene.calls['getAttr'] == 1
+
+    assert deform.get_deformer_weights('cluster1', 2) == []
+
+
+@pytest.fixture
+def blend(scene, monkeypatch):
+    scene.vertex_counts['body'] = 5
+    scene.multis['base_weights'] = {0: 0.1, 4: 0.9}
+    scene.multis['smile_weights'] = {2: 0.3}
+
+    monkeypatch.setattr(blendshape.core, 'exists', lambda name: False)
+    monkeypatch.setattr(blendshape.BlendShape, '_get_input_target_base_weights_attribute',
+                        lambda self, mesh_index=0: 'base_weights')
+    monkeypatch.setattr(blendshape.BlendShape, '_get_input_target_group_weights_attribute',
+                        lambda self, name, mesh_index=0: '%s_weights' % name)
+
+    blend = blendshape.BlendShape('blendShape1')
+    blend.meshes = ['body']
+
+    return blend
+
+
+def test_blendshape_weights(scene, blend):
+    assert blend.get_weights() == [0.1, 1.0, 1.0, 1.0, 0.9]
+    assert blend.get_weights() == _per_vertex(scene, 'base_weights', 5)
+    assert blend.get_weights('smile') == [1.0, 1.0, 0.3, 1.0, 1.0]
+
+
+def test_blendshape_set_weights_fallback(scene, blend, monkeypatch):
+
+    def set_weights(attribute_name, weights):
+        raise RuntimeError()
+
+    monkeypatch.setattr(api, 'set_weights', set_weights)
+
+    blend.set_weights(0.5, 'smile')
+
+    assert scene.set_attrs == [('smile_weights[0:4]', (0.5,) * 5, {})]
+
+
+def test_blendshape_invert_weights(scene, blend, monkeypatch):
+    written = []
+    monkeypatch.setattr(api, 'set_weights', lambda attribute_name, weights: written.append((attribute_name, weights)))
+
+    blend.set_invert_weights()
+
+    assert written == [('base_weights', pytest.approx([0.9, 0.0, 0.0, 0.0, 0.1]))]
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+python_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _get_loaded(code):
+    """
+    Run code in a new interpreter and return the maya_lib modules it loaded.
+    """
+    script = 'import sys\n%s\nprint(sorted(name for name in sys.modules if name.startswith("vtool.maya_lib")))' % code
+
+    output = subprocess.check_output([sys.executable, '-c', script], cwd=python_path, universal_newlines=True)
+    return eval(output.strip().splitlines()[-1])
+
+
+def test_package_import_loads_no_submodules():
+    assert _get_loaded('import vtool.maya_lib') == ['vtool.maya_lib']
+
+
+def test_submodule_loads_on_access():
+    loaded = _get_loaded('import vtool.maya_lib\nvtool.maya_lib.geo')
+
+    assert 'vtool.maya_lib.geo' in loaded
+    assert 'vtool.maya_lib.corrective' not in loaded
+    assert 'vtool.maya_lib.rigs' not in loaded
+
+
+def test_process_import_stays_small():
+    loaded = _get_loaded('from vtool.process_manager import process')
+
+    for name in ['geo', 'corrective', 'rigs', 'deform', 'anim', 'shade']:
+        assert 'vtool.maya_lib.%s' % name not in loaded
+
+
+def test_missing_attribute():
+    loaded = _get_loaded('import vtool.maya_lib\n'
+                         'try:\n    vtool.maya_lib.not_a_module\nexcept AttributeError:\n    pass')
+
+    assert loaded == ['vtool.maya_lib']
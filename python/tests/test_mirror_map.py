@@ -0,0 +1,125 @@
+import random
+
+from vtool import util_math
+from vtool.maya_lib import geo
+
+
+def _get_symmetric_points(half_count, seed):
+    """
+    Points on both sides of X, shuffled so partners are not neighbours in the list.
+    """
+    rand = random.Random(seed)
+
+    points = []
+    for _ in range(half_count):
+        point = (rand.uniform(0.1, 10), rand.uniform(-10, 10), rand.uniform(-10, 10))
+        points.append(point)
+        points.append((-point[0], point[1], point[2]))
+    points.append((0.0, 1.0, 2.0))
+
+    rand.shuffle(points)
+
+    return points
+
+
+def test_mirror_map_pairs_points():
+    points = _get_symmetric_points(2000, 1)
+
+    mirror_map, fallback = util_math.get_mirror_map(points)
+
+    assert not fallback
+    for inc, partner in enumerate(mirror_map):
+        assert points[partner] == util_math.mirror_vector(points[inc])
+        assert mirror_map[partner] == inc
+
+
+def test_mirror_map_reports_fallback():
+    points = _get_symmetric_points(200, 2)
+    moved = 5
+    points[moved] = (points[moved][0], points[moved][1] + 0.01, points[moved][2])
+
+    mirror_map, fallback = util_math.get_mirror_map(points, tolerance=0.0001)
+
+    partner = mirror_map[moved]
+    assert sorted(fallback) == sorted([moved, partner])
+    assert points[partner] == util_math.mirror_vector((points[moved][0], points[moved][1] - 0.01, points[moved][2]))
+
+
+def test_mirror_map_other_axis():
+    points = [(1, 2, 3), (1, -2, 3), (0, 0, 0)]
+
+    assert util_math.get_mirror_map(points, 'Y') == ([1, 0, 2], [])
+
+
+def test_cache_reuses_unchanged_points():
+    geo.MirrorMapCache.clear()
+    build_count = geo.MirrorMapCache.build_count
+
+    points = _get_symmetric_points(100, 3)
+    topology = tuple(range(len(points)))
+
+    first = geo.MirrorMapCache.get_mirror_map(points, topology)
+    second = geo.MirrorMapCache.get_mirror_map(list(points), topology)
+
+    assert first is second
+    assert geo.MirrorMapCache.build_count == build_count + 1
+
+    points[0] = (points[0][0] + 1, points[0][1], points[0][2])
+    geo.MirrorMapCache.get_mirror_map(points, topology)
+    geo.MirrorMapCache.get_mirror_map(points, topology, axis='Y')
+    geo.MirrorMapCache.get_mirror_map(points, topology[::-1])
+
+    assert geo.MirrorMapCache.build_count == build_count + 4
+
+
+class Topology(object):
+    """
+    Topology that hashes like every other one, but is only equal to the same vertex list.
+    """
+
+    def __init__(self, indices):
+        self.indices = tuple(indices)
+
+    def __hash__(self):
+        return 1
+
+    def __eq__(self, other):
+        return self.indices == other.indices
+
+
+def test_cache_does_not_share_on_equal_hash():
+    geo.MirrorMapCache.clear()
+    build_count = geo.MirrorMapCache.build_count
+
+    points = [(1, 0, 0), (-1, 0, 0), (2, 0, 0)]
+
+    first = geo.MirrorMapCache.get_mirror_map(points, Topology([0, 1, 2]))
+    second = geo.MirrorMapCache.get_mirror_map(points, Topology([2, 1, 0]))
+
+    assert first is not second
+    assert geo.MirrorMapCache.build_count == build_count + 2
+    assert geo.MirrorMapCache.get_mirror_map(points, Topology([0, 1, 2])) is first
+
+
+def test_cache_drops_least_recently_used(monkeypatch):
+    geo.MirrorMapCache.clear()
+    monkeypatch.setattr(geo.MirrorMapCache, 'max_maps', 3)
+
+    meshes = [_get_symmetric_points(20, seed) for seed in range(4)]
+
+    first_maps = [geo.MirrorMapCache.get_mirror_map(points) for points in meshes[:3]]
+
+    # using the first map keeps it, so the second one is dropped for the fourth mesh
+    assert geo.MirrorMapCache.get_mirror_map(meshes[0]) is first_maps[0]
+    geo.MirrorMapCache.get_mirror_map(meshes[3])
+
+    assert len(geo.MirrorMapCache.maps) == 3
+
+    build_count = geo.MirrorMapCache.build_count
+
+    assert geo.MirrorMapCache.get_mirror_map(meshes[0]) is first_maps[0]
+    assert geo.MirrorMapCache.get_mirror_map(meshes[2]) is first_maps[2]
+    assert geo.MirrorMapCache.build_count == build_count
+
+    assert geo.MirrorMapCache.get_mirror_map(meshes[1]) is not first_maps[1]
+    assert geo.MirrorMapCache.build_count == build_count + 1
@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from vtool.maya_lib import core
+
+
+class FakeScene(object):
+    """
+    Stands in for cmds and core.exists with a set of node names.
+    """
+
+    def __init__(self, names=None):
+        self.names = set(names or [])
+        self.queries = 0
+
+    def exists(self, name):
+        self.queries += 1
+        return name in self.names
+
+    def namespace(self, exists=None):
+        self.queries += 1
+        return False
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    scene = FakeScene()
+
+    monkeypatch.setattr(core, 'cmds', scene, raising=False)
+    monkeypatch.setattr(core, 'exists', scene.exists)
+
+    yield scene
+
+    core.NameRegistry.stop()
+
+
+def _run(scene, use_registry, seed, steps=600):
+    """
+    Create and delete nodes named with inc_name. The registry is told about changes the way the scene callbacks would.
+    """
+    rand = random.Random(seed)
+    bases = ['joint', 'joint_1', 'ctrl_L', 'ctrl_R_1', 'cluster', 'grp']
+
+    scene.names = set(['joint', 'grp', 'grp1'])
+    scene.queries = 0
+
+    if use_registry:
+        core.NameRegistry.start(list(scene.names))
+    else:
+        core.NameRegistry.stop()
+
+    names = []
+
+    for step in range(steps):
+        if scene.names and rand.random() < 0.2:
+            name = rand.choice(sorted(scene.names))
+            scene.names.discard(name)
+            if use_registry:
+                core.NameRegistry.remove_name(name)
+            continue
+
+        name = core.inc_name(rand.choice(bases))
+        names.append(name)
+        scene.names.add(name)
+        if use_registry:
+            core.NameRegistry.add_name(name)
+
+    return names, scene.queries
+
+
+def test_names_match_scene_queries(scene, monkeypatch):
+    for seed in range(3):
+        monkeypatch.setattr(core.NameRegistry, 'enabled', False)
+        expected, expected_queries = _run(scene, False, seed)
+
+        found, queries = _run(scene, True, seed)
+
+        assert found == expected
+        assert queries < expected_queries
+
+
+def test_node_missed_by_registry(scene):
+    scene.names = set(['pivot', 'pivot_1'])
+    core.NameRegistry.start(['pivot'])
+
+    assert core.inc_name('pivot') == 'pivot_2'
+    assert core.NameRegistry.has_name('pivot_1')
+
+
+def test_removed_name_is_reused(scene):
+    scene.names = set(['pivot', 'pivot_1', 'pivot_2'])
+    core.NameRegistry.start(scene.names)
+
+    assert core.inc_name('pivot') == 'pivot_3'
+
+    scene.names.discard('pivot_1')
+    core.NameRegistry.remove_name('pivot_1')
+
+    assert core.inc_name('pivot') == 'pivot_1'
+
+
+def test_paths_skip_registry(scene):
+    core.NameRegistry.start(['pivot'])
+
+    assert not core.NameRegistry.can_check('group1|pivot')
+    assert not core.NameRegistry.can_check('pivot*')
+    assert core.NameRegistry.can_check('pivot')
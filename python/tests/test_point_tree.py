@@ -0,0 +1,150 @@
+import math
+import random
+
+import pytest
+
+from vtool import util_math
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(util_math, 'numpy', None)
+    elif util_math.numpy is None:
+        pytest.skip('numpy is not installed')
+
+    return request.param
+
+
+def _get_points(count, seed):
+    rand = random.Random(seed)
+    return [[rand.uniform(-10, 10), rand.uniform(-10, 10), rand.uniform(-10, 10)] for _ in range(count)]
+
+
+def _distance(point1, point2):
+    return math.sqrt(sum((point1[inc] - point2[inc]) ** 2 for inc in range(3)))
+
+
+def _brute_closest(points, point, max_distance=None):
+    best = None
+    for inc, other in enumerate(points):
+        distance = _distance(point, other)
+        if max_distance is not None and distance > max_distance:
+            continue
+        if best is None or distance < best[1]:
+            best = (inc, distance)
+    return best
+
+
+def test_closest_matches_brute_force():
+    for seed in range(5):
+        points = _get_points(500, seed)
+        tree = util_math.PointTree(points, leaf_size=4)
+
+        for query in _get_points(200, seed + 100):
+            index, distance = tree.get_closest(query)
+            brute_index, brute_distance = _brute_closest(points, query)
+
+            assert index == brute_index
+            assert math.isclose(distance, brute_distance)
+
+
+def test_closest_within_max_distance():
+    points = _get_points(500, 1)
+    tree = util_math.PointTree(points)
+
+    for query in _get_points(200, 2):
+        expected = _brute_closest(points, query, 1.5)
+        found = tree.get_closest(query, 1.5)
+
+        if expected is None:
+            assert found is None
+        else:
+            assert found[0] == expected[0]
+
+
+def test_radius_matches_brute_force():
+    for seed in range(5):
+        points = _get_points(500, seed)
+        tree = util_math.PointTree(points, leaf_size=8)
+
+        for query in _get_points(50, seed + 100):
+            for radius in (0.5, 2.0, 6.0):
+                expected = [inc for inc, other in enumerate(points) if _distance(query, other) < radius]
+                assert tree.get_within_radius(query, radius) == expected
+
+
+def test_duplicate_points_prefer_lowest_index():
+    points = [[1, 1, 1], [0, 0, 0], [1, 1, 1], [0, 0, 0]]
+    tree = util_math.PointTree(points, leaf_size=1)
+
+    assert tree.get_closest([0, 0, 0.1])[0] == 1
+    assert tree.get_closest([1, 1, 1])[0] == 0
+
+
+def test_empty_tree():
+    tree = util_math.PointTree([])
+
+    assert len(tree) == 0
+    assert tree.get_closest([0, 0, 0]) is None
+    assert tree.get_within_radius([0, 0, 0], 10) == []
+
+
+def _check_many(points, tree, queries, max_distance=None):
+    for query, found in zip(queries, tree.get_closest_many(queries, max_distance)):
+        expected = _brute_closest(points, query, max_distance)
+
+        if expected is None:
+            assert found is None
+        else:
+            assert found[0] == expected[0]
+            assert math.isclose(found[1], expected[1], abs_tol=1e-12)
+
+
+def test_closest_many_matches_brute_force(backend):
+    points = _get_points(500, 3)
+    tree = util_math.PointTree(points)
+
+    assert (tree._array is not None) == (backend == 'numpy')
+
+    queries = _get_points(200, 4)
+    for max_distance in [None, 0.5, 1.5, 40.0]:
+        _check_many(points, tree, queries, max_distance)
+
+    assert tree.get_closest_many([]) == []
+
+
+def test_closest_many_in_cells(backend, monkeypatch):
+    # small enough chunks that unbounded queries go through the cells and widen for far queries
+    monkeypatch.setattr(util_math.PointTree, 'brute_chunk', 2000)
+
+    points = _get_points(1000, 5)
+    tree = util_math.PointTree(points)
+
+    queries = _get_points(300, 6) + [[100, -100, 50], [0, 0, 1000]]
+    _check_many(points, tree, queries)
+    _check_many(points, tree, queries, 0.75)
+
+
+def test_closest_many_ties(backend):
+    points = [[1, 1, 1], [0, 0, 0], [1, 1, 1], [0, 0, 0]]
+    tree = util_math.PointTree(points, leaf_size=1)
+
+    assert [found[0] for found in tree.get_closest_many([[0, 0, 0.1], [1, 1, 1], [0.5, 0.5, 0.5]])] == [1, 0, 0]
+    assert [found[0] for found in tree.get_closest_many([[0, 0, 0], [1, 1, 1]], 0)] == [1, 0]
+
+
+def test_mirror_indices(backend):
+    half = _get_points(300, 7)
+    points = [[abs(point[0]) + 0.01, point[1], point[2]] for point in half]
+    points += [[-point[0], point[1], point[2]] for point in points]
+    points.append([5, 50, 5])
+
+    tree = util_math.PointTree(points)
+
+    assert tree.get_mirror_indices('X') == list(range(300, 600)) + list(range(300)) + [None]
+
+    mirror_map, fallback = util_math.get_mirror_map(points, 'X', point_tree=tree)
+    assert mirror_map[:600] == list(range(300, 600)) + list(range(300))
+    assert fallback == [600]
+    assert mirror_map[600] == _brute_closest(points, [-5, 50, 5])[0]
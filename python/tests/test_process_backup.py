@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+from vtool import util_file
+from vtool.process_manager import process
+
+
+@pytest.fixture
+def process_inst(tmp_path):
+    process_inst = process.Process('char')
+    process_inst.set_directory(str(tmp_path))
+    process_inst.create()
+    process_inst.create_code('rig', 'script.python')
+
+    return process_inst
+
+
+def _get_snapshot(process_inst, version_number):
+    backup_path = process_inst.get_backup_path()
+    version_file = util_file.VersionFile(backup_path)
+    version_file.set_version_folder(backup_path)
+
+    return util_file.join_path(version_file.get_version_path(version_number), 'char')
+
+
+def _get_relative_files(path):
+    found = []
+    for root, folders, files in os.walk(path):
+        for filename in files:
+            found.append(os.path.relpath(os.path.join(root, filename), path).replace('\\', '/'))
+    return sorted(found)
+
+
+def test_backup_skips_backup_and_version_folders(process_inst):
+    code_path = process_inst.get_code_folder('rig')
+
+    # a version of the code and a stray backup folder deeper in the process
+    util_file.VersionFile(code_path).save('code version')
+    os.makedirs(os.path.join(code_path, '.backup'))
+    with open(os.path.join(code_path, '.backup', 'old.py'), 'w') as fout:
+        fout.write('old')
+
+    process_inst.backup('first')
+    process_inst.backup('second')
+
+    for version_number in [1, 2]:
+        files = _get_relative_files(_get_snapshot(process_inst, version_number))
+
+        assert '.code/rig/rig.py' in files
+        for filepath in files:
+            assert '.backup' not in filepath.split('/')
+            assert '.version' not in filepath.split('/')
+
+    process_path = process_inst.get_path()
+    process_files = _get_relative_files(process_path)
+    assert [filepath for filepath in process_files if '.version' in filepath.split('/')]
+    assert '.code/rig/.backup/old.py' in process_files
+
+    expected = [filepath for filepath in process_files
+                if not set(filepath.split('/')).intersection(['.backup', '.version'])]
+
+    assert _get_relative_files(_get_snapshot(process_inst, 2)) == expected
+
+
+def test_unchanged_files_are_linked(process_inst, monkeypatch):
+    data_file = os.path.join(process_inst.get_path(), 'big.bin')
+    with open(data_file, 'wb') as fout:
+        fout.write(os.urandom(1 << 20))
+
+    process_inst.backup('first')
+    first_files = _get_relative_files(_get_snapshot(process_inst, 1))
+
+    code_file = util_file.join_path(process_inst.get_code_folder('rig'), 'rig.py')
+    with open(code_file, 'a') as fout:
+        fout.write('\nprint("changed")\n')
+
+    stores = []
+    store_init = util_file.VersionStore.__init__
+
+    def keep_store(self, version_folder):
+        store_init(self, version_folder)
+        stores.append(self)
+
+    hashed = []
+    get_hash = util_file.VersionStore._get_hash
+
+    def count_hash(self, filepath):
+        hashed.append(util_file.fix_slashes(filepath))
+        return get_hash(self, filepath)
+
+    monkeypatch.setattr(util_file.VersionStore, '__init__', keep_store)
+    monkeypatch.setattr(util_file.VersionStore, '_get_hash', count_hash)
+
+    process_inst.backup('second')
+
+    # unchanged files are not read again
+    assert hashed == [code_file]
+
+    store = stores[0]
+    assert [util_file.fix_slashes(filepath) for filepath in store.copied] == [code_file]
+    assert len(store.linked) == len(first_files) - 1
+
+    first = _get_snapshot(process_inst, 1)
+    second = _get_snapshot(process_inst, 2)
+
+    assert os.stat(os.path.join(first, 'big.bin')).st_ino == os.stat(os.path.join(second, 'big.bin')).st_ino
+    assert os.stat(os.path.join(first, '.code/rig/rig.py')).st_ino != \
+        os.stat(os.path.join(second, '.code/rig/rig.py')).st_ino
+
+    with open(os.path.join(second, '.code/rig/rig.py')) as fin:
+        assert fin.read().endswith('print("changed")\n')
@@ -0,0 +1,160 @@
+import os
+import time
+
+import pytest
+
+from vtool import util_file
+from vtool.process_manager import process
+
+
+def _get_relative_files(path):
+    found = []
+    for root, folders, files in os.walk(path):
+        for filename in files:
+            found.append(os.path.relpath(os.path.join(root, filename), path).replace('\\', '/'))
+    return sorted(found)
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = process.Process('char')
+    source.set_directory(str(tmp_path / 'source'))
+    source.create()
+
+    for name in ['rig', 'skin', 'face']:
+        source.create_code(name, 'script.python')
+
+    code_path = source.get_code_folder('rig')
+    for inc in range(10):
+        with open(os.path.join(code_path, 'extra%s.txt' % inc), 'w') as fout:
+            fout.write('x' * 1000 * (inc + 1))
+
+    util_file.VersionFile(util_file.join_path(code_path, 'rig.py')).save('history')
+
+    sub_process = source.add_part('arm')
+    sub_process.create_code('arm_rig', 'script.python')
+
+    return source
+
+
+def test_workers(monkeypatch):
+    process_copy = process.ProcessCopy(None)
+
+    monkeypatch.delenv('VETALA_COPY_WORKERS', raising=False)
+    assert process_copy._get_workers() == process.ProcessCopy.workers
+
+    for value, workers in [('3', 3), ('0', 1), ('many', process.ProcessCopy.workers)]:
+        monkeypatch.setenv('VETALA_COPY_WORKERS', value)
+        assert process_copy._get_workers() == workers
+
+
+def test_pool_uses_workers(source, tmp_path, monkeypatch):
+    monkeypatch.setenv('VETALA_COPY_WORKERS', '3')
+
+    pools = []
+    executor = process.concurrent.futures.ThreadPoolExecutor
+
+    def count_executor(max_workers=None):
+        pools.append(max_workers)
+        return executor(max_workers=max_workers)
+
+    monkeypatch.setattr(process.concurrent.futures, 'ThreadPoolExecutor', count_executor)
+
+    target_directory = str(tmp_path / 'target')
+    os.makedirs(target_directory)
+
+    process.copy_process(source, target_directory)
+
+    assert pools == [3, 3]
+
+
+def test_copy(source, tmp_path):
+    target_directory = str(tmp_path / 'target')
+    os.makedirs(target_directory)
+
+    new_process = process.copy_process(source, target_directory)
+
+    assert new_process.get_name() == 'char'
+    assert new_process.get_code_names() == source.get_code_names()
+
+    target_files = _get_relative_files(new_process.get_path())
+    source_files = [filepath for filepath in _get_relative_files(source.get_path())
+                    if '.version' not in filepath.split('/')]
+
+    for filepath in source_files:
+        assert filepath in target_files
+
+    # the sub process
+    assert [filepath for filepath in target_files if filepath.endswith('.code/arm_rig/arm_rig.py')]
+
+
+def test_dry_run(source, tmp_path):
+    target_directory = str(tmp_path / 'target')
+    os.makedirs(target_directory)
+
+    process_copy = process.copy_process(source, target_directory, dry_run=True)
+
+    assert isinstance(process_copy, process.ProcessCopy)
+    assert os.listdir(target_directory) == []
+    assert process_copy.copied_files == 0
+
+    assert len(process_copy.files) > 10
+    assert process_copy.total_bytes == sum(os.path.getsize(source_file)
+                                           for source_file, target_file, size in process_copy.files)
+    for source_file, target_file, size in process_copy.files:
+        assert '.version' not in util_file.fix_slashes(source_file).split('/')
+
+    progress = []
+    process_copy.progress_callback = lambda copied_bytes, total_bytes: progress.append((copied_bytes, total_bytes))
+
+    new_process = process_copy.run()
+    assert process_copy.copied_files == len(process_copy.files)
+    assert progress[len(process_copy.files) - 1] == (process_copy.total_bytes, process_copy.total_bytes)
+    assert new_process.get_code_names() == source.get_code_names()
+
+
+def test_cancel(source, tmp_path, monkeypatch):
+    monkeypatch.setenv('VETALA_COPY_WORKERS', '1')
+
+    target_directory = str(tmp_path / 'target')
+    os.makedirs(target_directory)
+
+    process_copy = process.ProcessCopy(source, target_directory)
+    process_copy.plan()
+
+    copy_file = process_copy._copy_file
+
+    def copy_then_cancel(source_file, target_file, size):
+        result = copy_file(source_file, target_file, size)
+        process_copy.cancel()
+        return result
+
+    process_copy._copy_file = copy_then_cancel
+
+    assert process_copy.run() is None
+    assert process_copy.is_cancelled()
+    assert process_copy.copied_files == 1
+    assert len(process_copy.files) > 1
+
+
+def test_cancel_from_progress(source, tmp_path, monkeypatch):
+    monkeypatch.setenv('VETALA_COPY_WORKERS', '1')
+
+    target_directory = str(tmp_path / 'target')
+    os.makedirs(target_directory)
+
+    process_copy = process.ProcessCopy(source, target_directory)
+    process_copy.plan()
+
+    copy_file = process_copy._copy_file
+
+    def slow_copy(source_file, target_file, size):
+        time.sleep(0.01)
+        return copy_file(source_file, target_file, size)
+
+    process_copy._copy_file = slow_copy
+    process_copy.progress_callback = lambda copied_bytes, total_bytes: process_copy.cancel()
+
+    # the queued jobs are cancelled, not raised
+    assert process_copy.run() is None
+    assert process_copy.copied_files < len(process_copy.files)
@@ -0,0 +1,147 @@
+import os
+
+import pytest
+
+from vtool import util_file
+from vtool.process_manager import process
+
+
+def _find_processes_listdir(directory, return_also_non_process_list=False):
+    """
+    find_processes before the index, one listdir and a stat per entry.
+    """
+    found = []
+    found_non = []
+
+    for folder in os.listdir(directory):
+        if folder.startswith('.'):
+            continue
+
+        if process.is_process(util_file.join_path(directory, folder)):
+            found.append(folder)
+        elif return_also_non_process_list:
+            if process.is_interesting_folder(folder, directory):
+                found_non.append(folder)
+
+    if return_also_non_process_list:
+        return [found, found_non]
+    return found
+
+
+def _make_process(directory):
+    os.makedirs(os.path.join(directory, '.code'))
+    os.makedirs(os.path.join(directory, '.data'))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = str(tmp_path)
+
+    for name in ['body', 'face', 'char.v2']:
+        _make_process(os.path.join(root, name))
+    for name in ['props', 'old.builds', '.backup', '.version']:
+        os.makedirs(os.path.join(root, name))
+
+    for name in ['notes.txt', 'README', '.hidden']:
+        with open(os.path.join(root, name), 'w') as fout:
+            fout.write('text')
+
+    _make_process(os.path.join(root, 'body', 'arm'))
+    os.makedirs(os.path.join(root, 'body', 'props'))
+
+    process.ProcessDirectoryIndex.clear()
+    yield util_file.fix_slashes(root)
+    process.ProcessDirectoryIndex.clear()
+
+
+def test_matches_listdir(tree):
+    for directory in [tree, util_file.join_path(tree, 'body'), util_file.join_path(tree, 'props')]:
+        for also_non in [False, True]:
+            expected = _find_processes_listdir(directory, also_non)
+            result = process.find_processes(directory, also_non)
+
+            if also_non:
+                assert sorted(result[0]) == sorted(expected[0])
+                assert sorted(result[1]) == sorted(expected[1])
+            else:
+                assert sorted(result) == sorted(expected)
+
+
+def test_folders(tree):
+    found, found_non = process.find_processes(tree, True)
+
+    assert sorted(found) == ['body', 'char.v2', 'face']
+    # folders, and files without an extension like the listdir search found
+    assert sorted(found_non) == ['README', 'old.builds', 'props']
+
+
+def test_stop_at_one(tree):
+    assert len(process.find_processes(tree, stop_at_one=True)) == 1
+
+    found, found_non = process.find_processes(util_file.join_path(tree, 'props'), True, stop_at_one=True)
+    assert found == []
+    assert found_non == []
+
+
+class Counter(object):
+
+    def __init__(self, monkeypatch):
+        self.counts = {'stat': 0, 'scandir': 0}
+
+        stat = os.stat
+        scandir = os.scandir
+
+        def count_stat(*args, **kwargs):
+            self.counts['stat'] += 1
+            return stat(*args, **kwargs)
+
+        def count_scandir(*args, **kwargs):
+            self.counts['scandir'] += 1
+            return scandir(*args, **kwargs)
+
+        monkeypatch.setattr(os, 'stat', count_stat)
+        monkeypatch.setattr(os, 'scandir', count_scandir)
+
+    def reset(self):
+        for key in self.counts:
+            self.counts[key] = 0
+
+
+def test_stat_counts(tree, monkeypatch):
+    counter = Counter(monkeypatch)
+
+    process.find_processes(tree, True)
+
+    # the directory mtime and one .code check per folder
+    assert counter.counts == {'scandir': 1, 'stat': 1 + 5}
+
+    counter.reset()
+    for inc in range(10):
+        process.find_processes(tree, True)
+        process.find_processes(tree)
+
+    assert counter.counts == {'scandir': 0, 'stat': 20}
+
+
+def test_changed_directory_is_scanned_again(tree, monkeypatch):
+    assert sorted(process.find_processes(tree)) == ['body', 'char.v2', 'face']
+
+    os.makedirs(os.path.join(tree, 'hands'))
+    # make sure the mtime moves even on coarse file systems
+    os.utime(tree, ns=(os.stat(tree).st_atime_ns, os.stat(tree).st_mtime_ns + 1000000000))
+
+    counter = Counter(monkeypatch)
+    found, found_non = process.find_processes(tree, True)
+
+    assert counter.counts['scandir'] == 1
+    assert 'hands' in found_non
+
+
+def test_new_process_is_found(tree):
+    assert sorted(process.find_processes(tree)) == ['body', 'char.v2', 'face']
+
+    process_inst = process.Process('props')
+    process_inst.set_directory(tree)
+    process_inst.create()
+
+    assert sorted(process.find_processes(tree)) == ['body', 'char.v2', 'face', 'props']
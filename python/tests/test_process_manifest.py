@@ -0,0 +1,72 @@
+import pytest
+
+from vtool import util_file
+from vtool.process_manager import process
+
+
+@pytest.fixture
+def process_inst(tmp_path, monkeypatch):
+    process_inst = process.Process('test_process')
+    process_inst.set_directory(str(tmp_path))
+    process_inst.create()
+
+    process_inst.set_manifest(['rig.py', 'rig/arms.py', 'rig/legs.py', 'skin.py'], [True, True, False, True])
+
+    parses = []
+    load = process.ProcessManifest._load
+
+    def count_load(self, stamp):
+        parses.append(self.filepath)
+        return load(self, stamp)
+
+    monkeypatch.setattr(process.ProcessManifest, '_load', count_load)
+
+    process_inst.parses = parses
+    return process_inst
+
+
+def test_lookups_parse_once(process_inst):
+    for inc in range(100):
+        assert process_inst.get_manifest() == (['rig.py', 'rig/arms.py', 'rig/legs.py', 'skin.py'],
+                                               [True, True, False, True])
+        assert process_inst.get_manifest_dict()['rig/legs.py'] is False
+        assert process_inst.has_script('skin')
+        assert process_inst.is_in_manifest('rig/arms.py')
+        assert process_inst.get_script_state('rig/legs') is False
+        assert process_inst.get_code_children('rig') == ['rig/arms.py', 'rig/legs.py']
+
+    assert len(process_inst.parses) == 1
+
+
+def test_returned_lists_are_copies(process_inst):
+    scripts, states = process_inst.get_manifest()
+    scripts.append('other.py')
+    states[0] = False
+
+    process_inst.get_code_children('rig').append('rig/other.py')
+
+    assert process_inst.get_manifest() == (['rig.py', 'rig/arms.py', 'rig/legs.py', 'skin.py'],
+                                           [True, True, False, True])
+    assert process_inst.get_code_children('rig') == ['rig/arms.py', 'rig/legs.py']
+
+
+def test_file_edited_outside_is_parsed_again(process_inst):
+    process_inst.get_manifest()
+
+    util_file.write_lines(process_inst.get_manifest_file(), ['rig.py True', 'face.py False'])
+
+    assert process_inst.get_manifest() == (['rig.py', 'face.py'], [True, False])
+    assert not process_inst.has_script('skin')
+    assert len(process_inst.parses) == 2
+
+    process_inst.get_manifest()
+    assert len(process_inst.parses) == 2
+
+
+def test_set_manifest_is_seen(process_inst):
+    process_inst.get_manifest()
+
+    process_inst.set_manifest(['skin.py'], [False])
+
+    assert process_inst.get_manifest() == (['skin.py'], [False])
+    assert process_inst.get_code_children('rig') == []
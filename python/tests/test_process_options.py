@@ -0,0 +1,95 @@
+import json
+import os
+
+from vtool.process_manager import process
+
+
+def _get_process(tmp_path):
+    process_inst = process.Process('test_process')
+    process_inst.set_directory(str(tmp_path))
+    process_inst.create()
+
+    with process_inst.batch_options():
+        process_inst.add_option('rig', True, None, 'group')
+        process_inst.add_option('joints', "['joint1', 'joint2']", 'rig')
+        process_inst.add_option('scale', 2.5, 'rig')
+        process_inst.add_option('scale', 4, 'face')
+        process_inst.add_option('side', 'L', 'rig')
+
+    return process_inst
+
+
+def test_values_are_parsed_once(tmp_path):
+    process_inst = _get_process(tmp_path)
+    process_inst.option_parses = 0
+
+    for inc in range(100):
+        assert process_inst.get_option('joints', 'rig') == ['joint1', 'joint2']
+        assert process_inst.get_option('scale', 'rig') == 2.5
+        assert process_inst.get_option('side') == 'L'
+
+    assert process_inst.option_parses == 3
+
+
+def test_returned_values_can_be_edited(tmp_path):
+    process_inst = _get_process(tmp_path)
+
+    process_inst.get_option('joints', 'rig').append('joint3')
+
+    assert process_inst.get_option('joints', 'rig') == ['joint1', 'joint2']
+
+
+def test_set_option_parses_again(tmp_path):
+    process_inst = _get_process(tmp_path)
+
+    assert process_inst.get_option('side', 'rig') == 'L'
+    process_inst.set_option('side', 'R', 'rig')
+    assert process_inst.get_option('side', 'rig') == 'R'
+
+
+def test_file_edits_are_picked_up(tmp_path):
+    process_inst = _get_process(tmp_path)
+
+    assert process_inst.get_option('side', 'rig') == 'L'
+
+    option_file = process_inst.get_option_file()
+    with open(option_file) as open_file:
+        options = json.load(open_file)
+    options = [[key, 'C, M' if key == 'rig.side' else value] for key, value in options]
+    with open(option_file, 'w') as open_file:
+        json.dump(options, open_file)
+    os.utime(option_file, ns=(0, os.stat(option_file).st_mtime_ns + 1000000000))
+
+    assert process_inst.get_option('side', 'rig') == ['C', 'M']
+
+
+def test_result_function_runs_on_every_read(tmp_path):
+    process_inst = _get_process(tmp_path)
+
+    assert process_inst.get_option('scale', 'rig') == 2.5
+
+    calls = []
+
+    def result_function(value, name):
+        calls.append(name)
+        return value * 2
+
+    process_inst.set_option_result_function(result_function)
+
+    for inc in range(3):
+        assert process_inst.get_option('scale', 'rig') == 5.0
+
+    assert process_inst.get_option('side') == 'LL'
+
+    assert calls == ['scale', 'scale', 'scale', 'rig.side']
+
+
+def test_match_and_group(tmp_path):
+    process_inst = _get_process(tmp_path)
+
+    assert process_inst.get_option_match_and_group('scale') == (2.5, 'rig')
+    assert process_inst.get_option_match_and_group('scale', return_first=False) == {'scale': [None, 'face']}
+    assert process_inst.get_option_match_and_group('missing') is None
+
+    assert process_inst.get_option_match('scale') == 2.5
+    assert process_inst.get_option_match('scale', return_first=False) == {'scale': None}
@@ -0,0 +1,122 @@
+import uuid
+
+import pytest
+
+from vtool import util_file
+from vtool.ramen import eval as ramen_eval
+from vtool.ramen.ui_lib import ui_nodes
+
+
+def _get_graph_data(chain_count):
+    """
+    Chains of a String node feeding two Print nodes, 3 nodes per chain.
+    """
+    graph_data = []
+
+    for chain in range(chain_count):
+        string_uuid = str(uuid.uuid4())
+        graph_data.append({'name': 'String', 'uuid': string_uuid, 'type': ui_nodes.ItemType.STRING,
+                           'position': [0, 0],
+                           'widget_value': {'string': {'value': 'text%s' % chain,
+                                                       'data_type': ui_nodes.rigs.AttrType.STRING}}})
+        for inc in range(2):
+            print_uuid = str(uuid.uuid4())
+            graph_data.append({'name': 'Print', 'uuid': print_uuid, 'type': ui_nodes.ItemType.PRINT,
+                               'position': [0, 0], 'widget_value': {}})
+            graph_data.append({'type': 4, 'source': string_uuid, 'source name': 'out_string',
+                               'target': print_uuid, 'target name': 'input'})
+
+    return graph_data
+
+
+@pytest.fixture
+def graph(tmp_path, monkeypatch):
+    ui_nodes._clear_nodes()
+
+    filepath = str(tmp_path / 'graph.json')
+    util_file.set_json(filepath, _get_graph_data(100))
+    ramen_eval.run_json(filepath)
+
+    sorts = []
+    get_node_eval_order = ui_nodes.get_node_eval_order
+
+    def count_sorts(nodes):
+        sorts.append(len(nodes))
+        return get_node_eval_order(nodes)
+
+    monkeypatch.setattr(ui_nodes, 'get_node_eval_order', count_sorts)
+
+    ran = []
+    for node in ui_nodes._get_nodes():
+        run = node._implement_run
+
+        def implement_run(socket=None, node=node, run=run):
+            ran.append(node)
+            return run(socket)
+
+        node._implement_run = implement_run
+
+    yield list(ui_nodes._get_nodes()), sorts, ran
+
+    ui_nodes._clear_nodes()
+
+
+def _get_string_nodes(nodes):
+    return [node for node in nodes if node.item_type == ui_nodes.ItemType.STRING]
+
+
+def test_graph_runs_clean(graph):
+    nodes, sorts, ran = graph
+
+    assert len(nodes) == 300
+    assert not [node for node in nodes if node.dirty]
+
+
+def test_edit_runs_only_downstream(graph):
+    nodes, sorts, ran = graph
+    string_node = _get_string_nodes(nodes)[5]
+
+    string_node._dirty_run('string', 'changed')
+
+    assert len(ran) == 3
+    assert ran[0] is string_node
+    assert set(ran[1:]) == set(string_node.get_output_connected_nodes())
+    assert [node.get_socket('input').value for node in ran[1:]] == ['changed', 'changed']
+
+
+def test_value_edits_reuse_the_order(graph):
+    nodes, sorts, ran = graph
+
+    for inc, string_node in enumerate(_get_string_nodes(nodes)):
+        string_node._dirty_run('string', 'changed%s' % inc)
+
+    assert len(sorts) <= 1
+
+
+def test_structural_edits_sort_again(graph):
+    nodes, sorts, ran = graph
+    string_nodes = _get_string_nodes(nodes)
+
+    string_nodes[0]._dirty_run('string', 'first')
+    sort_count = len(sorts)
+
+    print_node = string_nodes[2].get_output_connected_nodes()[0]
+    ui_nodes.NodeLine().load({'type': 4, 'source': string_nodes[1].uuid, 'source name': 'out_string',
+                              'target': print_node.uuid, 'target name': 'input'})
+
+    string_nodes[1]._dirty_run('string', 'second')
+
+    assert len(sorts) == sort_count + 1
+    assert print_node in ran
+    assert print_node.get_socket('input').value == 'second'
+
+
+def test_run_dirty(graph):
+    nodes, sorts, ran = graph
+    string_node = _get_string_nodes(nodes)[0]
+    print_node = string_node.get_output_connected_nodes()[0]
+
+    print_node.dirty = True
+
+    assert ramen_eval.run_dirty() == [print_node]
+    assert not print_node.dirty
@@ -0,0 +1,112 @@
+import random
+import time
+
+from vtool.ramen.ui_lib import ui_nodes
+
+
+class Node(object):
+
+    def __init__(self, index):
+        self.index = index
+        self.inputs = []
+
+    def __repr__(self):
+        return 'Node%s' % self.index
+
+    def get_input_connected_nodes(self):
+        return list(self.inputs)
+
+
+def _recursive_post_order(end_nodes, filter_nodes):
+    """
+    The recursive post_order from before it was made iterative.
+    """
+    node_set = set(filter_nodes)
+    results = []
+    visited = set()
+
+    def traverse(node):
+        if node is None or node in visited:
+            if node in node_set:
+                results.remove(node)
+            else:
+                return
+        visited.add(node)
+        if node in node_set:
+            results.append(node)
+
+        for parent in node.get_input_connected_nodes():
+            traverse(parent)
+
+    for end_node in end_nodes:
+        traverse(end_node)
+
+    return results
+
+
+def _get_graph(node_count, seed, max_inputs=3):
+    rand = random.Random(seed)
+
+    nodes = [Node(inc) for inc in range(node_count)]
+    for inc, node in enumerate(nodes[:-1]):
+        later = range(inc + 1, node_count)
+        node.inputs = [nodes[index] for index in rand.sample(later, rand.randint(0, min(max_inputs, len(later))))]
+
+    end_nodes = [nodes[0]] + [node for node in nodes[1:] if rand.random() < 0.2]
+
+    return nodes, end_nodes
+
+
+def _check_order(order, filter_nodes):
+    """
+    Every node has to come before all of the filtered nodes upstream of it.
+    """
+    position = {node: inc for inc, node in enumerate(order)}
+    filter_set = set(filter_nodes)
+
+    for node in order:
+        stack = list(node.inputs)
+        seen = set()
+        while stack:
+            parent = stack.pop()
+            if parent in seen:
+                continue
+            seen.add(parent)
+            if parent in filter_set:
+                assert position[parent] > position[node]
+            stack.extend(parent.inputs)
+
+
+def test_matches_recursive_order():
+    for seed in range(500):
+        nodes, end_nodes = _get_graph(random.Random(seed).randint(2, 12), seed)
+
+        assert ui_nodes.post_order(end_nodes, nodes) == _recursive_post_order(end_nodes, nodes)
+
+
+def test_filtered_order_is_valid():
+    for seed in range(500):
+        nodes, end_nodes = _get_graph(12, seed)
+        filter_nodes = [node for node in nodes if random.Random(seed + node.index).random() < 0.7]
+
+        order = ui_nodes.post_order(end_nodes, filter_nodes)
+
+        assert sorted(order, key=lambda node: node.index) == sorted(set(_recursive_post_order(end_nodes, filter_nodes)),
+                                                                   key=lambda node: node.index)
+        _check_order(order, filter_nodes)
+
+
+def test_ten_thousand_nodes():
+    nodes, end_nodes = _get_graph(10000, 0)
+
+    # a chain through every node makes the graph as deep as it is wide
+    for node, next_node in zip(nodes, nodes[1:]):
+        if next_node not in node.inputs:
+            node.inputs.append(next_node)
+
+    start = time.time()
+    order = ui_nodes.post_order(end_nodes, nodes)
+    seconds = time.time() - start
+
+    assert order == nodes
+    assert seconds < 2.0
@@ -0,0 +1,315 @@
+import random
+import sys
+
+from vtool.ramen.ui_lib import ui_nodes
+
+
+class Node(object):
+    """
+    Stands in for a NodeItem with named sockets.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.in_lines = []
+        self.out_lines = []
+
+    def __repr__(self):
+        return 'Node%s' % self.index
+
+    def get_input_connected_nodes(self, name=None):
+        return [node for socket_name, node in self.in_lines if not name or socket_name == name]
+
+    def get_output_connected_nodes(self, name=None):
+        return [node for socket_name, node in self.out_lines if not name or socket_name == name]
+
+
+# output socket and input socket of each kind of line
+sockets = [('Eval OUT', 'Eval IN'), ('joints', 'joints'), ('transform', 'parent'), ('value', 'value')]
+
+
+def _connect(source, target, socket_pair=('value', 'value')):
+    source.out_lines.append((socket_pair[0], target))
+    target.in_lines.append((socket_pair[1], source))
+
+
+def _recursive_pre_order(start_nodes, filter_nodes):
+    """
+    The recursive pre_order from before it was made iterative.
+    """
+    node_set = set(filter_nodes)
+    results = []
+    visited = set()
+
+    def traverse(node):
+
+        if node is None:
+            return
+
+        children = []
+
+        eval_in = node.get_input_connected_nodes('Eval IN')
+        for in_node in eval_in:
+
+            if not in_node in visited:
+                visited.add(in_node)
+                if in_node in node_set and not in_node in results:
+                    results.append(in_node)
+
+            eval_outputs = in_node.get_output_connected_nodes('Eval OUT')
+            for eval_out in eval_outputs:
+                if not eval_out in visited:
+                    visited.add(eval_out)
+                    if eval_out in node_set and not eval_out in results:
+                        results.append(eval_out)
+
+        joints = node.get_input_connected_nodes('joints')
+        for joint in joints:
+            joint_outputs = joint.get_output_connected_nodes('joints')
+
+            if not joint in visited:
+                visited.add(joint)
+                if joint in node_set and not joint in results:
+                    results.append(joint)
+
+            if joint_outputs:
+
+                for joint_output in joint_outputs:
+
+                    all_ins = joint_output.get_input_connected_nodes()
+
+                    for input_item in all_ins:
+                        if input_item == node:
+                            continue
+                        if not input_item in visited:
+                            visited.add(input_item)
+                        if input_item in node_set and not input_item in results:
+                            results.append(input_item)
+
+                    if not joint_output in visited:
+                        visited.add(joint_output)
+                        if joint_output in node_set and not joint_output in results:
+                            results.append(joint_output)
+
+        parents = node.get_input_connected_nodes('parent')
+        for parent in parents:
+            if not parent in visited:
+                visited.add(parent)
+                if parent in node_set and not parent in results:
+                    results.append(parent)
+
+        all_ins = node.get_input_connected_nodes()
+
+        for input_item in all_ins:
+
+            if not input_item in visited:
+                traverse(input_item)
+
+        if not node in visited:
+            visited.add(node)
+        if node in node_set and not node in results:
+            results.append(node)
+
+        if type(node) == ui_nodes.BundleItem:
+
+            input_node = node.input_node
+            output_node = node.output_node
+
+            sub_children = node.get_children_nodes()
+            sub_children.remove(input_node)
+            sub_children.remove(output_node)
+
+            start_nodes = ui_nodes.get_start_nodes(sub_children)
+
+            for child in start_nodes:
+                traverse(child)
+
+            traverse(input_node)
+
+            traverse(output_node)
+
+        children += node.get_output_connected_nodes()
+
+        if children:
+            for child in children:
+                traverse(child)
+
+    for start_node in start_nodes:
+        if not start_node in visited:
+            traverse(start_node)
+
+    return results
+
+
+def _recursive_pre_order_depth(start_nodes, filter_nodes):
+    """
+    The recursive pre_order_depth from before it was made iterative.
+    """
+    node_set = set(filter_nodes)
+    results = []
+    visited = set()
+
+    depth_dict = {}
+
+    def traverse(node, depth=0):
+        if not depth_dict.get(node, None):
+            depth_dict[node] = depth
+        elif depth_dict[node] < depth:
+            depth_dict[node] = depth
+
+        eval_in = node.get_input_connected_nodes('Eval IN')
+        for in_node in eval_in:
+            if not depth_dict.get(in_node, None):
+                depth_dict[in_node] = depth
+            eval_outputs = in_node.get_output_connected_nodes('Eval OUT')
+            for eval_out in eval_outputs:
+                if not eval_out in visited:
+                    visited.add(eval_out)
+                    if node in node_set:
+                        results.append(eval_out)
+                        depth = depth_dict[in_node]
+                        depth_dict[eval_out] = depth + 1
+
+        # if not util.in_unreal:
+        joints = node.get_input_connected_nodes('joints')
+        for joint in joints:
+            if not depth_dict.get(joint, None):
+                depth_dict[joint] = depth
+            joint_outputs = joint.get_output_connected_nodes('joints')
+            for joint_output in joint_outputs:
+                if not joint_output in visited:
+                    visited.add(joint_output)
+                    if node in node_set:
+                        results.append(joint_output)
+                        depth = depth_dict[joint]
+                        depth_dict[joint_output] = depth + 1
+
+        parents = node.get_input_connected_nodes('parent')
+        for parent in parents:
+            if not depth_dict.get(parent):
+                depth_dict[parent] = depth
+            if not parent in visited:
+                visited.add(parent)
+                if node in node_set:
+                    results.append(parent)
+                    depth = depth_dict[parent]
+                    depth_dict[node] += 1
+
+        if node is None or node in visited:
+            return
+        visited.add(node)
+        if node in node_set:
+            results.append(node)
+
+        children = node.get_output_connected_nodes()
+
+        depth += 1
+
+        if children:
+            for child in children:
+                traverse(child, depth)
+
+    for start_node in start_nodes:
+        traverse(start_node)
+
+    results = ui_nodes.get_nodes_at_depth(results, depth_dict)
+    return results, depth_dict
+
+
+def _get_graph(node_count, seed, max_outputs=3):
+    rand = random.Random(seed)
+
+    nodes = [Node(inc) for inc in range(node_count)]
+    for inc, node in enumerate(nodes[:-1]):
+        later = range(inc + 1, node_count)
+        for index in rand.sample(later, rand.randint(0, min(max_outputs, len(later)))):
+            _connect(node, nodes[index], rand.choice(sockets))
+
+    start_nodes = [node for node in nodes if not node.in_lines]
+
+    return nodes, start_nodes
+
+
+def _get_diamond():
+    """
+    top feeds left and right, which both feed bottom, which feeds end.
+    """
+    top, left, right, bottom, end = nodes = [Node(inc) for inc in range(5)]
+
+    _connect(top, left)
+    _connect(top, right)
+    _connect(left, bottom)
+    _connect(right, bottom)
+    _connect(bottom, end)
+
+    return nodes, [top]
+
+
+def _get_branching():
+    nodes = [Node(inc) for inc in range(7)]
+
+    _connect(nodes[0], nodes[1])
+    _connect(nodes[0], nodes[2], ('joints', 'joints'))
+    _connect(nodes[1], nodes[3], ('transform', 'parent'))
+    _connect(nodes[1], nodes[4])
+    _connect(nodes[2], nodes[5], ('Eval OUT', 'Eval IN'))
+    _connect(nodes[2], nodes[6])
+
+    return nodes, [nodes[0]]
+
+
+def _check(nodes, start_nodes, filter_nodes):
+    assert ui_nodes.pre_order(start_nodes, filter_nodes) == _recursive_pre_order(start_nodes, filter_nodes)
+
+    results, depth_dict = ui_nodes.pre_order_depth(start_nodes, filter_nodes)
+    old_results, old_depth_dict = _recursive_pre_order_depth(start_nodes, filter_nodes)
+
+    assert results == old_results
+    assert depth_dict == old_depth_dict
+
+
+def test_diamond():
+    nodes, start_nodes = _get_diamond()
+
+    assert ui_nodes.pre_order(start_nodes, nodes) == nodes
+    _check(nodes, start_nodes, nodes)
+    _check(nodes, start_nodes, nodes[1:4])
+
+    # a second diamond under the first one
+    extra = [Node(inc) for inc in range(5, 8)]
+    _connect(nodes[4], extra[0])
+    _connect(nodes[4], extra[1])
+    _connect(extra[0], extra[2])
+    _connect(extra[1], extra[2])
+    _connect(nodes[0], extra[2])
+
+    _check(nodes + extra, start_nodes, nodes + extra)
+
+
+def test_branching():
+    nodes, start_nodes = _get_branching()
+
+    _check(nodes, start_nodes, nodes)
+    _check(nodes, start_nodes, nodes[::2])
+
+
+def test_matches_recursive_order():
+    for seed in range(300):
+        nodes, start_nodes = _get_graph(random.Random(seed).randint(2, 10), seed)
+        filter_nodes = [node for node in nodes if random.Random(seed + node.index).random() < 0.7]
+
+        _check(nodes, start_nodes, nodes)
+        _check(nodes, start_nodes, filter_nodes)
+
+
+def test_deep_chain():
+    nodes = [Node(inc) for inc in range(5000)]
+    for node, next_node in zip(nodes, nodes[1:]):
+        _connect(node, next_node)
+
+    assert len(nodes) > sys.getrecursionlimit()
+
+    assert ui_nodes.pre_order([nodes[0]], nodes) == nodes
+
+    results, depth_dict = ui_nodes.pre_order_depth([nodes[0]], nodes)
+    assert sorted(results, key=lambda node: node.index) == nodes
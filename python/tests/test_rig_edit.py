@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+from vtool.ramen import rigs
+from vtool.ramen import rigs_crossplatform
+from vtool.ramen import eval as ramen_eval
+from vtool.ramen.ui_lib import ui_nodes
+
+
+class FakeUtil(rigs.PlatformUtilRig):
+    builds = 0
+
+    def build(self):
+        FakeUtil.builds += 1
+
+    def is_valid(self):
+        return True
+
+
+class FakeRig(rigs.RigJoint):
+
+    def _maya_rig(self):
+        return FakeUtil()
+
+
+@pytest.fixture
+def maya_rigs(monkeypatch):
+    monkeypatch.setattr(rigs, 'in_maya', True)
+    monkeypatch.setattr(rigs.RigEdit, 'rigs', [])
+    monkeypatch.setattr(rigs.RigEdit, 'depth', 0)
+    FakeUtil.builds = 0
+
+
+def _set_attributes(rig):
+    rig.joints = ['a', 'b']
+    rig.color = [[1, 0, 0, 1]]
+    rig.shape = ['square']
+    rig.parent = ['root']
+
+
+def test_setters_rebuild_each_time_outside_edit(maya_rigs):
+    _set_attributes(FakeRig())
+    assert FakeUtil.builds == 4
+
+
+def test_edit_builds_each_rig_once(maya_rigs):
+    rig = FakeRig()
+
+    with rigs.edit():
+        _set_attributes(rig)
+        with rigs.edit():
+            _set_attributes(FakeRig())
+        assert FakeUtil.builds == 0
+
+    assert FakeUtil.builds == 2
+    assert rigs.RigEdit.rigs == []
+
+
+def test_create_inside_edit_drops_pending_rebuild(maya_rigs):
+    rig = FakeRig()
+
+    with rigs.edit():
+        _set_attributes(rig)
+        rig.create()
+
+    assert FakeUtil.builds == 1
+
+
+def test_raise_drops_pending_rebuilds(maya_rigs):
+    with pytest.raises(ValueError):
+        with rigs.edit():
+            _set_attributes(FakeRig())
+            raise ValueError()
+
+    assert FakeUtil.builds == 0
+    assert rigs.RigEdit.rigs == []
+    assert rigs.RigEdit.depth == 0
+
+
+def test_raise_in_nested_edit_keeps_outer_rebuilds(maya_rigs):
+    outer = FakeRig()
+    inner = FakeRig()
+
+    with rigs.edit():
+        _set_attributes(outer)
+        with pytest.raises(ValueError):
+            with rigs.edit():
+                outer.side = ['L']
+                _set_attributes(inner)
+                raise ValueError()
+        assert rigs.RigEdit.rigs == [outer]
+
+    assert FakeUtil.builds == 1
+    assert rigs.RigEdit.rigs == []
+
+
+@pytest.fixture
+def fk_items(maya_rigs, monkeypatch):
+    monkeypatch.setattr(rigs_crossplatform.Fk, '_maya_rig', lambda self: FakeUtil())
+
+
+def _get_item_dict(joints):
+    item_dict = ui_nodes.FkItem().store()
+
+    item_dict['widget_value']['joints'] = {'value': joints, 'data_type': None}
+    item_dict['widget_value']['color'] = {'value': [[0, 1, 0, 1]], 'data_type': None}
+    item_dict['widget_value']['description'] = {'value': ['arm'], 'data_type': None}
+
+    return item_dict
+
+
+def test_load_then_run_builds_once(fk_items):
+    node = ui_nodes.FkItem()
+    node.load(_get_item_dict(['a', 'b']))
+
+    assert FakeUtil.builds == 0
+    assert rigs.RigEdit.rigs == []
+    assert node.rig.attr.get('joints') == ['a', 'b']
+
+    node.run()
+    assert FakeUtil.builds == 1
+
+
+def test_load_batches_setters(fk_items, monkeypatch):
+    node = ui_nodes.FkItem()
+
+    # widgets that set the rig through its setters, one rebuild each outside an edit block
+    def set_widget_socket(name, value, widget):
+        setattr(node.rig, name, value)
+
+    monkeypatch.setattr(node, '_set_widget_socket', set_widget_socket)
+
+    item_dict = _get_item_dict(['a', 'b'])
+    node.load(item_dict)
+
+    assert len(item_dict['widget_value']) > 10
+    assert FakeUtil.builds == 1
+    assert rigs.RigEdit.rigs == []
+
+
+def test_run_json_builds_each_rig_once(fk_items, tmp_path):
+    json_file = str(tmp_path / 'graph.json')
+
+    with open(json_file, 'w') as open_file:
+        json.dump([_get_item_dict(['joint%s' % inc]) for inc in range(3)], open_file)
+
+    ramen_eval.run_json(json_file)
+
+    assert FakeUtil.builds == 3
+    assert rigs.RigEdit.rigs == []
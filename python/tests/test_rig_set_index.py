@@ -0,0 +1,163 @@
+import random
+
+import pytest
+
+from vtool.ramen import rigs_maya
+
+
+class FakeCmds(object):
+    """
+    Stands in for maya.cmds with nodes that may carry a ramen_uuid and multi message members.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.members = {}
+        self.calls = {'ls': 0, 'objExists': 0, 'getAttr': 0, 'get_multi_message': 0}
+
+    def add(self, name, ramen_uuid=None, node_type='objectSet'):
+        self.nodes[name] = {'type': node_type, 'ramen_uuid': ramen_uuid}
+
+    def ls(self, names, objectsOnly=False, recursive=False, type=None):
+        self.calls['ls'] += 1
+
+        if type:
+            return [name for name in names if self.nodes[name]['type'] == type]
+
+        return [name for name in self.nodes if self.nodes[name]['ramen_uuid'] is not None]
+
+    def objExists(self, name):
+        self.calls['objExists'] += 1
+        return name in self.nodes
+
+    def getAttr(self, attribute):
+        self.calls['getAttr'] += 1
+        node, attribute_name = attribute.split('.')
+        return self.nodes[node][attribute_name]
+
+    def get_multi_message(self, node, attribute_name):
+        self.calls['get_multi_message'] += 1
+        return list(self.members.get((node, attribute_name), []))
+
+    def reset_calls(self):
+        for key in self.calls:
+            self.calls[key] = 0
+
+
+@pytest.fixture
+def scene(monkeypatch):
+    scene = FakeCmds()
+
+    monkeypatch.setattr(rigs_maya, 'cmds', scene, raising=False)
+    monkeypatch.setattr(rigs_maya, 'attr', scene, raising=False)
+    rigs_maya.RigSetIndex.clear()
+
+    yield scene
+
+    rigs_maya.RigSetIndex.clear()
+
+
+def _scan(scene, ramen_uuid):
+    """
+    The scene search MayaUtilRig.load ran before the index.
+    """
+    for name, node in scene.nodes.items():
+        if node['type'] == 'objectSet' and node['ramen_uuid'] == ramen_uuid:
+            return name
+
+
+def test_get_set_matches_scene_scan(scene):
+    rand = random.Random(3)
+
+    for inc in range(200):
+        scene.add('set%s' % inc)
+    for inc in range(50):
+        scene.add('rig_set%s' % inc, 'uuid%s' % rand.randint(0, 40))
+    scene.add('transform1', 'uuid1', 'transform')
+
+    for inc in range(45):
+        ramen_uuid = 'uuid%s' % inc
+        assert rigs_maya.RigSetIndex.get_set(ramen_uuid) == _scan(scene, ramen_uuid)
+
+
+def test_repeat_lookup_costs_one_exists(scene):
+    for inc in range(20):
+        scene.add('rig_set%s' % inc, 'uuid%s' % inc)
+
+    assert rigs_maya.RigSetIndex.get_set('uuid5') == 'rig_set5'
+    assert scene.calls['ls'] == 2
+    assert scene.calls['getAttr'] == 20
+
+    scene.reset_calls()
+
+    for inc in range(20):
+        assert rigs_maya.RigSetIndex.get_set('uuid%s' % inc) == 'rig_set%s' % inc
+
+    assert scene.calls == {'ls': 0, 'objExists': 20, 'getAttr': 0, 'get_multi_message': 0}
+
+
+def test_miss_rebuilds_only_when_scene_changed(scene):
+    scene.add('rig_set1', 'uuid1')
+
+    assert rigs_maya.RigSetIndex.get_set('uuid2') is None
+
+    scene.reset_calls()
+    assert rigs_maya.RigSetIndex.get_set('uuid2') is None
+    assert scene.calls['ls'] == 2
+    assert scene.calls['getAttr'] == 0
+
+    scene.add('rig_set2', 'uuid2')
+    assert rigs_maya.RigSetIndex.get_set('uuid2') == 'rig_set2'
+
+
+def test_set_renamed_outside_index(scene):
+    scene.add('rig_set1', 'uuid1')
+    assert rigs_maya.RigSetIndex.get_set('uuid1') == 'rig_set1'
+
+    scene.nodes['rig_renamed'] = scene.nodes.pop('rig_set1')
+    assert rigs_maya.RigSetIndex.get_set('uuid1') == 'rig_renamed'
+
+
+def test_add_and_remove(scene):
+    scene.add('rig_set1', 'uuid1')
+    assert rigs_maya.RigSetIndex.get_set('uuid1') == 'rig_set1'
+
+    scene.add('rig_set2', 'uuid2')
+    rigs_maya.RigSetIndex.add('uuid2', 'rig_set2')
+
+    scene.reset_calls()
+    assert rigs_maya.RigSetIndex.get_set('uuid2') == 'rig_set2'
+    assert scene.calls['ls'] == 0
+
+    del scene.nodes['rig_set2']
+    rigs_maya.RigSetIndex.remove('uuid2')
+    assert rigs_maya.RigSetIndex.get_set('uuid2') is None
+
+
+def test_members_are_cached_until_reset(scene):
+    scene.add('rig_set1', 'uuid1')
+    scene.members[('rig_set1', 'control')] = ['CNTRL_1']
+    rigs_maya.RigSetIndex.get_set('uuid1')
+
+    assert rigs_maya.RigSetIndex.get_members('uuid1', 'rig_set1', 'control') == ['CNTRL_1']
+
+    scene.members[('rig_set1', 'control')] = ['CNTRL_1', 'CNTRL_2']
+    controls = rigs_maya.RigSetIndex.get_members('uuid1', 'rig_set1', 'control')
+    assert controls == ['CNTRL_1']
+    assert scene.calls['get_multi_message'] == 1
+
+    controls.append('changed')
+    assert rigs_maya.RigSetIndex.get_members('uuid1', 'rig_set1', 'control') == ['CNTRL_1']
+
+    rigs_maya.RigSetIndex.reset_members('uuid1')
+    assert rigs_maya.RigSetIndex.get_members('uuid1', 'rig_set1', 'control') == ['CNTRL_1', 'CNTRL_2']
+
+
+def test_members_of_other_set_are_not_cached(scene):
+    scene.add('rig_set1', 'uuid1')
+    scene.members[('other_set', 'joint')] = ['joint1']
+    rigs_maya.RigSetIndex.get_set('uuid1')
+
+    assert rigs_maya.RigSetIndex.get_members('uuid1', 'other_set', 'joint') == ['joint1']
+    assert rigs_maya.RigSetIndex.get_members('uuid1', 'other_set', 'joint') == ['joint1']
+    assert scene.calls['get_multi_message'] == 2
@@ -0,0 +1,186 @@
+import types
+
+import pytest
+
+from vtool import util
+from vtool.ramen import rigs
+from vtool.ramen import rigs_maya
+from vtool.ramen import rigs_crossplatform
+from vtool.ramen.ui_lib import ui_nodes
+
+
+class FakeUtil(rigs.PlatformUtilRig):
+
+    def is_valid(self):
+        return True
+
+    def updates_in_place(self, attribute_name):
+        return attribute_name == 'color'
+
+
+@pytest.fixture
+def maya_util(monkeypatch):
+    scene = set(['rig_set'])
+    monkeypatch.setattr(rigs_maya, 'core', types.SimpleNamespace(exists=lambda name: name in scene), raising=False)
+
+    util = rigs_maya.MayaUtilRig()
+    util.set_rig_class(rigs_crossplatform.Fk())
+    util.set = 'rig_set'
+    util._controls = ['CNTRL_1']
+
+    util.scene = scene
+    return util
+
+
+def test_platform_rig_rebuilds():
+    assert rigs.PlatformUtilRig().updates_in_place('color') is False
+
+    rig = rigs_crossplatform.Fk()
+    rig.rig_util = None
+    assert rig.updates_in_place('color') is False
+
+    rig.rig_util = FakeUtil()
+    assert rig.updates_in_place('color') is True
+    assert rig.updates_in_place('joints') is False
+
+
+def test_maya_rig_cosmetic_attributes(maya_util):
+    for name in ['color', 'sub_color', 'shape']:
+        assert maya_util.updates_in_place(name) is True
+
+    # these affect outputs or have no in place setter
+    for name in ['joints', 'parent', 'side', 'description', 'shape_translate', 'shape_rotate', 'shape_scale']:
+        assert maya_util.updates_in_place(name) is False
+
+
+def test_maya_rig_not_built(maya_util):
+    maya_util._controls = []
+    assert maya_util.updates_in_place('color') is False
+
+    maya_util._controls = ['CNTRL_1']
+    maya_util.scene.discard('rig_set')
+    assert maya_util.updates_in_place('color') is False
+
+
+def test_rig_item_skips_create_for_in_place_edit(monkeypatch):
+    node = ui_nodes.FkItem()
+    node.rig.rig_util = FakeUtil()
+
+    created = []
+    monkeypatch.setattr(node.rig, 'create', lambda: created.append(True))
+
+    node._run('color')
+    assert created == []
+
+    node._run('joints')
+    assert created == [True]
+
+
+class FakeCmds(object):
+    """
+    Counts the Maya nodes rigs create and delete.
+    """
+
+    def __init__(self):
+        self.nodes = set()
+        self.calls = {'createNode': 0, 'delete': 0, 'setAttr': 0}
+
+    def createNode(self, node_type, name=None):
+        self.calls['createNode'] += 1
+        self.nodes.add(name)
+        return name
+
+    def delete(self, names):
+        self.calls['delete'] += 1
+        for name in util.convert_to_sequence(names):
+            self.nodes.discard(name)
+
+    def setAttr(self, *args, **kwargs):
+        self.calls['setAttr'] += 1
+
+    def ls(self, name, uuid=False):
+        return ['uuid_%s' % name]
+
+    def sets(self, *args, **kwargs):
+        return
+
+    def refresh(self):
+        return
+
+    def reset(self):
+        for name in self.calls:
+            self.calls[name] = 0
+
+
+class NodeUtil(rigs_maya.MayaUtilRig):
+    """
+    A Maya rig that makes a set and one control node per joint.
+    """
+
+    def load(self):
+        return
+
+    def build(self):
+        if not self.set:
+            self.set = rigs_maya.cmds.createNode('objectSet', name='rig_set')
+
+        self._controls = [rigs_maya.cmds.createNode('transform', name='CNTRL_%s' % joint)
+                          for joint in self.rig.attr.get('joints')]
+
+    def unbuild(self):
+        if self._controls:
+            rigs_maya.cmds.delete(self._controls)
+        self._controls = []
+
+
+@pytest.fixture
+def fake_cmds(monkeypatch):
+    cmds = FakeCmds()
+
+    monkeypatch.setattr(rigs, 'in_maya', True)
+    monkeypatch.setattr(rigs_maya, 'cmds', cmds, raising=False)
+    monkeypatch.setattr(rigs_maya, 'core', types.SimpleNamespace(exists=lambda name: name in cmds.nodes,
+                                                                 get_shapes=lambda name: ['%sShape' % name]),
+                        raising=False)
+    monkeypatch.setattr(rigs_maya, 'attr', types.SimpleNamespace(set_color_rgb=lambda shapes, *rgb: [
+        cmds.setAttr('%s.overrideColorRGB' % shape, *rgb) for shape in shapes]), raising=False)
+    monkeypatch.setattr(rigs_crossplatform.Fk, '_maya_rig', lambda self: NodeUtil())
+
+    return cmds
+
+
+def _build_fk(joints):
+    node = ui_nodes.FkItem()
+    node.get_socket('joints').value = joints
+    node.rig.attr.set('joints', joints)
+    node.dirty = True
+    node.run()
+
+    return node
+
+
+def test_in_place_edit_keeps_maya_nodes(fake_cmds):
+    node = _build_fk(['a', 'b'])
+
+    assert fake_cmds.calls['createNode'] == 3
+    nodes = set(fake_cmds.nodes)
+
+    fake_cmds.reset()
+    node.get_socket('color').value = [[0, 1, 0, 1]]
+    node.dirty = True
+    node.run('color')
+
+    assert fake_cmds.calls == {'createNode': 0, 'delete': 0, 'setAttr': 2}
+    assert fake_cmds.nodes == nodes
+
+
+def test_structural_edit_rebuilds_maya_nodes(fake_cmds):
+    node = _build_fk(['a', 'b'])
+
+    fake_cmds.reset()
+    node.get_socket('joints').value = ['a', 'b', 'c']
+    node.dirty = True
+    node.run('joints')
+
+    assert fake_cmds.calls == {'createNode': 3, 'delete': 1, 'setAttr': 0}
+    assert fake_cmds.nodes == set(['rig_set', 'CNTRL_a', 'CNTRL_b', 'CNTRL_c'])
@@ -0,0 +1,166 @@
+import os
+import subprocess
+import sys
+import threading
+
+from vtool import util_file
+from vtool.process_manager import process
+
+
+def _count_writes(monkeypatch):
+    writes = []
+    original = util_file.SettingsFile._write_json
+
+    def write_json(self):
+        writes.append(self.filepath)
+        return original(self)
+
+    monkeypatch.setattr(util_file.SettingsFile, '_write_json', write_json)
+    return writes
+
+
+def test_batch_writes_once(tmp_path, monkeypatch):
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'options.json')
+
+    writes = _count_writes(monkeypatch)
+
+    with settings.batch():
+        with settings.batch():
+            for inc in range(20):
+                settings.set('option%s' % inc, inc)
+        assert not writes
+
+    assert len(writes) == 1
+
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'options.json')
+    assert settings.get('option19') == 19
+
+
+def test_process_batch_options_writes_once(tmp_path, monkeypatch):
+    process_inst = process.Process('test_process')
+    process_inst.set_directory(str(tmp_path))
+    process_inst.create()
+    process_inst.add_option('first', 0)
+
+    writes = _count_writes(monkeypatch)
+
+    with process_inst.batch_options():
+        for inc in range(10):
+            process_inst.add_option('option%s' % inc, inc)
+
+    assert len(writes) == 1
+    assert process_inst.get_option('option9') == 9
+
+
+def test_delayed_sets_write_once(tmp_path, monkeypatch):
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'settings.json')
+    settings.set_write_delay(60)
+
+    writes = _count_writes(monkeypatch)
+
+    for inc in range(50):
+        settings.set('option%s' % inc, inc)
+
+    assert not writes
+    assert settings in util_file.SettingsFile.__delayed_writes__
+
+    settings.flush()
+    settings.flush()
+
+    assert len(writes) == 1
+    assert settings not in util_file.SettingsFile.__delayed_writes__
+
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'settings.json')
+    util_file.SettingsFile.__cache_settings__.pop(settings.filepath)
+    settings.reload()
+    assert settings.get('option49') == 49
+
+
+def test_delayed_write_from_timer(tmp_path, monkeypatch):
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'settings.json')
+    settings.set_write_delay(0.05)
+
+    writes = _count_writes(monkeypatch)
+
+    for inc in range(50):
+        settings.set('option%s' % inc, inc)
+
+    timer = settings._write_timer
+    timer.join(5)
+
+    assert len(writes) == 1
+    assert settings._write_timer is None
+    assert not settings._write_pending
+
+
+def test_delayed_sets_from_threads(tmp_path, monkeypatch):
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'settings.json')
+    settings.set_write_delay(0.01)
+
+    writes = _count_writes(monkeypatch)
+
+    def set_options(thread_index):
+        for inc in range(100):
+            settings.set('option%s_%s' % (thread_index, inc), inc)
+
+    threads = [threading.Thread(target=set_options, args=(inc,)) for inc in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    settings.flush()
+
+    assert writes
+    assert len(settings.get_settings()) == 400
+
+    data = util_file.get_json(settings.filepath)
+    assert len(data) == 400
+
+
+def test_flush_all_writes_pending(tmp_path, monkeypatch):
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'settings.json')
+    settings.set_write_delay(60)
+
+    writes = _count_writes(monkeypatch)
+    settings.set('option', 1)
+
+    util_file.SettingsFile.flush_all()
+
+    assert len(writes) == 1
+    assert settings._write_timer is None
+
+
+def test_write_delay_zero_writes_now(tmp_path, monkeypatch):
+    settings = util_file.SettingsFile()
+    settings.set_directory(str(tmp_path), 'settings.json')
+    settings.set_write_delay(60)
+
+    writes = _count_writes(monkeypatch)
+    settings.set('option', 1)
+    settings.set_write_delay(0)
+
+    assert len(writes) == 1
+
+    settings.set('option', 2)
+    assert len(writes) == 2
+
+
+def test_pending_write_at_exit(tmp_path):
+    script = '\n'.join(['from vtool import util_file',
+                        'settings = util_file.SettingsFile()',
+                        'settings.set_directory(%r)' % str(tmp_path),
+                        'settings.set_write_delay(60)',
+                        'settings.set("option", 5)'])
+
+    python_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.check_call([sys.executable, '-c', script], cwd=python_path)
+
+    assert util_file.get_json(str(tmp_path / 'settings.json')) == [['option', 5]]
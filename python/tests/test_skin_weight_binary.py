@@ -0,0 +1,141 @@
+import os
+import random
+import struct
+
+from vtool import data
+
+
+def _get_influence_dict(influence_count=6, vertex_count=200, seed=1):
+    rand = random.Random(seed)
+
+    influence_dict = {}
+    for inc in range(influence_count):
+        weights = [rand.random() if rand.random() < 0.3 else 0.0 for _ in range(vertex_count)]
+        influence_dict['joint%s' % (inc + 1)] = {'position': [inc, rand.random(), -inc], 'weights': weights}
+
+    return influence_dict
+
+
+def _read(filepath, vertex_ids=None):
+    binary_file = data.SkinWeightBinaryFile(filepath)
+    try:
+        assert binary_file.open()
+        return binary_file.get_influence_dict(vertex_ids)
+    finally:
+        binary_file.close()
+
+
+def test_round_trip(tmp_path):
+    filepath = str(tmp_path / data.SKIN_WEIGHTS_BINARY_FILE)
+    influence_dict = _get_influence_dict()
+
+    data.SkinWeightBinaryFile(filepath).write(influence_dict)
+    result = _read(filepath)
+
+    assert sorted(result) == sorted(influence_dict)
+    for influence in influence_dict:
+        assert result[influence]['position'] == influence_dict[influence]['position']
+        assert list(result[influence]['weights']) == influence_dict[influence]['weights']
+
+
+def test_round_trip_keeps_exact_values(tmp_path):
+    filepath = str(tmp_path / data.SKIN_WEIGHTS_BINARY_FILE)
+    weights = [0.1, 1.0 / 3.0, 0.0, 1e-12, 0.7000000000000001]
+
+    data.SkinWeightBinaryFile(filepath).write({'joint1': {'position': [0, 0, 0], 'weights': weights}})
+    result = _read(filepath)['joint1']['weights']
+
+    assert struct.pack('<5d', *result) == struct.pack('<5d', *weights)
+
+
+def test_partial_read(tmp_path):
+    filepath = str(tmp_path / data.SKIN_WEIGHTS_BINARY_FILE)
+    influence_dict = _get_influence_dict()
+    vertex_ids = [150, 3, 0, 199, 42]
+
+    data.SkinWeightBinaryFile(filepath).write(influence_dict)
+    result = _read(filepath, vertex_ids)
+
+    for influence in influence_dict:
+        weights = influence_dict[influence]['weights']
+        assert list(result[influence]['weights']) == [weights[vertex_id] for vertex_id in vertex_ids]
+
+
+def test_vertex_weights_skip_zero(tmp_path):
+    filepath = str(tmp_path / data.SKIN_WEIGHTS_BINARY_FILE)
+    influence_dict = {'joint1': {'position': [0, 0, 0], 'weights': [1.0, 0.0, 0.25]},
+                      'joint2': {'position': [1, 0, 0], 'weights': [0.0, 0.0, 0.75]}}
+
+    data.SkinWeightBinaryFile(filepath).write(influence_dict)
+
+    binary_file = data.SkinWeightBinaryFile(filepath)
+    assert binary_file.open()
+    try:
+        assert binary_file.vertex_count == 3
+        assert binary_file.get_vertex_weights(0) == [('joint1', 1.0)]
+        assert binary_file.get_vertex_weights(1) == []
+        assert binary_file.get_vertex_weights(2) == [('joint1', 0.25), ('joint2', 0.75)]
+    finally:
+        binary_file.close()
+
+
+def test_rejects_other_files(tmp_path):
+    text_path = tmp_path / 'joint1.weights'
+    text_path.write_text('[0.5, 0.5]')
+
+    assert not data.SkinWeightBinaryFile(str(text_path)).open()
+    assert not data.SkinWeightBinaryFile(str(tmp_path / 'missing.bin')).open()
+
+
+def test_rejects_newer_version(tmp_path):
+    filepath = str(tmp_path / data.SKIN_WEIGHTS_BINARY_FILE)
+    data.SkinWeightBinaryFile(filepath).write(_get_influence_dict(2, 10))
+
+    with open(filepath, 'r+b') as open_file:
+        open_file.seek(4)
+        open_file.write(struct.pack('<H', data.SkinWeightBinaryFile.version + 1))
+
+    assert not data.SkinWeightBinaryFile(filepath).open()
+
+
+def _write_text_weights(folder, influence_dict):
+    folder.mkdir(parents=True)
+
+    info_lines = []
+    for influence in influence_dict:
+        info_lines.append("{'%s' : {'position' : %s}}" % (influence, influence_dict[influence]['position']))
+        (folder / ('%s.weights' % influence)).write_text(str(influence_dict[influence]['weights']))
+
+    (folder / 'influence.info').write_text('\n'.join(info_lines))
+    (folder / 'settings.info').write_text("['blendWeights', [0.0, 0.0]]")
+
+
+def test_upgrade_keeps_text_files(tmp_path):
+    influence_dict = _get_influence_dict(3, 20)
+    folder = tmp_path / 'skin_weights' / 'body'
+    _write_text_weights(folder, influence_dict)
+
+    assert data.upgrade_skin_weights(str(tmp_path)) == [str(folder)]
+
+    assert sorted(os.listdir(str(folder))) == ['influence.info', 'joint1.weights', 'joint2.weights',
+                                               'joint3.weights', 'settings.info', data.SKIN_WEIGHTS_BINARY_FILE]
+
+    # converted folders are skipped
+    assert data.upgrade_skin_weights(str(tmp_path)) == []
+
+
+def test_upgrade_removes_text_files(tmp_path):
+    influence_dict = _get_influence_dict(3, 20)
+    folder = tmp_path / 'skin_weights' / 'body'
+    _write_text_weights(folder, influence_dict)
+
+    assert data.upgrade_skin_weights(str(tmp_path), remove_text=True) == [str(folder)]
+
+    assert sorted(os.listdir(str(folder))) == ['settings.info', data.SKIN_WEIGHTS_BINARY_FILE]
+
+    result = _read(str(folder / data.SKIN_WEIGHTS_BINARY_FILE))
+    for influence in influence_dict:
+        assert result[influence]['position'] == influence_dict[influence]['position']
+        assert list(result[influence]['weights']) == influence_dict[influence]['weights']
+
+    assert data.upgrade_skin_weights(str(tmp_path), remove_text=True) == []
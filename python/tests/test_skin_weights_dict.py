@@ -0,0 +1,182 @@
+import random
+import types
+
+import pytest
+
+from vtool.maya_lib import api
+
+
+class FakeSkin(object):
+    """
+    Stands in for MFnSkinCluster on a mesh. entries is a dict per vertex of influence index to weight.
+    """
+
+    def __init__(self, vert_count, influence_ids, entries, mesh=True):
+        self.vert_count = vert_count
+        self.influence_ids = influence_ids
+        self.entries = entries
+        self.mesh = mesh
+        self.plug_calls = 0
+
+    def numOutputConnections(self):
+        return 1
+
+    def outputShapeAtIndex(self, index):
+        return FakeObject(self)
+
+    def influenceObjects(self):
+        return list(self.influence_ids)
+
+    def indexForInfluenceObject(self, path):
+        return path
+
+    def getWeights(self, dag_path, components):
+        values = []
+        for vertex_id in components:
+            for influence_id in self.influence_ids:
+                values.append(self.entries.get(vertex_id, {}).get(influence_id, 0.0))
+
+        return values, len(self.influence_ids)
+
+    def findPlug(self, name, want_networked):
+        return FakePlug(self, name)
+
+
+class FakeObject(object):
+
+    def __init__(self, skin):
+        self.skin = skin
+
+    def hasFn(self, fn_type):
+        return self.skin.mesh
+
+
+class FakePlug(object):
+    """
+    The weightList and weights plugs, with the vertex and influence they are set to.
+    """
+
+    def __init__(self, skin, name, vertex_id=None, influence_id=None):
+        self.skin = skin
+        self.name = name
+        self.vertex_id = vertex_id
+        self.influence_id = influence_id
+
+    def attribute(self):
+        return self.name
+
+    def numElements(self):
+        return self.skin.vert_count
+
+    def selectAncestorLogicalIndex(self, index, attribute):
+        self.skin.plug_calls += 1
+        if attribute == 'weightList':
+            self.vertex_id = index
+        else:
+            self.influence_id = index
+
+    def getExistingArrayAttributeIndices(self):
+        self.skin.plug_calls += 1
+        return sorted(self.skin.entries.get(self.vertex_id, {}))
+
+    def asDouble(self):
+        self.skin.plug_calls += 1
+        return self.skin.entries[self.vertex_id][self.influence_id]
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    skins = {}
+
+    om = types.SimpleNamespace(
+        MFn=types.SimpleNamespace(kMesh='kMesh'),
+        MDagPath=types.SimpleNamespace(getAPathTo=lambda mobject: mobject),
+        MFnMesh=lambda dag_path: types.SimpleNamespace(numVertices=dag_path.skin.vert_count),
+        MIntArray=list,
+        MPlug=lambda plug: FakePlug(plug.skin, plug.name, plug.vertex_id, plug.influence_id))
+    om_anim = types.SimpleNamespace(MFnSkinCluster=lambda mobject: mobject)
+
+    monkeypatch.setattr(api, 'om', om, raising=False)
+    monkeypatch.setattr(api, 'omAnim', om_anim, raising=False)
+    monkeypatch.setattr(api, 'get_object', lambda name: skins[name])
+    monkeypatch.setattr(api, 'get_components', lambda indices: list(indices))
+
+    return skins
+
+
+def _random_skin(seed, vert_count=60):
+    rand = random.Random(seed)
+    influence_ids = [0, 1, 3, 4, 7, 8]
+
+    entries = {}
+    for vertex_id in range(vert_count):
+        entry = {}
+        for influence_id in rand.sample(influence_ids[:4], 2):
+            entry[influence_id] = rand.random()
+        entries[vertex_id] = entry
+
+    # 7 has only zero entries, 8 has none
+    entries[vert_count // 2][7] = 0.0
+
+    return FakeSkin(vert_count, influence_ids, entries)
+
+
+def _plug_walk(skin, vert_ids=None):
+    skin.mesh = False
+    try:
+        return api.get_skin_weights_dict('plug_skin', vert_ids)
+    finally:
+        skin.mesh = True
+
+
+@pytest.mark.parametrize('vert_ids', [None, [2, 5, 30, 31], [30], [59, 60, 500]])
+def test_mesh_read_matches_plug_walk(fake_api, vert_ids):
+    for seed in range(5):
+        skin = _random_skin(seed)
+        fake_api['skin'] = skin
+        fake_api['plug_skin'] = skin
+
+        weights = api.get_skin_weights_dict('skin', vert_ids)
+        expected = _plug_walk(skin, vert_ids)
+
+        # the plug walk also returns influences that only have zero entries
+        for influence_id in list(expected):
+            if not any(expected[influence_id]):
+                expected.pop(influence_id)
+
+        assert sorted(weights) == sorted(expected)
+        for influence_id in expected:
+            assert weights[influence_id] == pytest.approx(expected[influence_id])
+
+
+def test_zero_influences_are_dropped(fake_api):
+    skin = _random_skin(0)
+    fake_api['skin'] = skin
+
+    weights = api.get_skin_weights_dict('skin')
+
+    assert sorted(weights) == [0, 1, 3, 4]
+    assert skin.plug_calls == 0
+
+    weights = api.get_skin_weights_dict('skin', [2, 3, 30])
+    assert 7 not in weights
+    assert 8 not in weights
+    assert skin.plug_calls == 0
+
+
+def test_out_of_range_vert_ids(fake_api):
+    skin = _random_skin(0)
+    fake_api['skin'] = skin
+
+    assert api.get_skin_weights_dict('skin', [60, 100]) == {}
+    assert skin.plug_calls == 0
+
+
+def test_mesh_read_does_not_walk_plugs(fake_api):
+    skin = FakeSkin(50, [0, 1], dict((vertex_id, {0: 0.5, 1: 0.5}) for vertex_id in range(50)))
+    fake_api['skin'] = skin
+
+    weights = api.get_skin_weights_dict('skin')
+
+    assert weights == {0: [0.5] * 50, 1: [0.5] * 50}
+    assert skin.plug_calls == 0
@@ -0,0 +1,137 @@
+import os
+
+import pytest
+
+from vtool import util_file
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('VETALA_CODE_CACHE', str(tmp_path / 'cache'))
+
+    return util_file.SourceCache
+
+
+def _write_script(path, value, stamp=None):
+    path.write_text('value = %s\n' % value)
+    if stamp:
+        os.utime(str(path), ns=(stamp, stamp))
+    return str(path)
+
+
+def _run(code):
+    scope = {}
+    exec(code, scope)
+    return scope['value']
+
+
+def test_miss_then_hit(cache, tmp_path):
+    script = _write_script(tmp_path / 'script.py', 1)
+
+    code, compile_time, cached = cache.get_code(script)
+    assert cached is False
+    assert _run(code) == 1
+    assert os.path.isfile(cache.get_cache_path(script))
+
+    code, compile_time, cached = cache.get_code(script)
+    assert cached is True
+    assert compile_time == 0.0
+    assert _run(code) == 1
+
+
+def test_changed_script_is_compiled_again(cache, tmp_path):
+    script = _write_script(tmp_path / 'script.py', 1, stamp=1000000000000000000)
+    cache.get_code(script)
+
+    # same size, new modified time
+    _write_script(tmp_path / 'script.py', 2, stamp=1000000001000000000)
+    code, compile_time, cached = cache.get_code(script)
+    assert cached is False
+    assert _run(code) == 2
+
+    # same modified time, new size
+    _write_script(tmp_path / 'script.py', 30, stamp=1000000001000000000)
+    code, compile_time, cached = cache.get_code(script)
+    assert cached is False
+    assert _run(code) == 30
+
+    assert cache.get_code(script)[2] is True
+
+
+def test_corrupt_entry_is_compiled_again(cache, tmp_path):
+    script = _write_script(tmp_path / 'script.py', 1)
+    cache.get_code(script)
+
+    with open(cache.get_cache_path(script), 'wb') as fout:
+        fout.write(b'junk')
+
+    code, compile_time, cached = cache.get_code(script)
+    assert cached is False
+    assert _run(code) == 1
+
+
+def test_clear(cache, tmp_path):
+    script = _write_script(tmp_path / 'script.py', 1)
+    cache.get_code(script)
+
+    cache.clear()
+
+    assert not os.path.exists(cache.get_directory())
+    assert cache.get_code(script)[2] is False
+
+
+def test_default_directory_is_in_user_settings(tmp_path, monkeypatch):
+    monkeypatch.delenv('VETALA_CODE_CACHE', raising=False)
+    monkeypatch.setenv('VETALA_SETTINGS', str(tmp_path / 'settings'))
+
+    directory = util_file.SourceCache.get_directory()
+
+    assert directory == util_file.join_path(str(tmp_path / 'settings'), 'code_cache')
+    assert not directory.startswith(util_file.fix_slashes(util_file.get_temp_dir()) + '/vetala')
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='ownership checks are posix only')
+def test_directory_is_private(cache, tmp_path):
+    script = _write_script(tmp_path / 'script.py', 1)
+    cache.get_code(script)
+
+    assert os.stat(cache.get_directory()).st_mode & 0o077 == 0
+    assert os.stat(cache.get_cache_path(script)).st_mode & 0o077 == 0
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='ownership checks are posix only')
+def test_symbol_index_keeps_directory_private(cache, tmp_path):
+    util_file.SymbolIndex.entries = None
+    util_file.SymbolIndex.get_puts(_write_script(tmp_path / 'script.py', 1))
+    util_file.SymbolIndex.save()
+    util_file.SymbolIndex.entries = None
+
+    assert cache.is_trusted(cache.get_directory())
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='ownership checks are posix only')
+def test_shared_directory_is_not_trusted(cache, tmp_path):
+    script = _write_script(tmp_path / 'script.py', 1)
+    cache.get_code(script)
+
+    os.chmod(cache.get_directory(), 0o777)
+    try:
+        code, compile_time, cached = cache.get_code(script)
+    finally:
+        os.chmod(cache.get_directory(), 0o700)
+
+    assert cached is False
+    assert _run(code) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, 'getuid'), reason='ownership checks are posix only')
+def test_planted_entry_is_not_loaded(cache, tmp_path, monkeypatch):
+    script = _write_script(tmp_path / 'script.py', 1)
+    cache.get_code(script)
+
+    # an entry owned by another user
+    uid = os.getuid()
+    monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+
+    assert cache.is_trusted(cache.get_cache_path(script)) is False
+    assert cache.get_code(script)[2] is False
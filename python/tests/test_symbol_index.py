@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from vtool import util_file
+
+
+SCRIPT = '''
+def main():
+    put.joints = ['joint1']
+    put.ctrl_size = 2
+
+class Rig(object):
+    scale = 1
+
+    def __init__(self):
+        self.name = 'rig'
+
+    def build(self):
+        pass
+'''
+
+
+@pytest.fixture
+def symbol_index(tmp_path, monkeypatch):
+    monkeypatch.setenv('VETALA_CODE_CACHE', str(tmp_path / 'cache'))
+
+    util_file.SymbolIndex.entries = None
+    util_file.SymbolIndex.file_reads = 0
+
+    yield util_file.SymbolIndex
+
+    util_file.SymbolIndex.entries = None
+
+
+def _write(path, text, stamp=None):
+    path.write_text(text)
+    if stamp:
+        os.utime(str(path), ns=(stamp, stamp))
+    return str(path)
+
+
+def test_puts_are_read_once(tmp_path, symbol_index):
+    script = _write(tmp_path / 'script.py', SCRIPT)
+
+    assert symbol_index.get_puts(script) == ['joints', 'ctrl_size']
+    assert symbol_index.get_puts(script) == ['joints', 'ctrl_size']
+    assert symbol_index.file_reads == 1
+
+
+def test_changed_file_is_read_again(tmp_path, symbol_index):
+    script = _write(tmp_path / 'script.py', SCRIPT, 1000000000)
+    symbol_index.get_puts(script)
+
+    _write(tmp_path / 'script.py', SCRIPT + '\nput.extra = 1\n', 2000000000)
+
+    assert symbol_index.get_puts(script) == ['joints', 'ctrl_size', 'extra']
+    assert symbol_index.file_reads == 2
+
+
+def test_class_members_match_ast(tmp_path, symbol_index):
+    script = _write(tmp_path / 'script.py', SCRIPT)
+
+    expected = util_file.get_ast_class_sub_functions(script, 'Rig')
+    assert expected[0]
+
+    assert symbol_index.get_class_members(script, 'Rig') == tuple(expected)
+    assert symbol_index.get_class_members(script, 'Missing') == (None, None)
+
+
+def test_index_persists_between_sessions(tmp_path, symbol_index):
+    script = _write(tmp_path / 'script.py', SCRIPT)
+
+    symbol_index.get_puts(script)
+    symbol_index.get_class_members(script, 'Rig')
+    symbol_index.save()
+
+    symbol_index.entries = None
+    symbol_index.file_reads = 0
+
+    assert symbol_index.get_puts(script) == ['joints', 'ctrl_size']
+    assert symbol_index.get_class_members(script, 'Rig')[0]
+    assert symbol_index.file_reads == 0
+
+
+def test_missing_file(tmp_path, symbol_index):
+    assert symbol_index.get_puts(str(tmp_path / 'missing.py')) == []
@@ -0,0 +1,57 @@
+import json
+
+from vtool import util
+
+
+def test_records_join_on_end():
+    temp_log = util.TempLog()
+
+    temp_log.record('before start\n')
+    temp_log.start()
+    temp_log.record('first\n')
+    temp_log.record('\tsecond\n', 'warning')
+
+    assert len(temp_log.records) == 2
+    assert temp_log.end() == 'first\n  second\n'
+    assert not temp_log.records
+
+    temp_log.record('after end\n')
+    assert not temp_log.records
+
+
+def test_overflow_drops_oldest(monkeypatch):
+    monkeypatch.setattr(util.TempLog, 'max_records', 10)
+    temp_log = util.TempLog()
+    temp_log.start()
+
+    for inc in range(25):
+        temp_log.record('%s\n' % inc)
+
+    text = temp_log.end()
+
+    assert temp_log.dropped == 15
+    assert text.startswith('\n... 15 earlier records dropped ...')
+    assert text.endswith(''.join('%s\n' % inc for inc in range(15, 25)))
+
+
+def test_jsonl(tmp_path):
+    jsonl_path = str(tmp_path / 'log.jsonl')
+
+    temp_log = util.TempLog()
+    temp_log.start(jsonl_path)
+    temp_log.record('first\n')
+    temp_log.record('problem\n', 'error')
+    temp_log.end()
+
+    with open(jsonl_path) as fin:
+        records = [json.loads(line) for line in fin]
+
+    assert [(record['level'], record['text']) for record in records] == [('info', 'first'), ('error', 'problem')]
+
+
+def test_module_functions():
+    util.start_temp_log()
+    util.record_temp_log('logged\n')
+
+    assert util.end_temp_log() == 'logged\n'
+    assert util.get_last_temp_log() == 'logged\n'
@@ -0,0 +1,155 @@
+import os
+import stat
+
+from vtool import util_file
+
+
+def _make_data(tmp_path, files):
+    """
+    Versions of data/deform.weights go to data/.version and are read through a VersionFile on data.
+    """
+    path = tmp_path / 'data' / 'deform.weights'
+    path.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        (path / name).write_bytes(content)
+
+    return util_file.VersionFile(str(path)), util_file.VersionFile(str(tmp_path / 'data'))
+
+
+def _get_store_blobs(tmp_path):
+    store = str(tmp_path / 'data' / '.version' / '.store')
+    blobs = []
+    for root, folders, files in os.walk(store):
+        blobs += [os.path.join(root, filename) for filename in files if filename != 'index.json']
+    return blobs
+
+
+def _read_version(version_path, name):
+    with open(os.path.join(version_path, name), 'rb') as open_file:
+        return open_file.read()
+
+
+def test_unchanged_versions_are_stored_once(tmp_path):
+    content = os.urandom(65536)
+    version, versions = _make_data(tmp_path, {'weights.txt': content, 'settings.json': b'{}'})
+
+    for inc in range(3):
+        version.save('save %s' % inc)
+
+    blobs = _get_store_blobs(tmp_path)
+
+    assert len(blobs) == 2
+    assert sum(os.path.getsize(blob) for blob in blobs) == len(content) + 2
+
+    assert versions.get_version_numbers() == [1, 2, 3]
+    for number in versions.get_version_numbers():
+        assert _read_version(versions.get_version_path(number), 'weights.txt') == content
+
+
+def test_versions_restore_byte_for_byte(tmp_path):
+    version, versions = _make_data(tmp_path, {'weights.txt': b'first\r\n\x00'})
+
+    first = version.save('first')
+    (tmp_path / 'data' / 'deform.weights' / 'weights.txt').write_bytes(b'second\n')
+    second = version.save('second')
+
+    assert _read_version(first, 'weights.txt') == b'first\r\n\x00'
+    assert _read_version(second, 'weights.txt') == b'second\n'
+    assert len(_get_store_blobs(tmp_path)) == 2
+
+
+def test_delete_version_drops_unused_content(tmp_path):
+    version, versions = _make_data(tmp_path, {'weights.txt': b'first'})
+
+    version.save('first')
+    (tmp_path / 'data' / 'deform.weights' / 'weights.txt').write_bytes(b'second')
+    version.save('second')
+
+    versions.delete_version(1)
+
+    blobs = _get_store_blobs(tmp_path)
+    assert len(blobs) == 1
+    assert open(blobs[0], 'rb').read() == b'second'
+
+
+def test_each_version_keeps_its_save_date(tmp_path, monkeypatch):
+    version, versions = _make_data(tmp_path, {'weights.txt': b'same'})
+
+    dates = iter(['2024-1-1  10:00:00', '2024-1-2  11:00:00', '2024-1-3  12:00:00'])
+    monkeypatch.setattr(util_file, 'get_date_and_time', lambda separators=True: next(dates))
+
+    for inc in range(3):
+        version.save('save %s' % inc)
+
+    data = versions.get_organized_version_data()
+
+    assert [(entry[0], entry[1], entry[4]) for entry in data] == [(1, 'save 0', '2024-1-1  10:00:00'),
+                                                                  (2, 'save 1', '2024-1-2  11:00:00'),
+                                                                  (3, 'save 2', '2024-1-3  12:00:00')]
+
+
+def test_stored_files_are_read_only(tmp_path):
+    version, versions = _make_data(tmp_path, {'weights.txt': b'first'})
+
+    first = version.save('first')
+
+    for filepath in _get_store_blobs(tmp_path) + [os.path.join(first, 'weights.txt')]:
+        assert not os.stat(filepath).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def test_editing_restored_file_keeps_versions(tmp_path):
+    script = tmp_path / 'code' / 'rig.py'
+    script.parent.mkdir()
+    script.write_bytes(b'same')
+
+    version = util_file.VersionFile(str(script))
+    first = version.save('first')
+    second = version.save('second')
+
+    assert os.stat(first).st_ino == os.stat(second).st_ino
+
+    assert version.restore(1) == str(script)
+    assert os.stat(str(script)).st_ino != os.stat(first).st_ino
+
+    script.write_bytes(b'edited')
+
+    assert open(first, 'rb').read() == b'same'
+    assert open(second, 'rb').read() == b'same'
+
+    # restoring over the edit brings the content back
+    version.restore(2)
+    assert script.read_bytes() == b'same'
+
+
+def test_editing_restored_folder_keeps_versions(tmp_path):
+    version, versions = _make_data(tmp_path, {'weights.txt': b'same', 'settings.json': b'{}'})
+
+    version.save('first')
+    version.save('second')
+
+    restored = str(tmp_path / 'restored')
+    assert versions.restore(1, restored) == restored
+
+    with open(os.path.join(restored, 'weights.txt'), 'ab') as open_file:
+        open_file.write(b' edited')
+
+    for number in [1, 2]:
+        assert _read_version(versions.get_version_path(number), 'weights.txt') == b'same'
+
+    assert versions.restore(5, restored) is None
+
+
+def test_default_does_not_write_into_shared_content(tmp_path):
+    script = tmp_path / 'code' / 'rig.py'
+    script.parent.mkdir()
+    script.write_bytes(b'first')
+
+    version = util_file.VersionFile(str(script))
+    first = version.save('first')
+    version.save_default()
+
+    script.write_bytes(b'second')
+    default = version.save_default()
+
+    assert open(default, 'rb').read() == b'second'
+    assert open(first, 'rb').read() == b'first'
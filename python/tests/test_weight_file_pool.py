@@ -0,0 +1,34 @@
+from vtool import data
+from vtool import util_file
+
+
+def _write(path, lines):
+    path.write_text('\n'.join(lines))
+    return str(path)
+
+
+def test_default_mode_is_thread(monkeypatch):
+    monkeypatch.delenv('VETALA_WEIGHT_POOL_MODE', raising=False)
+
+    assert data.WeightFilePool().mode == 'thread'
+
+
+def test_skips_bad_lines(tmp_path):
+    filepath = _write(tmp_path / 'cluster1.weights', ['[0.5, 1.0]', 'not weights', '', '[0, 0.25]'])
+
+    arrays, seconds, skipped = util_file.read_weight_file(filepath)
+
+    assert [list(values) for values in arrays] == [[0.5, 1.0], [0.0, 0.25]]
+    assert skipped == [1]
+
+
+def test_pool_reads_every_file(tmp_path):
+    filepaths = [_write(tmp_path / ('cluster%s.weights' % inc), ['[%s, 1]' % inc, 'bad']) for inc in range(5)]
+
+    pool = data.WeightFilePool(mode='thread', workers=3)
+    results = pool.read(filepaths)
+
+    assert sorted(results) == sorted(filepaths)
+    for inc, filepath in enumerate(filepaths):
+        assert [list(values) for values in results[filepath]] == [[inc, 1.0]]
+        assert pool.skipped[filepath] == [1]
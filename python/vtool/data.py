@@ -4,6 +4,12 @@ import json
 import traceback
 import threading
 import os
+import sys
+import mmap
+import array
+import struct
+import multiprocessing
+import concurrent.futures
 
 from . import util, util_file, usd
 
@@ -22,45 +28,247 @@ from vtool import logger
 
 log = logger.get_logger(__name__)
 
+SKIN_WEIGHTS_BINARY_FILE = 'skin.weights.bin'
+
 
 class DataManager(object):
     """
-    Manages data types
+    Manages data types.
+    Data classes are registered by their type string and only instanced when that type is asked for.
+    Use DataManager.register_type to add data types from outside vtool.
     """
 
-    def __init__(self):
-        self.available_data = [MayaAsciiFileData(),
-                               MayaBinaryFileData(),
-                               MayaShotgunFileData(),
-                               ScriptManifestData(),
-                               ScriptPythonData(),
-                               ControlCvData(),
-                               ControlColorData(),
-                               MayaControlAttributeData(),
-                               MayaControlRotateOrderData(),
-                               SkinWeightData(),
-                               DeformerWeightData(),
-                               BlendshapeWeightData(),
-                               PoseData(),
-                               MayaAttributeData(),
-                               AnimationData(),
-                               ControlAnimationData(),
-                               MayaShadersData(),
-                               PlatformData(),
-                               FbxData(),
-                               UsdData(),
-                               HoudiniFileData(),
-                               HoudiniNodeData(),
-                               UnrealFileData(),
-                               UnrealGraphData()
-                               ]
-
-    def get_available_types(self):
-        types = [data.get_type() for data in self.available_data]
-        return types
-
-    def get_type_instance(self, data_type):
-        return next((data for data in self.available_data if data.is_type_match(data_type)), None)
+    # data type: data class, in registration order
+    data_classes = None
+    instance_count = 0
+
+    @classmethod
+    def _get_data_classes(cls):
+
+        if cls.data_classes is None:
+            cls.data_classes = {}
+
+            for data_class in [MayaAsciiFileData,
+                               MayaBinaryFileData,
+                               MayaShotgunFileData,
+                               ScriptManifestData,
+                               ScriptPythonData,
+                               ControlCvData,
+                               ControlColorData,
+                               MayaControlAttributeData,
+                               MayaControlRotateOrderData,
+                               SkinWeightData,
+                               DeformerWeightData,
+                               BlendshapeWeightData,
+                               PoseData,
+                               MayaAttributeData,
+                               AnimationData,
+                               ControlAnimationData,
+                               MayaShadersData,
+                               PlatformData,
+                               FbxData,
+                               UsdData,
+                               HoudiniFileData,
+                               HoudiniNodeData,
+                               UnrealFileData,
+                               UnrealGraphData]:
+                cls._add_type(data_class)
+
+        return cls.data_classes
+
+    @classmethod
+    def _add_type(cls, data_class, data_type=None):
+
+        if not data_type:
+            data_type = data_class().get_type()
+
+        cls.data_classes[data_type] = data_class
+
+        return data_type
+
+    @classmethod
+    def register_type(cls, data_class, data_type=None):
+        """
+        Args:
+            data_class (class): A Data subclass.
+            data_type (str): e.g. 'maya.skin_weights'. By default this comes from the class's _data_type.
+
+        Returns:
+            str: The data type the class was registered under. A class already registered under it is replaced.
+        """
+        cls._get_data_classes()
+
+        return cls._add_type(data_class, data_type)
+
+    @classmethod
+    def get_available_types(cls):
+        return list(cls._get_data_classes().keys())
+
+    @classmethod
+    def get_type_instance(cls, data_type):
+        """
+        Returns:
+            Data: A new instance of the data class registered for data_type, or None.
+        """
+        data_class = cls._get_data_classes().get(data_type)
+
+        if not data_class:
+            return
+
+        cls.instance_count += 1
+
+        return data_class()
+
+
+class DataFolderIndex(object):
+    """
+    Keeps the folders of a data or code directory with the data type and files of each folder.
+    The directory is walked once and again only when its modification time changes.
+    DataFolder drops the directory when it creates, renames, deletes or retypes a folder in it.
+    """
+    directories = {}
+    version_counts = {}
+    scan_count = 0
+
+    @classmethod
+    def _get_mtime(cls, directory):
+        try:
+            return os.stat(directory).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+
+    @classmethod
+    def _list(cls, directory):
+
+        files = []
+        folders = []
+
+        try:
+            entries = list(os.scandir(directory))
+        except (OSError, TypeError):
+            entries = []
+
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    folders.append(entry.name)
+                else:
+                    files.append(entry.name)
+            except OSError:
+                continue
+
+        return files, folders
+
+    @classmethod
+    def _scan(cls, directory):
+
+        cls.scan_count += 1
+
+        files, folder_names = cls._list(directory)
+
+        folders = {}
+
+        for folder_name in folder_names:
+
+            folder_path = util_file.join_path(directory, folder_name)
+            sub_files, sub_folders = cls._list(folder_path)
+
+            data_type = None
+
+            if 'data.json' in sub_files:
+                settings = util_file.get_json(util_file.join_path(folder_path, 'data.json'))
+
+                try:
+                    data_type = dict(settings).get('data_type')
+                except (TypeError, ValueError):
+                    data_type = None
+
+            folders[folder_name] = {'files': sub_files,
+                                    'folders': sub_folders,
+                                    'data_type': data_type}
+
+        return files, folder_names, folders
+
+    @classmethod
+    def get(cls, directory):
+        """
+        Returns:
+            tuple: (files, folder names, folders) found in the directory.
+                folders is a dictionary of folder name: {'files', 'folders', 'data_type'}. Treat it as read only.
+        """
+
+        mtime = cls._get_mtime(directory)
+
+        if directory in cls.directories:
+            cached_mtime, files, folder_names, folders = cls.directories[directory]
+            if mtime is not None and cached_mtime == mtime:
+                return files, folder_names, folders
+
+        files, folder_names, folders = cls._scan(directory)
+
+        if mtime is not None:
+            cls.directories[directory] = [mtime, files, folder_names, folders]
+
+        return files, folder_names, folders
+
+    @classmethod
+    def get_folders(cls, directory):
+        """
+        Returns:
+            list: The folder names in the directory, in the order the file system lists them.
+        """
+        return list(cls.get(directory)[1])
+
+    @classmethod
+    def get_folder(cls, directory, name):
+        """
+        Returns:
+            dict: {'files', 'folders', 'data_type'} of the folder, or None if the directory has no folder named name.
+        """
+        return cls.get(directory)[2].get(name)
+
+    @classmethod
+    def get_version_count(cls, version_folder):
+        """
+        Returns:
+            int: The number of versions saved in a .version folder. Counted again only when the folder changes.
+        """
+
+        mtime = cls._get_mtime(version_folder)
+
+        if mtime is None:
+            return 0
+
+        if version_folder in cls.version_counts:
+            cached_mtime, count = cls.version_counts[version_folder]
+            if cached_mtime == mtime:
+                return count
+
+        files, folders = cls._list(version_folder)
+
+        count = 0
+
+        for filename in files + folders:
+            if not filename.startswith('version'):
+                continue
+
+            split_name = filename.split('.')
+
+            if len(split_name) == 2 and split_name[1].isdigit():
+                count += 1
+
+        cls.version_counts[version_folder] = [mtime, count]
+
+        return count
+
+    @classmethod
+    def remove(cls, directory):
+        cls.directories.pop(directory, None)
+
+    @classmethod
+    def clear(cls):
+        cls.directories = {}
+        cls.version_counts = {}
 
 
 class DataFolder(object):
@@ -75,6 +283,8 @@ class DataFolder(object):
         self.folder_path = None
 
         self.data_type = None
+        self.settings = None
+        self._settings_stat = None
 
         test_path = util_file.join_path(self.filepath, self.name)
 
@@ -86,8 +296,6 @@ class DataFolder(object):
         else:
             self._create_folder()
 
-        self.settings = None
-
     def _load_folder(self):
 
         self._load_settings()
@@ -111,12 +319,15 @@ class DataFolder(object):
     def _load_settings(self):
         self.settings = util_file.SettingsFile()
         self._set_settings_path(self.folder_path)
+        self._settings_stat = self.settings.get_stat()
 
     def _set_default_settings(self):
 
-        self._load_settings()
+        self.settings = util_file.SettingsFile()
 
-        self.settings.set('name', self.name)
+        with self.settings.batch():
+            self._set_settings_path(self.folder_path)
+            self.settings.set('name', self.name)
 
         data_type = self.settings.get('data_type')
 
@@ -130,6 +341,12 @@ class DataFolder(object):
         self.name = util_file.get_basename(path)
         self._set_default_settings()
 
+        self._remove_from_index()
+
+    def _remove_from_index(self):
+        if self.folder_path:
+            DataFolderIndex.remove(util_file.get_dirname(self.folder_path))
+
     def _set_name(self, name):
         """
 
@@ -147,7 +364,11 @@ class DataFolder(object):
         log.debug('Get data type')
 
         if self.settings:
-            self.settings.reload()
+            # only read data.json again when it changed on disk
+            stat = self.settings.get_stat()
+            if stat != self._settings_stat:
+                self.settings.reload(force=True)
+                self._settings_stat = stat
         if not self.settings:
             log.debug('No settings, loading...')
             self._load_folder()
@@ -163,6 +384,8 @@ class DataFolder(object):
         if data_type:
             self.settings.set('data_type', str(data_type))
 
+        self._remove_from_index()
+
     def get_sub_folder(self, name=None):
         if name:
             folder = name
@@ -193,14 +416,15 @@ class DataFolder(object):
         if not self.settings:
             self._load_folder()
 
-        self.settings.set('sub_folder', name)
+        with self.settings.batch():
+            self.settings.set('sub_folder', name)
 
-        sub_folder = util_file.join_path(self.folder_path, '.sub/%s' % name)
+            sub_folder = util_file.join_path(self.folder_path, '.sub/%s' % name)
 
-        util_file.create_dir(sub_folder)
+            util_file.create_dir(sub_folder)
 
-        if self.data_type:
-            self.settings.set('data_type', str(self.data_type))
+            if self.data_type:
+                self.settings.set('data_type', str(self.data_type))
 
     def set_sub_folder_to_default(self):
 
@@ -234,8 +458,7 @@ class DataFolder(object):
         if not data_type:
             return
 
-        data_manager = DataManager()
-        instance = data_manager.get_type_instance(data_type)
+        instance = DataManager.get_type_instance(data_type)
 
         if instance:
             instance.set_directory(self.folder_path)
@@ -247,6 +470,8 @@ class DataFolder(object):
 
         basename = util_file.get_basename(new_name)
 
+        self._remove_from_index()
+
         top_folder = util_file.rename(self.folder_path, new_name)
 
         orig_path = self.folder_path
@@ -276,6 +501,8 @@ class DataFolder(object):
 
         util_file.delete_dir(name, directory)
 
+        self._remove_from_index()
+
 
 class DataFile(object):
 
@@ -1012,8 +1239,46 @@ class SkinWeightData(MayaCustomData):
         return found
 
     def _get_influences(self, folder_path):
+        """
+        Get the influence dictionary for a mesh folder.
+        The binary weights file is used when it exists, otherwise the text weight files are read.
+
+        Args:
+            folder_path (str): The mesh folder in the skin weights data.
+
+        Returns:
+            dict: dict[influence] = {'position': [x,y,z], 'weights': [weight, ...]}
+        """
 
         util.show('Getting weight data from disk')
+
+        binary_path = util_file.join_path(folder_path, SKIN_WEIGHTS_BINARY_FILE)
+
+        if util_file.is_file(binary_path):
+            influence_dict = self._get_binary_influences(binary_path)
+            if influence_dict:
+                return influence_dict
+
+        influence_dict = self._get_text_influences(folder_path)
+
+        return influence_dict
+
+    def _get_binary_influences(self, filepath):
+
+        binary_file = SkinWeightBinaryFile(filepath)
+
+        try:
+            if not binary_file.open():
+                return
+            return binary_file.get_influence_dict()
+        except:
+            util.error(traceback.format_exc())
+            util.warning('Could not read binary skin weights: %s' % filepath)
+        finally:
+            binary_file.close()
+
+    def _get_text_influences(self, folder_path):
+
         files = []
 
         try:
@@ -1033,7 +1298,6 @@ class SkinWeightData(MayaCustomData):
         for line_dict in map(eval, filter(None, util_file.get_file_lines(info_file))):
             influence_dict.update(line_dict)
 
-        threads = []
         weights_dict = {}
 
         single_file = False
@@ -1063,18 +1327,19 @@ class SkinWeightData(MayaCustomData):
             return
 
         if not weights_dict:
-            for influence in influences:
+            filepaths = [util_file.join_path(folder_path, influence) for influence in influences]
 
-                try:
-                    read_thread = ReadWeightFileThread(influence_dict, folder_path, influence)
-                    threads.append(read_thread)
-                    read_thread.start()
-                except:
-                    util.error(traceback.format_exc())
-                    util.show('Errors with %s weight file.' % influence)
+            results = WeightFilePool().read(filepaths)
+
+            for influence, filepath in zip(influences, filepaths):
+                influence = influence.split('.')[0]
+                influence = influence.replace('-', ':')
+
+                if influence not in influence_dict or filepath not in results:
+                    continue
 
-            for thread in threads:
-                thread.join()
+                arrays = results[filepath]
+                influence_dict[influence]['weights'] = arrays[0] if arrays else None
         else:
             for influence in influence_dict:
                 influence_dict[influence]['weights'] = weights_dict[influence]
@@ -1349,6 +1614,9 @@ class SkinWeightData(MayaCustomData):
         self.settings.set('add at front of deformation statck', bool_value)
         self.add_at_front = bool_value
 
+    def set_binary(self, bool_value):
+        self.settings.set('binary', bool_value)
+
     def import_skin_weights(self, directory, mesh, first=True):  # TODO: This beast needs to be broken apart.
 
         add_at_front = self.settings.get('add at front of deformation statck')
@@ -1651,10 +1919,16 @@ class SkinWeightData(MayaCustomData):
         cmds.undoInfo(state=True)
 
     def export_data(self, comment, selection=None, single_file=False, version_up=True, blend_weights=True,
-                    long_names=False):  # TODO: This needs to be broken apart as well.
+                    long_names=False, binary=False):  # TODO: This needs to be broken apart as well.
 
         if selection is None:
             selection = []
+
+        if binary and single_file:
+            util.warning('Binary weights are already written to one file per mesh.'
+                         ' Please export with either single file or binary, not both.')
+            return
+
         watch = util.StopWatch()
         watch.start('SkinWeightData.export_data', feedback=False)
         watch.feedback = True
@@ -1734,6 +2008,7 @@ class SkinWeightData(MayaCustomData):
                     info_lines = []
                     settings_lines = []
                     weights_dict = {}
+                    position_dict = {}
 
                     for influence in weights:
 
@@ -1745,7 +2020,7 @@ class SkinWeightData(MayaCustomData):
                         if not weight_list:
                             continue
 
-                        if not single_file:
+                        if not single_file and not binary:
                             thread = LoadWeightFileThread()
 
                             influence_line = thread.run(influence, skin, weights[influence], geo_path)
@@ -1759,12 +2034,22 @@ class SkinWeightData(MayaCustomData):
                             weights_dict[influence_name] = sub_weights
 
                             influence_position = cmds.xform(influence_name, q=True, ws=True, t=True)
+                            position_dict[influence_name] = influence_position
                             influence_line = "{'%s' : {'position' : %s}}" % (influence_name, str(influence_position))
 
                         if influence_line:
                             info_lines.append(influence_line)
 
-                    if single_file:
+                    if binary:
+                        binary_dict = {}
+                        for influence_name in weights_dict:
+                            binary_dict[influence_name] = {'position': position_dict[influence_name],
+                                                           'weights': weights_dict[influence_name]}
+
+                        binary_path = util_file.join_path(geo_path, SKIN_WEIGHTS_BINARY_FILE)
+                        SkinWeightBinaryFile(binary_path).write(binary_dict)
+
+                    elif single_file:
                         filepath = util_file.create_file('all.skin.weights', geo_path)
 
                         lines = ['%s=%s' % (key, str(weights_dict[key])) for key in weights_dict]
@@ -1924,36 +2209,356 @@ class LoadWeightFileThread(threading.Thread):
         return "{'%s' : {'position' : %s}}" % (influence_name, str(influence_position))
 
 
-class ReadWeightFileThread(threading.Thread):
+class WeightFilePool(object):
+    """
+    Read weight files with a bounded pool of workers.
+    Thread mode is the default. Process mode parses files in parallel, which only pays off
+    when there are many large files since every worker starts its own interpreter.
+
+    Args:
+        mode (str): 'thread' or 'process'. Defaults to VETALA_WEIGHT_POOL_MODE.
+        workers (int): The number of workers. Defaults to VETALA_WEIGHT_POOL_WORKERS or the cpu count.
+    """
+
+    def __init__(self, mode=None, workers=None):
 
-    def __init__(self, influence_dict, folder_path, influence):
-        super(ReadWeightFileThread, self).__init__()
+        if not mode:
+            mode = util.get_env('VETALA_WEIGHT_POOL_MODE')
+        if not mode:
+            mode = 'thread'
 
-        self.influence_dict = influence_dict
-        self.folder_path = folder_path
-        self.influence = influence
+        if not workers:
+            workers = util.get_env('VETALA_WEIGHT_POOL_WORKERS')
+        if not workers:
+            workers = os.cpu_count()
 
-    def run(self):
+        self.mode = mode
+        self.workers = max(1, int(workers or 1))
+        self.timings = {}
+        self.skipped = {}
 
-        influence_dict = self.influence_dict
-        folder_path = self.folder_path
-        influence = self.influence
+    def _get_executor(self, worker_count):
 
-        file_path = util_file.join_path(folder_path, influence)
+        if self.mode != 'process':
+            return concurrent.futures.ThreadPoolExecutor(max_workers=worker_count)
 
-        influence = influence.split('.')[0]
-        influence = influence.replace('-', ':')
+        context = multiprocessing.get_context('spawn')
 
-        lines = util_file.get_file_lines(file_path)
+        if util.in_maya:
+            mayapy = util_file.get_mayapy()
+            if not mayapy or not util_file.is_file(mayapy):
+                util.warning('Could not find mayapy for process weight reading. Using threads.')
+                return concurrent.futures.ThreadPoolExecutor(max_workers=worker_count)
+            context.set_executable(mayapy)
 
-        if not lines:
-            influence_dict[influence]['weights'] = None
-            return influence_dict
+        return concurrent.futures.ProcessPoolExecutor(max_workers=worker_count, mp_context=context)
 
-        weights = json.loads(lines[0])
+    def _read(self, filepaths, worker_count):
 
-        if influence in influence_dict:
-            influence_dict[influence]['weights'] = weights
+        results = {}
+
+        with self._get_executor(worker_count) as executor:
+
+            futures = {executor.submit(util_file.read_weight_file, filepath): filepath for filepath in filepaths}
+
+            for future in concurrent.futures.as_completed(futures):
+                filepath = futures[future]
+
+                try:
+                    arrays, seconds, skipped = future.result()
+                except concurrent.futures.process.BrokenProcessPool:
+                    raise
+                except:
+                    util.error(traceback.format_exc())
+                    util.show('Errors with %s weight file.' % filepath)
+                    continue
+
+                results[filepath] = arrays
+                self.timings[filepath] = seconds
+                self.skipped[filepath] = skipped
+
+        return results
+
+    def _read_file(self, filepath):
+
+        arrays, self.timings[filepath], self.skipped[filepath] = util_file.read_weight_file(filepath)
+        return arrays
+
+    def _warn_skipped(self):
+
+        for filepath in sorted(self.skipped):
+            for line_number in self.skipped[filepath]:
+                util.warning('Could not read weights on line %s in %s' % (line_number, filepath))
+
+    def read(self, filepaths):
+        """
+        Args:
+            filepaths (list): Paths to weight files.
+
+        Returns:
+            dict: dict[filepath] = [array.array('d'), ...] with one array for each line in the file.
+                Files that could not be read are left out.
+        """
+
+        self.timings = {}
+        self.skipped = {}
+
+        worker_count = min(self.workers, len(filepaths))
+
+        if worker_count < 2:
+            results = {}
+            for filepath in filepaths:
+                try:
+                    results[filepath] = self._read_file(filepath)
+                except:
+                    util.error(traceback.format_exc())
+                    util.show('Errors with %s weight file.' % filepath)
+            self._warn_skipped()
+            return results
+
+        try:
+            results = self._read(filepaths, worker_count)
+        except (concurrent.futures.process.BrokenProcessPool, OSError):
+            if self.mode != 'process':
+                raise
+            util.warning('Process pool failed reading weight files. Using threads.')
+            self.mode = 'thread'
+            results = self._read(filepaths, worker_count)
+
+        self._warn_skipped()
+
+        log.info('Read %s weight files in %s mode with %s workers. %.3f seconds of reading.',
+                 len(results), self.mode, worker_count, sum(self.timings.values()))
+
+        return results
+
+
+class SkinWeightBinaryFile(object):
+    """
+    Versioned binary skin weights for one mesh.
+    Weights are stored sparse and grouped by vertex, so the file can be memory mapped
+    and only the vertices that are needed get read.
+
+    Layout, little endian:
+        header:  magic, version, flags, vertex count, influence count, entry count, info size
+        info:    json with influence names and positions, padded to 8 bytes
+        offsets: uint64 * (vertex count + 1), where each vertex starts in the entries
+        weights: float64 * entry count
+        indices: uint32 * entry count, the influence index of each weight
+
+    Args:
+        filepath (str): The path to the binary weights file.
+    """
+
+    magic = b'VTSW'
+    version = 1
+    _header = struct.Struct('<4sHHIIQI')
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+        self.vertex_count = 0
+        self.influences = []
+        self.positions = []
+
+        self._file = None
+        self._map = None
+        self._views = []
+        self._offsets = None
+        self._weights = None
+        self._indices = None
+
+    def _padding(self, size):
+        return (8 - size % 8) % 8
+
+    def _get_array(self, typecode, start, count):
+
+        item_size = array.array(typecode).itemsize
+        view = memoryview(self._map)[start:start + count * item_size]
+        self._views.append(view)
+
+        if sys.byteorder == 'little':
+            view = view.cast(typecode)
+            self._views.append(view)
+            return view
+
+        values = array.array(typecode, view.tobytes())
+        values.byteswap()
+        return values
+
+    def write(self, influence_dict):
+        """
+        Write the weights to disk.
+
+        Args:
+            influence_dict (dict): dict[influence] = {'position': [x,y,z], 'weights': [weight, ...]}
+                The same format returned by SkinWeightData._get_influences.
+        """
+
+        influences = sorted(influence_dict)
+
+        columns = []
+        vertex_count = 0
+        for influence in influences:
+            weights = influence_dict[influence].get('weights') or []
+            vertex_count = max(vertex_count, len(weights))
+            columns.append(weights)
+
+        counts = [0] * vertex_count
+        vertex_ids = []
+        for weights in columns:
+            ids = [vertex_id for vertex_id, weight in enumerate(weights) if weight]
+            for vertex_id in ids:
+                counts[vertex_id] += 1
+            vertex_ids.append(ids)
+
+        offsets = array.array('Q', [0]) * (vertex_count + 1)
+        for vertex_id in range(vertex_count):
+            offsets[vertex_id + 1] = offsets[vertex_id] + counts[vertex_id]
+
+        entry_count = offsets[-1]
+        weight_array = array.array('d', [0.0]) * entry_count
+        index_array = array.array('I', [0]) * entry_count
+
+        cursor = offsets[:-1]
+        for influence_index, weights in enumerate(columns):
+            for vertex_id in vertex_ids[influence_index]:
+                slot = cursor[vertex_id]
+                weight_array[slot] = float(weights[vertex_id])
+                index_array[slot] = influence_index
+                cursor[vertex_id] = slot + 1
+
+        info = {'influences': [{'name': influence,
+                                'position': influence_dict[influence].get('position')} for influence in influences]}
+        info = json.dumps(info).encode('utf-8')
+        info += b'\0' * self._padding(self._header.size + len(info))
+
+        if sys.byteorder != 'little':
+            for values in (offsets, weight_array, index_array):
+                values.byteswap()
+
+        with open(self.filepath, 'wb') as open_file:
+            open_file.write(self._header.pack(self.magic, self.version, 0, vertex_count, len(influences),
+                                              entry_count, len(info)))
+            open_file.write(info)
+            open_file.write(offsets.tobytes())
+            open_file.write(weight_array.tobytes())
+            open_file.write(index_array.tobytes())
+
+        return self.filepath
+
+    def open(self):
+        """
+        Memory map the file and read the header.
+
+        Returns:
+            bool: True if the file could be opened.
+        """
+        self.close()
+
+        if not util_file.is_file(self.filepath) or not os.path.getsize(self.filepath):
+            return False
+
+        self._file = open(self.filepath, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < self._header.size:
+            self.close()
+            return False
+
+        magic, version, _, vertex_count, influence_count, entry_count, info_size = self._header.unpack_from(self._map)
+
+        if magic != self.magic:
+            util.warning('Not a binary skin weights file: %s' % self.filepath)
+            self.close()
+            return False
+
+        if version > self.version:
+            util.warning('Binary skin weights version %s is newer than supported version %s: %s' % (version,
+                                                                                                 self.version,
+                                                                                                 self.filepath))
+            self.close()
+            return False
+
+        start = self._header.size
+        info = json.loads(self._map[start:start + info_size].rstrip(b'\0').decode('utf-8'))
+        start += info_size
+
+        self.vertex_count = vertex_count
+        self.influences = [influence['name'] for influence in info['influences']]
+        self.positions = [influence['position'] for influence in info['influences']]
+
+        if len(self.influences) != influence_count:
+            util.warning('Binary skin weights influence count does not match: %s' % self.filepath)
+
+        self._offsets = self._get_array('Q', start, vertex_count + 1)
+        start += 8 * (vertex_count + 1)
+        self._weights = self._get_array('d', start, entry_count)
+        start += 8 * entry_count
+        self._indices = self._get_array('I', start, entry_count)
+
+        return True
+
+    def close(self):
+
+        self._offsets = None
+        self._weights = None
+        self._indices = None
+
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+
+        if self._map:
+            self._map.close()
+            self._map = None
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def get_vertex_weights(self, vertex_id):
+        """
+        Returns:
+            list: [(influence, weight), ...] for the non zero weights on the vertex.
+        """
+        start = self._offsets[vertex_id]
+        end = self._offsets[vertex_id + 1]
+
+        return [(self.influences[self._indices[slot]], self._weights[slot]) for slot in range(start, end)]
+
+    def get_influence_dict(self, vertex_ids=None):
+        """
+        Args:
+            vertex_ids (list): Only read these vertices. Weights are returned in the same order.
+
+        Returns:
+            dict: dict[influence] = {'position': [x,y,z], 'weights': [weight, ...]}
+        """
+
+        offsets = self._offsets
+        weights = self._weights
+        indices = self._indices
+
+        if vertex_ids is None:
+            columns = [[0.0] * self.vertex_count for _ in self.influences]
+
+            vertex_id = 0
+            next_offset = offsets[1] if self.vertex_count else 0
+            for slot in range(len(weights)):
+                while slot >= next_offset:
+                    vertex_id += 1
+                    next_offset = offsets[vertex_id + 1]
+                columns[indices[slot]][vertex_id] = weights[slot]
+        else:
+            columns = [[0.0] * len(vertex_ids) for _ in self.influences]
+
+            for inc, vertex_id in enumerate(vertex_ids):
+                for slot in range(offsets[vertex_id], offsets[vertex_id + 1]):
+                    columns[indices[slot]][inc] = weights[slot]
+
+        influence_dict = {}
+        for influence, position, column in zip(self.influences, self.positions, columns):
+            influence_dict[influence] = {'position': position, 'weights': column}
 
         return influence_dict
 
@@ -2033,6 +2638,8 @@ class BlendshapeWeightData(MayaCustomData):
             maya_name = maya_lib.core.folder_name_to_maya_name(folder)
             new_folders.append(maya_name)
 
+        weight_files = []
+
         for folder in filter(lambda x: maya_lib.core.exists(x) and cmds.nodeType(x) == 'blendShape', new_folders):
             blendshape_name = folder
             blendshape_folder = maya_lib.core.maya_name_to_folder_name(blendshape_name)
@@ -2042,13 +2649,7 @@ class BlendshapeWeightData(MayaCustomData):
 
             for filename in filter(lambda x: x.startswith('base'), base_files):
                 filepath = util_file.join_path(blendshape_path, filename)
-                lines = util_file.get_file_lines(filepath)
-
-                weights = eval(lines[0])
-
-                index = util.get_last_number(filename)
-                blend = maya_lib.blendshape.BlendShape(blendshape_name)
-                blend.set_weights(weights, mesh_index=index)
+                weight_files.append([filepath, blendshape_name, None, util.get_last_number(filename)])
 
             targets = util_file.get_folders(blendshape_path)
 
@@ -2058,13 +2659,19 @@ class BlendshapeWeightData(MayaCustomData):
 
                 for filename in filter(lambda x: x.startswith('mesh'), files):
                     filepath = util_file.join_path(target_path, filename)
-                    lines = util_file.get_file_lines(filepath)
+                    weight_files.append([filepath, blendshape_name, target, util.get_last_number(filename)])
+
+        results = WeightFilePool().read([weight_file[0] for weight_file in weight_files])
 
-                    weights = eval(lines[0])
+        for filepath, blendshape_name, target, index in weight_files:
+
+            if not results.get(filepath):
+                continue
 
-                    index = util.get_last_number(filename)
-                    blend = maya_lib.blendshape.BlendShape(blendshape_name)
-                    blend.set_weights(weights, target, mesh_index=index)
+            weights = results[filepath][0].tolist()
+
+            blend = maya_lib.blendshape.BlendShape(blendshape_name)
+            blend.set_weights(weights, target, mesh_index=index)
 
         maya_lib.core.print_help('Imported %s data' % self.name)
 
@@ -2164,11 +2771,13 @@ class DeformerWeightData(MayaCustomData):
         if not files:
             util.warning('Found nothing to import.')
 
+        results = WeightFilePool().read([util_file.join_path(filepath, filename) for filename in files])
+
         for filename in files:
 
             folder_path = util_file.join_path(filepath, filename)
 
-            lines = util_file.get_file_lines(folder_path)
+            weights_list = [weights.tolist() for weights in results.get(folder_path, [])]
 
             deformer = filename.split('.')[0]
 
@@ -2178,22 +2787,11 @@ class DeformerWeightData(MayaCustomData):
                 util.warning('%s does not exist. Could not import weights' % deformer)
                 continue
 
-            if not lines:
+            if not weights_list:
                 continue
 
             geometry_indices = mel.eval('deformer -q -gi %s' % deformer)
 
-            weights_list = []
-
-            if lines:
-                for inc, line in enumerate(filter(None, lines)):
-                    try:
-                        weights = eval(line)
-                    except:
-                        util.warning('Could not read weights on line %s' % inc)
-                        continue
-                    weights_list.append(weights)
-
             for weights_part, index in zip(weights_list, geometry_indices):
 
                 maya_lib.deform.set_deformer_weights(weights_part, deformer, index)
@@ -4178,6 +4776,71 @@ class UsdData(CustomData):
         version.save(comment)
 
 
+def upgrade_skin_weights(directory, remove_text=False):
+    """
+    Convert text skin weights to the binary skin weights format.
+    Directory can be a single skin weights data folder or a whole process tree.
+    Version folders are left as they are.
+
+    Args:
+        directory (str): The folder to search for skin weights.
+        remove_text (bool): Delete the text weight files and influence.info once the binary file is written.
+            The binary file holds the influence names and positions, and influence.info is only read with the text files.
+
+    Returns:
+        list: The mesh folders that were converted.
+    """
+
+    skin_data = SkinWeightData()
+    converted = []
+
+    for root, folders, files in os.walk(directory):
+
+        folders[:] = [folder for folder in folders if not folder.startswith('.version')]
+
+        if 'influence.info' not in files or SKIN_WEIGHTS_BINARY_FILE in files:
+            continue
+
+        root = util_file.fix_slashes(root)
+
+        influence_dict = skin_data._get_text_influences(root)
+
+        if not influence_dict:
+            continue
+
+        if any(influence_dict[influence].get('weights') is None for influence in influence_dict):
+            util.warning('Skipping %s. Some influences are missing weights.' % root)
+            continue
+
+        binary_path = util_file.join_path(root, SKIN_WEIGHTS_BINARY_FILE)
+        SkinWeightBinaryFile(binary_path).write(influence_dict)
+
+        binary_file = SkinWeightBinaryFile(binary_path)
+        try:
+            matches = binary_file.open()
+            if matches:
+                binary_dict = binary_file.get_influence_dict()
+                matches = all(list(binary_dict[influence]['weights']) == list(influence_dict[influence]['weights'])
+                              for influence in influence_dict)
+        finally:
+            binary_file.close()
+
+        if not matches:
+            util.warning('Binary skin weights did not match the text weights in %s' % root)
+            util_file.delete_file(binary_path)
+            continue
+
+        if remove_text:
+            for filename in files:
+                if filename.endswith('.weights') or filename == 'influence.info':
+                    util_file.delete_file(filename, root)
+
+        util.show('Converted skin weights to binary: %s' % root)
+        converted.append(root)
+
+    return converted
+
+
 def read_ldr_file(filepath):
     lines = util_file.get_file_lines(filepath)
 
@@ -1,4 +1,22 @@
 # Copyright (C) 2024 Louis Vottero louis.vot@gmail.com    All rights reserved.
 
-from . import geo
-from . import corrective
+"""
+Submodules load on first use, e.g. maya_lib.geo, so importing the package does not pull in the whole library.
+"""
+
+import sys
+import importlib
+import importlib.util
+
+if sys.version_info < (3, 7):
+    # no module level __getattr__ before python 3.7
+    from . import geo
+    from . import corrective
+
+
+def __getattr__(name):
+
+    if name.startswith('__') or not importlib.util.find_spec('%s.%s' % (__name__, name)):
+        raise AttributeError('module %s has no attribute %s' % (__name__, name))
+
+    return importlib.import_module('.%s' % name, __name__)
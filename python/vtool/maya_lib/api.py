@@ -1319,15 +1319,31 @@ def get_plug(attribute_name):
     return plug
 
 
-def get_mesh_points(name):
+def get_mesh_points(name, world=False):
     mobject = get_object(name)
 
     meshfn = om.MFnMesh(mobject)
-    points = meshfn.getPoints()
+
+    if world:
+        points = meshfn.getPoints(om.MSpace.kWorld)
+    else:
+        points = meshfn.getPoints()
 
     return points
 
 
+def get_mesh_topology(name):
+    """
+    Returns:
+        tuple: (polygon vertex counts, polygon vertex indices) as MIntArrays.
+    """
+    mobject = get_object(name)
+
+    meshfn = om.MFnMesh(mobject)
+
+    return meshfn.getVertices()
+
+
 def get_distance(three_value_list1, three_value_list2):
     vector1 = three_value_list1
     vector2 = three_value_list2
@@ -1366,12 +1382,31 @@ def get_border_edges(mesh):
 
 
 def get_skin_weights_dict(skin_cluster, vert_ids=None):
+    """
+    Get the skin weights as dict[influence_index] = weight values in point order.
+    On meshes all weights are read with one MFnSkinCluster.getWeights call,
+    and influences whose weights are all zero on the vertices read are left out.
+    Other geometry walks the weightList plugs and returns each influence with a weight entry, even a zero one.
+    Callers should treat a missing influence as all zero weights.
+
+    Args:
+        skin_cluster (str): The name of a skin cluster.
+        vert_ids (list): Vertex indices to read. Weights of other vertices are left at 0.
+
+    Returns:
+        dict: dict[influence_index] = list of weights, one per point.
+    """
     if vert_ids is None:
         vert_ids = []
     mobject = get_object(skin_cluster)
 
     mf_skin = omAnim.MFnSkinCluster(mobject)
 
+    weights = _get_skin_mesh_weights(mf_skin, vert_ids)
+
+    if weights is not None:
+        return weights
+
     weight_list_plug = mf_skin.findPlug('weightList', 0)
     weights_plug = mf_skin.findPlug('weights', 0)
     weight_list_attr = weight_list_plug.attribute()
@@ -1411,6 +1446,57 @@ def get_skin_weights_dict(skin_cluster, vert_ids=None):
     return weights
 
 
+def _get_skin_mesh_weights(mf_skin, vert_ids=None):
+    if mf_skin.numOutputConnections() != 1:
+        return
+
+    output_object = mf_skin.outputShapeAtIndex(0)
+
+    if not output_object.hasFn(om.MFn.kMesh):
+        return
+
+    dag_path = om.MDagPath.getAPathTo(output_object)
+    vert_count = om.MFnMesh(dag_path).numVertices
+
+    if vert_ids:
+        vert_ids = [vert_id for vert_id in vert_ids if vert_id < vert_count]
+        if not vert_ids:
+            return {}
+
+        components = get_components(vert_ids)
+    else:
+        components = get_components(list(range(vert_count)))
+
+    influence_paths = mf_skin.influenceObjects()
+    influence_count = len(influence_paths)
+
+    if not influence_count:
+        return {}
+
+    weight_array = mf_skin.getWeights(dag_path, components)[0]
+    all_weights = list(weight_array)
+
+    weights = {}
+
+    for inc in range(influence_count):
+
+        influence_weights = all_weights[inc::influence_count]
+
+        if not any(influence_weights):
+            continue
+
+        if vert_ids:
+            sub_weights = [0] * vert_count
+            for vert_id, value in zip(vert_ids, influence_weights):
+                sub_weights[vert_id] = value
+            influence_weights = sub_weights
+
+        influence_id = int(mf_skin.indexForInfluenceObject(influence_paths[inc]))
+        weights[influence_id] = influence_weights
+
+    return weights
+
+
 def get_identity_matrix():
     return om.MMatrix()
 
@@ -1804,6 +1890,42 @@ def set_skin_blend_weights(skin_cluster, weights, index):
     skin_fn.setBlendWeights(dag_path, component, weight_array)
 
 
+def get_weights(attr_name, count, default=1.0):
+    """
+    Read a multi weight attribute, e.g. a blendshape baseWeights or deformer weightList[0].weights,
+    with one ranged getAttr.
+
+    Args:
+        attr_name (str): The multi attribute.
+        count (int): The number of weights to return, usually the vertex count.
+        default (float): The value of indices that were never set, what getAttr returns for them.
+
+    Returns:
+        list: count weight values in index order.
+    """
+    if not count:
+        return []
+
+    weights = cmds.getAttr('%s[0:%s]' % (attr_name, count - 1))
+
+    if not isinstance(weights, (list, tuple)):
+        weights = [weights]
+
+    if len(weights) == count:
+        return list(weights)
+
+    # the range came back short, so read the indices that exist and fill in the rest
+    plug = get_plug(attr_name)
+
+    weights = [default] * count
+
+    for index in plug.getExistingArrayAttributeIndices():
+        if index < count:
+            weights[index] = plug.elementByLogicalIndex(index).asFloat()
+
+    return weights
+
+
 def set_weights(attr_name, weights):
     plug = get_plug(attr_name)
 
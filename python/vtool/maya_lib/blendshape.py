@@ -101,14 +101,24 @@ class BlendShape(object):
 
         return '%s.weight[%s]' % (self.blendshape, target_index)
 
-    def _get_weights(self, target_name=None, mesh_index=0):
+    def _get_vertex_count(self, mesh_index=0):
 
         if not self.meshes:
             self._store_meshes()
 
         mesh = self.meshes[mesh_index]
 
-        vertex_count = core.get_component_count(mesh)
+        vertex_count = cmds.polyEvaluate(mesh, vertex=True)
+
+        # polyEvaluate returns a message instead of a count on curves and surfaces
+        if not isinstance(vertex_count, int):
+            vertex_count = core.get_component_count(mesh)
+
+        return vertex_count
+
+    def _get_weights(self, target_name=None, mesh_index=0):
+
+        vertex_count = self._get_vertex_count(mesh_index)
 
         attribute = None
         if not target_name:
@@ -116,14 +126,7 @@ class BlendShape(object):
         if target_name:
             attribute = self._get_input_target_group_weights_attribute(target_name, mesh_index)
 
-        weights = []
-
-        for inc in range(0, vertex_count):
-            weight = cmds.getAttr('%s[%s]' % (attribute, inc))
-
-            weights.append(weight)
-
-        return weights
+        return api.get_weights(attribute, vertex_count)
 
     def _get_input_target(self, mesh_index=0):
 
@@ -830,18 +833,11 @@ class BlendShape(object):
         """
 
         weights = util.convert_to_sequence(weights)
-        weight_count = len(weights)
-
-        if weight_count == 1:
-
-            if not self.meshes:
-                self._store_meshes()
 
-            mesh = self.meshes[mesh_index]
+        if len(weights) == 1:
+            weights = weights * self._get_vertex_count(mesh_index)
 
-            vertex_count = core.get_component_count(mesh)
-
-            weights = weights * vertex_count
+        weight_count = len(weights)
 
         attribute = None
 
@@ -854,41 +850,11 @@ class BlendShape(object):
         try:
             api.set_weights(attribute, weights)
         except:
-            for inc in range(weight_count):
-                attribute_name = attribute + '[%s]' % inc
-                cmds.setAttr(attribute_name, weights[inc])
+            cmds.setAttr('%s[0:%s]' % (attribute, weight_count - 1), *weights)
 
     def get_weights(self, target_name=None, mesh_index=0):
 
-        if not self.meshes:
-            self._store_meshes()
-
-        mesh = self.meshes[mesh_index]
-
-        vertex_count = core.get_component_count(mesh)
-
-        weights = None
-        if target_name is None:
-
-            weights = []
-
-            for inc in range(0, vertex_count):
-                attribute = self._get_input_target_base_weights_attribute(mesh_index)
-
-                weight = cmds.getAttr('%s[%s]' % (attribute, inc))
-                weights.append(weight)
-
-        if target_name:
-
-            weights = []
-
-            for inc in range(0, vertex_count):
-                attribute = self._get_input_target_group_weights_attribute(target_name, mesh_index)
-
-                weight = cmds.getAttr('%s[%s]' % (attribute, inc))
-                weights.append(weight)
-
-        return weights
+        return self._get_weights(target_name, mesh_index)
 
     def set_invert_weights(self, target_name=None, mesh_index=0):
         """
@@ -902,12 +868,7 @@ class BlendShape(object):
 
         weights = self._get_weights(target_name, mesh_index)
 
-        new_weights = []
-
-        for weight in weights:
-            new_weight = 1 - weight
-
-            new_weights.append(new_weight)
+        new_weights = [1 - weight for weight in weights]
 
         self.set_weights(new_weights, target_name, mesh_index)
 
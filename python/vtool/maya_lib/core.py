@@ -78,6 +78,21 @@ class FindUniqueName(util.FindUniqueString):
 
     def _get_scope_list(self):
 
+        if NameRegistry.can_check(self.increment_string):
+            if NameRegistry.has_name(self.increment_string):
+                return [self.increment_string]
+
+            # the namespace query only happens for names the registry thinks are free
+            if cmds.namespace(exists=self.increment_string):
+                return [self.increment_string]
+
+            if exists(self.increment_string):
+                # a node the registry missed, remember it from now on
+                NameRegistry.add_name(self.increment_string)
+                return [self.increment_string]
+
+            return []
+
         if cmds.namespace(exists=self.increment_string):
             return [self.increment_string]
 
@@ -110,10 +125,196 @@ class FindUniqueName(util.FindUniqueString):
             return 0
         return number
 
+    def _search(self):
+
+        if not NameRegistry.can_check(self.test_string):
+            return super(FindUniqueName, self)._search()
+
+        hint_key = (self.test_string, self.work_on_last_number, self.padding)
+        hint = NameRegistry.get_hint(hint_key)
+
+        if not hint:
+            return self._search_from(self._get_number(), self.test_string, hint_key)
+
+        number, increment_string = hint
+
+        return self._search_from(number, increment_string, hint_key)
+
+    def _search_from(self, number, increment_string, hint_key):
+        """
+        Same walk as FindUniqueString._search, but it can start part way through the sequence.
+        Where it stopped is stored as a hint, since names only get freed when the registry sees a node removed or renamed.
+        """
+        self.increment_string = increment_string
+
+        while self._get_scope_list():
+
+            if not number:
+                number = 0
+
+            self._format_string(number)
+
+            number += 1
+
+        NameRegistry.set_hint(hint_key, (number, self.increment_string))
+
+        return self.increment_string
+
     def get_last_number(self, bool_value):
         self.work_on_last_number = bool_value
 
 
+class NameRegistry(object):
+    """
+    Count of the node names in the Maya scene.
+    It is seeded once from the scene and kept current with node added, removed and renamed callbacks,
+    so FindUniqueName can test names without querying the scene for every candidate.
+    Set VETALA_NAME_REGISTRY to 0 to turn it off.
+    """
+
+    names = None
+    hints = {}
+    callbacks = []
+    enabled = os.environ.get('VETALA_NAME_REGISTRY', '1') != '0'
+
+    _stem_table = str.maketrans('', '', '0123456789_')
+
+    @classmethod
+    def start(cls, names=None):
+        """
+        Args:
+            names (list): Seed names. By default the names come from the current scene and callbacks are added.
+        """
+        cls.stop()
+
+        cls.names = {}
+        cls.hints = {}
+
+        if names is None:
+            names = [name.split('|')[-1] for name in cmds.ls()]
+            cls._add_callbacks()
+
+        for name in names:
+            cls.add_name(name)
+
+    @classmethod
+    def stop(cls):
+        for callback in cls.callbacks:
+            try:
+                OpenMaya.MMessage.removeCallback(callback)
+            except:
+                pass
+
+        cls.callbacks = []
+        cls.names = None
+        cls.hints = {}
+
+    @classmethod
+    def get_stem(cls, name):
+        """
+        Every name in an increment sequence shares the same stem, the name without digits and underscores.
+        """
+        return name.translate(cls._stem_table)
+
+    @classmethod
+    def get_hint(cls, hint_key):
+        stem_hints = cls.hints.get(cls.get_stem(hint_key[0]))
+
+        if stem_hints:
+            return stem_hints.get(hint_key)
+
+    @classmethod
+    def set_hint(cls, hint_key, hint):
+        stem = cls.get_stem(hint_key[0])
+
+        if stem not in cls.hints:
+            cls.hints[stem] = {}
+
+        cls.hints[stem][hint_key] = hint
+
+    @classmethod
+    def is_active(cls):
+        if cls.names is not None:
+            return True
+
+        if not cls.enabled or not in_maya:
+            return False
+
+        cls.start()
+        return True
+
+    @classmethod
+    def can_check(cls, name):
+        """
+        The registry only knows leaf names. Paths and patterns are left to the scene.
+        """
+        if not name or '|' in name or '*' in name or '?' in name or '[' in name:
+            return False
+
+        return cls.is_active()
+
+    @classmethod
+    def has_name(cls, name):
+        return cls.names.get(name, 0) > 0
+
+    @classmethod
+    def add_name(cls, name):
+        cls.names[name] = cls.names.get(name, 0) + 1
+
+    @classmethod
+    def remove_name(cls, name):
+        count = cls.names.get(name, 0) - 1
+
+        if count > 0:
+            cls.names[name] = count
+        else:
+            cls.names.pop(name, None)
+
+        # a freed name can be lower in a sequence than where its hint starts
+        cls.hints.pop(cls.get_stem(name), None)
+
+    @classmethod
+    def rename(cls, old_name, new_name):
+        if old_name and old_name in cls.names:
+            cls.remove_name(old_name)
+
+        if new_name:
+            cls.add_name(new_name)
+
+    @classmethod
+    def _add_callbacks(cls):
+
+        def node_added(mobject, client_data):
+            if cls.names is not None:
+                cls.add_name(OpenMaya.MFnDependencyNode(mobject).name())
+
+        def node_removed(mobject, client_data):
+            if cls.names is not None:
+                cls.remove_name(OpenMaya.MFnDependencyNode(mobject).name())
+
+        def name_changed(mobject, old_name, client_data):
+            if cls.names is not None:
+                cls.rename(old_name, OpenMaya.MFnDependencyNode(mobject).name())
+
+        def scene_changed(client_data):
+            # reseeds on next use, callbacks get replaced then
+            cls.names = None
+            cls.hints = {}
+
+        try:
+            cls.callbacks.append(OpenMaya.MDGMessage.addNodeAddedCallback(node_added, 'dependNode'))
+            cls.callbacks.append(OpenMaya.MDGMessage.addNodeRemovedCallback(node_removed, 'dependNode'))
+            cls.callbacks.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject(), name_changed))
+
+            for message in (OpenMaya.MSceneMessage.kBeforeNew, OpenMaya.MSceneMessage.kBeforeOpen):
+                cls.callbacks.append(OpenMaya.MSceneMessage.addCallback(message, scene_changed))
+        except:
+            util.warning('Could not add name registry callbacks. Unique names will be found by querying the scene.')
+            util.warning(traceback.format_exc())
+            cls.enabled = False
+            cls.stop()
+
+
 class TrackNodes(object):
     """
     This helps track new nodes that get added to a scene after a function runs.
@@ -642,7 +843,10 @@ def inc_name(name, inc_last_number=True):
         str: Modified name, number added if not unique.
     """
 
-    if not exists(name) and not cmds.namespace(exists=name):
+    if NameRegistry.can_check(name):
+        if not NameRegistry.has_name(name) and not cmds.namespace(exists=name) and not exists(name):
+            return name
+    elif not exists(name) and not cmds.namespace(exists=name):
         return name
 
     unique = FindUniqueName(name)
@@ -1397,13 +1601,13 @@ def print_help(string_value):
 def print_warning(string_value):
     string_value = string_value.replace('\n', '\nV:\t\t')
     OpenMaya.MGlobal.displayWarning('V:\t\t' + string_value)
-    util.record_temp_log('\nWarning!:  %s' % string_value)
+    util.record_temp_log('\nWarning!:  %s' % string_value, 'warning')
 
 
 def print_error(string_value):
     string_value = string_value.replace('\n', '\nV:\t\t')
     OpenMaya.MGlobal.displayError('V:\t\t' + string_value)
-    util.record_temp_log('\nError!:  %s' % string_value)
+    util.record_temp_log('\nError!:  %s' % string_value, 'error')
 
 # --- Sets
 
@@ -229,6 +229,7 @@ class XformTransferAccurate(object):
 
     def __init__(self):
         self._all_source_verts = []
+        self._source_index = None
 
         self._find_radius_grow = 1.25
         self._find_min_count = 20
@@ -381,7 +382,10 @@ class XformTransferAccurate(object):
             radius = space.get_influence_radius(bone)
             radius *= .66
 
-        verts = space.get_vertices_within_radius(position, radius, self._all_source_verts)
+        if not self._source_index:
+            self._source_index = space.VertexIndex(self._all_source_verts)
+
+        verts = space.get_vertices_within_radius(position, radius, self._source_index)
         grow_radius = radius * self._find_radius_grow
 
         vert_count = len(self._all_source_verts)
@@ -393,7 +397,7 @@ class XformTransferAccurate(object):
 
         inc = 0
         while len(verts) < test_count:
-            verts = space.get_vertices_within_radius(position, grow_radius, self._all_source_verts)
+            verts = space.get_vertices_within_radius(position, grow_radius, self._source_index)
             grow_radius *= self._find_radius_grow
             if inc > self._find_max_iterations:
                 verts = self._all_source_verts
@@ -424,13 +428,24 @@ class XformTransferAccurate(object):
         return vertices
 
     def get_mirrored_components(self, components):
-        mel.eval('reflectionSetMode objectx;')
-        cmds.select(components, r=True, sym=True)
-        cmds.select(components, deselect=True)
 
-        selection = cmds.ls(sl=True)
+        mirror_map = geo.get_mirror_map(self.source_mesh, 'X')[0]
+
+        indices = geo.get_vertex_indices(components)
+        index_set = set(indices)
+
+        mirrored = []
+
+        for index in indices:
+            mirror_index = mirror_map[index]
 
-        return selection
+            if mirror_index in index_set:
+                continue
+
+            index_set.add(mirror_index)
+            mirrored.append(mirror_index)
+
+        return geo.get_vertex_names_from_indices(self.source_mesh, mirrored)
 
     def select_bone_components(self, bone):
 
@@ -499,6 +514,7 @@ class XformTransferAccurate(object):
         """
         self.source_mesh = name
         self._all_source_verts = geo.get_vertices(self.source_mesh)
+        self._source_index = None
 
     def set_target_mesh(self, name):
         """
@@ -4728,6 +4744,7 @@ def get_skin_weights(skin_deformer, vert_ids=None):
     Get the skin weights for the skin cluster.
     Return a dictionary where the key is the influence,
     and the value is a list of weights at the influence.
+    On meshes influences with no weight on the vertices read are not in the dictionary.
 
     Args:
         skin_deformer (str): The name of a skin deformer.
@@ -5724,14 +5741,13 @@ def get_deformer_weights(deformer, index=0):
 
     mesh = get_mesh_at_deformer_index(deformer, index)
 
-    indices = cmds.ls('%s.vtx[*]' % mesh, flatten=True)
+    vertex_count = cmds.polyEvaluate(mesh, vertex=True)
 
-    weights = []
+    # polyEvaluate returns a message instead of a count when mesh is not a mesh
+    if not isinstance(vertex_count, int):
+        return []
 
-    for inc in range(0, len(indices)):
-        weights.append(cmds.getAttr('%s.weightList[%s].weights[%s]' % (deformer, index, inc)))
-
-    return weights
+    return api.get_weights('%s.weightList[%s].weights' % (deformer, index), vertex_count)
 
 
 def remove_deformer_influences(deformer, index=0):
@@ -7309,35 +7325,23 @@ def get_closest_verts_to_joints(joints, verts):
         dict: dict[joint] = vertex list
     """
 
-    distance_dict = {}
-
-    for joint in joints:
-
-        joint_pos = cmds.xform(joint, q=True, ws=True, t=True)
-
-        for vert in verts:
-
-            if vert not in distance_dict:
-                distance_dict[vert] = [10000000000000000000, None]
-
-            pos = cmds.xform(vert, q=True, ws=True, t=True)
-
-            distance = util_math.get_distance(joint_pos, pos)
+    joint_positions = [cmds.xform(joint, q=True, ws=True, t=True) for joint in joints]
+    joint_tree = util_math.PointTree(joint_positions)
 
-            if distance < distance_dict[vert][0]:
-                distance_dict[vert][0] = distance
-                distance_dict[vert][1] = joint
+    verts, positions = space.get_vertex_positions(verts)
 
     joint_map = {}
 
-    for key in distance_dict:
+    for vert, closest in zip(verts, joint_tree.get_closest_many(positions)):
 
-        joint = distance_dict[key][1]
+        joint = None
+        if closest:
+            joint = joints[closest[0]]
 
         if joint not in joint_map:
             joint_map[joint] = []
 
-        joint_map[joint].append(key)
+        joint_map[joint].append(vert)
 
     return joint_map
 
@@ -5,6 +5,7 @@ import math
 import re
 
 from random import uniform
+from collections import OrderedDict
 
 from .. import util, util_math
 
@@ -592,72 +593,97 @@ def get_position_different(mesh1, mesh2, tolerance=0.00001, stop_on_first=True):
     return mismatches
 
 
-def is_symmetrical(mesh, mirror_axis='X', tolerance=0.00001):
+class MirrorMapCache(object):
     """
-    find asymmetrical points on a mesh.
-
-    mirrors axis currently doesn't work.  It's always checking on x
+    Mirror maps keyed by topology and points.
+    A mesh that has not changed shape reuses its map instead of rebuilding it.
+    The keys hold the full points, so two meshes can never share a map by a hash collision.
+    When max_maps is reached the least recently used map is dropped.
     """
+    maps = OrderedDict()
+    max_maps = 32
+    build_count = 0
 
-    bound = space.BoundingBox(mesh)
-    if not bound.is_symmetrical(axis=mirror_axis, tolerance=tolerance):
-        return False
+    @classmethod
+    def get_mirror_map(cls, points, topology=None, axis='X', tolerance=0.0001):
+        """
+        Args:
+            points (list): List of (x,y,z) tuples.
+            topology: Anything hashable that changes with the topology, e.g. the polygon vertex indices.
 
-    verts = get_position_assymetrical(mesh, mirror_axis, tolerance)
+        Returns:
+            tuple: util_math.get_mirror_map result
+        """
+        points = tuple(points)
+        key = (topology, points, axis, tolerance)
 
-    if verts:
-        return False
+        if key in cls.maps:
+            cls.maps.move_to_end(key)
+            return cls.maps[key]
 
-    return True
+        while cls.maps and len(cls.maps) >= cls.max_maps:
+            cls.maps.popitem(last=False)
 
+        cls.build_count += 1
 
-def get_position_assymetrical(mesh, mirror_axis='x', tolerance=0.00001):  # TODO: Typo in function name, should be asymmetrical
-    """
-    find asymmetrical points on a mesh.
+        result = util_math.get_mirror_map(points, axis, tolerance)
+        cls.maps[key] = result
 
-    mirrors axis currently doesn't work.  It's always checking on x
-    """
-    mesh1_fn = api.IterateGeometry(mesh)
-    points = mesh1_fn.get_points_as_list()
-    points = find_asymmetrical_points(points, 'X', 0.1)
-    test_points = list(points)
+        return result
 
-    point_count = len(points)
+    @classmethod
+    def clear(cls):
+        cls.maps = OrderedDict()
 
-    not_found = []
 
-    for inc in range(0, point_count):
+def get_mirror_map(mesh, mirror_axis='X', tolerance=0.0001, world=False):
+    """
+    Get the index of the mirrored vertex for every vertex on the mesh.
+    Vertices without a partner within tolerance use the vertex closest to their mirrored position.
+    Maps are cached until the mesh topology or point positions change.
 
-        source_point = points[inc]
+    Args:
+        mesh (str): The name of a mesh.
+        mirror_axis (str): 'X', 'Y' or 'Z'.
+        tolerance (float): How far the mirrored position can be from its partner.
+        world (bool): Mirror in world space instead of object space.
 
-        if util_math.is_the_same_number(source_point[0], 0, tolerance=tolerance):
-            continue
+    Returns:
+        tuple: (list of mirrored vertex indices, list of vertex indices that had no partner within tolerance)
+    """
+    mesh = get_mesh_shape(mesh)
 
-        test_point_count = len(test_points)
+    points = [(point.x, point.y, point.z) for point in api.get_mesh_points(mesh, world=world)]
+    topology = tuple(api.get_mesh_topology(mesh)[1])
 
-        found = False
+    return MirrorMapCache.get_mirror_map(points, topology, mirror_axis.upper(), tolerance)
 
-        for sub_inc in range(test_point_count):
 
-            test_point = test_points[sub_inc]
+def is_symmetrical(mesh, mirror_axis='X', tolerance=0.00001):
+    """
+    Check if every point on the mesh has a partner on the other side of mirror_axis.
+    """
 
-            if source_point[0] > 0 and test_point[0] > 0:
-                continue
+    bound = space.BoundingBox(mesh)
+    if not bound.is_symmetrical(axis=mirror_axis, tolerance=tolerance):
+        return False
 
-            if source_point[0] < 0 and test_point[0] < 0:
-                continue
+    verts = get_position_assymetrical(mesh, mirror_axis, tolerance)
 
-            if util_math.is_the_same_number(source_point[0], (test_point[0] * -1), tolerance):
-                if util_math.is_the_same_number(source_point[1], test_point[1], tolerance):
-                    if util_math.is_the_same_number(source_point[2], test_point[2], tolerance):
-                        found = True
-                        test_points.pop(sub_inc)
-                        break
+    if verts:
+        return False
 
-        if not found:
-            not_found.append(inc)
+    return True
+
+
+def get_position_assymetrical(mesh, mirror_axis='x', tolerance=0.00001):  # TODO: Typo in function name, should be asymmetrical
+    """
+    find asymmetrical points on a mesh.
 
-    return not_found
+    Returns:
+        list: Indices of the vertices that have no partner within tolerance across mirror_axis.
+    """
+    return get_mirror_map(mesh, mirror_axis, tolerance)[1]
 
 
 def spatial_hash(vector, precision):
@@ -674,34 +700,30 @@ def spatial_hash(vector, precision):
 
 def find_asymmetrical_points(mesh_points, mirror_axis='X', tolerance=0.0001, return_index=False):
     """
-    experimental mirroring using a dictionary
-    """
-    if tolerance == 0:
-        precision = 0
-    else:
-        precision = max(0, -int(math.floor(math.log10(tolerance))))
+    Find the points that have no partner within tolerance at their mirrored position.
 
-    hash_table = {}
+    Args:
+        mesh_points (list): List of [x,y,z] positions.
+        mirror_axis (str): 'X', 'Y' or 'Z'.
+        tolerance (float): How far the mirrored position can be from its partner.
+        return_index (bool): Return point indices instead of positions.
 
-    for point in mesh_points:
-        hash_key = spatial_hash(point, precision)
-        hash_table[hash_key] = None
+    Returns:
+        list
+    """
+    point_tree = util_math.PointTree(mesh_points)
 
     asymmetrical_points = []
 
-    inc = 0
-    for point in mesh_points:
-
-        mirrored = util_math.mirror_vector(point, mirror_axis)
-        mirrored_hash_key = spatial_hash(mirrored, precision)
+    for inc, mirror_index in enumerate(point_tree.get_mirror_indices(mirror_axis, tolerance)):
 
-        if mirrored_hash_key not in hash_table:
-            if return_index:
-                asymmetrical_points.append(inc)
-            else:
-                asymmetrical_points.append(point)
+        if mirror_index is not None:
+            continue
 
-        inc += 1
+        if return_index:
+            asymmetrical_points.append(inc)
+        else:
+            asymmetrical_points.append(mesh_points[inc])
 
     return asymmetrical_points
 
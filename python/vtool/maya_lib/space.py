@@ -20,293 +20,59 @@ if util.in_maya:
 # do not import geo
 
 
-class VertexOctree(object):
-
-    def __init__(self):
-        self.top_node = None
-
-    def _get_bounding_box(self, mesh):
-        bounding_box = cmds.exactWorldBoundingBox(mesh)
-        center = cmds.objectCenter(mesh, gl=True)
-
-        large_value = -1
-
-        inc = 0
-
-        for box_value in bounding_box:
-
-            value = box_value - center[inc]
-
-            if value > 0:
-                if value > large_value:
-                    large_value = value
-
-            inc += 1
-            if inc >= 3:
-                inc = 0
-
-        max_value = [large_value] * 3
-        min_value = [large_value * -1] * 3
-
-        max_value = [max_value[0] + center[0],
-                     max_value[1] + center[1],
-                     max_value[2] + center[2]]
-        min_value = [min_value[0] + center[0],
-                     min_value[1] + center[1],
-                     min_value[2] + center[2]]
-
-        return min_value + max_value + center
-
-    def create(self, mesh):
-        bounding_box = self._get_bounding_box(mesh)
-
-        self.top_node = VertexOctreeNode(bounding_box)
-
-        mesh_fn = api.IterateGeometry(mesh)
-        points = mesh_fn.get_points_as_list()
-
-        for inc in range(0, len(points)):
-            vertex_position = points[inc]
-            self.add_vertex('%s.vtx[%s]' % (mesh, inc), vertex_position)
-
-        self.top_node.sort_mesh_vertex()
-
-    def add_vertex(self, vertex_name, vertex_position):
-        self.top_node.add_vertex(vertex_name, vertex_position)
-
-
-class VertexOctreeNode(object):
-
-    def __init__(self, boundingBoxData):
-        self.min = boundingBoxData[0:3]
-        self.max = boundingBoxData[3:6]
-        self.center = boundingBoxData[6:9]
-        self.children = []
-        self.parent = None
-        self.verts = []
-        self.child_verts = []
-
-    def _snap_to_bounding_box(self, vector):
-        new_vector = list(vector)
+class VertexIndex(object):
+    """
+    Spatial index of vertex world positions for nearest, radius and mirror queries.
+    Build it once and query it in batch instead of running xform on every vertex for every query.
 
-        min_value = self.min
-        max_value = self.max
+    Args:
+        verts (list): Vertex names, or the name of a mesh to index all of its vertices.
+    """
 
-        for inc in range(0, 3):
-            if vector[inc] < min_value[inc]:
-                new_vector[inc] = min_value[inc]
-            if vector[inc] > max_value[inc]:
-                new_vector[inc] = max_value[inc]
+    def __init__(self, verts):
 
-        return new_vector
+        if util.is_str(verts) and verts.find('.vtx[') == -1:
+            verts = '%s.vtx[*]' % verts
 
-    def _is_vector_in_range(self, min_value, max_value, vector):
+        self.verts, self.positions = get_vertex_positions(verts)
+        self.tree = util_math.PointTree(self.positions)
 
-        for inc in range(0, 3):
+    def get_closest_vertex(self, position):
+        closest = self.tree.get_closest(position)
 
-            if vector[inc] < min_value[inc] or vector[inc] > max_value[inc]:
-                return False
+        if closest:
+            return self.verts[closest[0]]
 
-        return True
-
-    def _get_verts_in_range(self, min_value, max_value):
+    def get_closest_vertices(self, positions):
         found = []
 
-        if self.verts:
-            for vertex in self.verts:
-                vector = vertex[1]
-
-                if self._is_vector_in_range(min_value, max_value, vector):
+        for closest in self.tree.get_closest_many(positions):
+            vert = None
+            if closest:
+                vert = self.verts[closest[0]]
 
-                    found_vert = False
-                    for child_vert in self.child_verts:
-
-                        if vertex[0] == child_vert:
-                            found_vert = True
-                            break
-
-                    if not found_vert:
-                        found.append(vertex)
+            found.append(vert)
 
         return found
 
-    def _create_child(self, min_value, max_value, verts):
-
-        mid_point = util_math.get_midpoint(min_value, max_value)
-
-        bounding_box = min_value + max_value + mid_point
-
-        self.children.append(VertexOctreeNode(bounding_box))
-
-        for vertex in verts:
-            self.children[-1].add_vertex(vertex[0], vertex[1])
-            self.child_verts.append(vertex[0])
-
-        if len(self.child_verts) == 1:
-            if self.child_verts[0][0] == 'body_C.vtx[7916]':
-                goo = self.createCube()
-                cmds.rename(goo, 'panzy')
-
-    def create_cube(self):
-        cube = cmds.polyCube(ch=0)[0]
-        min_value = self.min
-        max_value = self.max
-
-        cmds.move(min_value[0], min_value[1], min_value[2],
-                  '%s.vtx[0]' % cube, ws=True)
-        cmds.move(min_value[0], min_value[1], max_value[2],
-                  '%s.vtx[1]' % cube, ws=True)
-        cmds.move(min_value[0], max_value[1], min_value[2],
-                  '%s.vtx[2]' % cube, ws=True)
-        cmds.move(min_value[0], max_value[1], max_value[2],
-                  '%s.vtx[3]' % cube, ws=True)
-        cmds.move(max_value[0], max_value[1], min_value[2],
-                  '%s.vtx[4]' % cube, ws=True)
-        cmds.move(max_value[0], max_value[1], max_value[2],
-                  '%s.vtx[5]' % cube, ws=True)
-        cmds.move(max_value[0], min_value[1], min_value[2],
-                  '%s.vtx[6]' % cube, ws=True)
-        cmds.move(max_value[0], min_value[1], max_value[2],
-                  '%s.vtx[7]' % cube, ws=True)
-
-        return cube
-
-    def subdivide(self):
-
-        top_row1 = self.center + self.max
-
-        top_row2 = [self.min[0], self.center[1], self.center[2],
-                    self.center[0], self.max[1], self.max[2]]
-
-        top_row3 = [self.min[0], self.center[1], self.min[2],
-                    self.center[0], self.max[1], self.center[2]]
+    def get_vertices_within_radius(self, position, radius):
+        return [self.verts[inc] for inc in self.tree.get_within_radius(position, radius)]
 
-        top_row4 = [self.center[0], self.center[1], self.min[2],
-                    self.max[0], self.max[1], self.center[2]]
-
-        btm_row1 = self.min + self.center
-
-        btm_row2 = [self.center[0], self.min[1], self.min[2],
-                    self.max[0], self.center[1], self.center[2]]
-
-        btm_row3 = [self.min[0], self.min[1], self.center[2],
-                    self.center[0], self.center[1], self.max[2]]
-
-        btm_row4 = [self.center[0], self.min[1], self.center[2],
-                    self.max[0], self.center[1], self.max[2]]
-
-        boundings = [top_row1,
-                     top_row2,
-                     top_row3,
-                     top_row4,
-                     btm_row1,
-                     btm_row2,
-                     btm_row3,
-                     btm_row4]
-
-        for bounding in boundings:
-
-            min_value = bounding[0:3]
-            max_value = bounding[3:6]
-
-            verts = self._get_verts_in_range(min_value, max_value)
-
-            if verts:
-                self._create_child(bounding[0:3], bounding[3:6], verts)
-
-    def set_parent(self, parent_octree):
-        self.parent = parent_octree
-
-    def get_verts(self):
+    def get_mirror_vertices(self, axis='X', tolerance=0.0001):
+        """
+        Returns:
+            list: The mirrored partner for each vertex, or None where there is no partner.
+        """
         found = []
 
-        for vert in self.verts:
-            found.append(vert[0])
+        for inc in self.tree.get_mirror_indices(axis, tolerance):
+            vert = None
+            if inc is not None:
+                vert = self.verts[inc]
 
-        return found
-
-    def add_vertex(self, vertex_name, vertex_position):
-        self.verts.append([vertex_name, vertex_position])
-
-    def has_verts(self):
-        if self.verts:
-            return True
-
-        if not self.verts:
-            return False
-
-    def vert_count(self):
-        return len(self.verts)
-
-    def has_children(self):
-        if self.children:
-            return True
-
-        if not self.children:
-            return False
-
-    def find_closest_child(self, three_number_list):
-
-        closest_distance = 1000000000000000000000000000000
-        found_child = None
-
-        if self.has_children():
-            for child in self.children:
-                if self._is_vector_in_range(child.min, child.max, three_number_list):
-                    return child
-
-                if child.has_children():
-                    distance = util_math.get_distance(child.center,
-                                                      three_number_list)
-
-                    if distance < 0.001:
-                        return child
-
-                    if distance < closest_distance:
-                        closest_distance = distance
-
-                        found_child = child
-
-        return found_child
-
-    def find_closest_vertex(self, three_number_list):
-        if self.vert_count() == 1:
-            return self
-
-        child = None
-        inc = 0
-        last_found = self
-        vector = self._snap_to_bounding_box(three_number_list)
-
-        while not child:
-
-            if last_found is None:
-                break
-
-            child = last_found.find_closest_child(vector)
-
-            if not child:
-                break
-
-            if child:
-                last_found = child
-                child = None
-
-            if inc > 100:
-                break
-
-            inc += 1
-
-        return last_found.verts[0][0]
-
-    def sort_mesh_vertex(self):
-
-        if self.has_verts():
-            self.subdivide()
+            found.append(vert)
 
-            if self.vert_count() > 1:
-                for child in self.children:
-                    child.sort_mesh_vertex()
+        return found
 
 
 class PinXform(object):
@@ -3180,21 +2946,59 @@ def get_influence_radius(transform, scope=[]):
     return radius
 
 
-def get_vertices_within_radius(position, radius, verts):
+def get_vertex_positions(verts):
+    """
+    Get the world positions of vertices.
+    Positions are read with one api call per mesh instead of an xform per vertex.
 
-    found = []
+    Args:
+        verts (list): Vertex names. Ranges like mesh.vtx[0:10] get flattened.
+
+    Returns:
+        tuple: (list of flattened vertex names, list of [x,y,z] positions)
+    """
+    verts = cmds.ls(verts, flatten=True)
 
-    min_vector, max_vector = util_math.sphere_min_max_vector(position, radius)
+    mesh_points = {}
+    positions = []
 
     for vert in verts:
-        vert_position = cmds.xform(vert, q=True, ws=True, t=True)
-        if not util_math.vector_in_min_max_vector(vert_position, min_vector, max_vector):
+
+        split_index = vert.find('.vtx[')
+
+        if split_index == -1:
+            positions.append(cmds.xform(vert, q=True, ws=True, t=True))
             continue
-        distance = util_math.get_distance(position, vert_position)
-        if distance < radius:
-            found.append(vert)
 
-    return found
+        node = vert[:split_index]
+
+        if node not in mesh_points:
+            mesh = node
+            if not core.is_a_shape(node):
+                mesh = core.get_shapes(node, 'mesh', no_intermediate=True)[0]
+
+            mesh_points[node] = api.get_mesh_points(mesh, world=True)
+
+        point = mesh_points[node][int(vert[split_index + 5:-1])]
+        positions.append((point.x, point.y, point.z))
+
+    return verts, positions
+
+
+def get_vertices_within_radius(position, radius, verts):
+    """
+    Args:
+        position (list): [0,0,0] vector.
+        radius (float): Only vertices closer than this are returned.
+        verts (list): Vertex names, or a VertexIndex to reuse across queries.
+
+    Returns:
+        list: The vertex names within the radius.
+    """
+    if not isinstance(verts, VertexIndex):
+        verts = VertexIndex(verts)
+
+    return verts.get_vertices_within_radius(position, radius)
 
 
 def get_group_in_plane(transform1, transform2, transform3):
@@ -24,6 +24,10 @@ def main():
 
     print('Using Vetala Process:\t%s' % process_path)
 
+    jsonl_log = os.environ.get('VETALA_TEMP_LOG_JSONL')
+    if jsonl_log:
+        print('Writing log records to:\t%s' % jsonl_log)
+
     try:
         import maya.standalone
         maya.standalone.initialize(name='python')
@@ -2,11 +2,16 @@
 
 import os
 import sys
+import time
 import traceback
 import string
+import shutil
 import subprocess
 import inspect
 import collections
+from copy import deepcopy
+import threading
+import concurrent.futures
 
 from functools import wraps
 
@@ -60,14 +65,112 @@ def get_current_process_instance():
     return process_inst
 
 
+class ProcessDirectoryIndex(object):
+    """
+    Keeps what find_processes found in each directory.
+    A directory is scanned again only when its modification time changes.
+    """
+    directories = {}
+
+    @classmethod
+    def _get_mtime(cls, directory):
+        try:
+            return os.stat(directory).st_mtime_ns
+        except (OSError, TypeError):
+            return None
+
+    @classmethod
+    def _scan(cls, directory, stop_at_one=False, return_also_non_process_list=False):
+
+        found = []
+        found_non = []
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            entries = []
+
+        for entry in entries:
+
+            if stop_at_one:
+                # only check found not found_non, because function is find "processes"
+                if found:
+                    break
+
+                if found_non and return_also_non_process_list:
+                    break
+
+            if entry.name.startswith('.'):
+                continue
+
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir and os.path.exists(os.path.join(entry.path, '.code')):
+                found.append(entry.name)
+            elif cls._is_interesting(entry):
+                found_non.append(entry.name)
+
+        return found, found_non
+
+    @classmethod
+    def _is_interesting(cls, entry):
+        """
+        The same check as is_interesting_folder, from the scandir entry instead of a stat.
+        """
+        if entry.name.find('.') == -1:
+            return True
+
+        try:
+            return not entry.is_file()
+        except OSError:
+            return True
+
+    @classmethod
+    def get(cls, directory, stop_at_one=False, return_also_non_process_list=False):
+        """
+        Returns:
+            tuple: (processes, folders) found in the directory.
+                With stop_at_one, a directory that is not indexed yet is only scanned until the first match.
+        """
+
+        mtime = cls._get_mtime(directory)
+
+        if directory in cls.directories:
+            cached_mtime, found, found_non = cls.directories[directory]
+            if mtime is not None and cached_mtime == mtime:
+                return list(found), list(found_non)
+
+        if stop_at_one:
+            return cls._scan(directory, stop_at_one, return_also_non_process_list)
+
+        found, found_non = cls._scan(directory)
+
+        if mtime is not None:
+            cls.directories[directory] = [mtime, found, found_non]
+
+        return list(found), list(found_non)
+
+    @classmethod
+    def remove(cls, directory):
+        cls.directories.pop(directory, None)
+
+    @classmethod
+    def clear(cls):
+        cls.directories = {}
+
+
 def find_processes(directory=None, return_also_non_process_list=False, stop_at_one=False):
     """
     This will try to find the processes in the supplied directory.
+    Results are cached by ProcessDirectoryIndex until the directory changes.
 
     Args:
         directory(str): The directory to search for processes.
-        return_also_non_process_list (bool): TODO: Fill description.
-        stop_at_one (bool): TODO: Fill description.
+        return_also_non_process_list (bool): Also return the folders that are not processes.
+        stop_at_one (bool): Stop at the first process found, or the first folder when also returning folders.
 
     Returns:
         list: The processes in the directory.
@@ -84,33 +187,13 @@ def find_processes(directory=None, return_also_non_process_list=False, stop_at_o
 
     log.debug('Find Processes %s' % directory)
 
-    dirs = []
-    try:
-        dirs = os.listdir(directory)
-    except:
-        pass
+    found, found_non = ProcessDirectoryIndex.get(directory, stop_at_one, return_also_non_process_list)
 
-    for folder in dirs:
-
-        if stop_at_one:
-            # only check found not found_non, because function is find "processes"
-            if found:
-                break
-
-            if found_non and return_also_non_process_list:
-                break
-
-        if folder.startswith('.'):
-            continue
-
-        full_path = util_file.join_path(directory, folder)
-
-        if is_process(full_path):
-            found.append(folder)
-        else:
-            if return_also_non_process_list:
-                if is_interesting_folder(folder, directory):
-                    found_non.append(folder)
+    if stop_at_one:
+        found = found[:1]
+        if found:
+            found_non = []
+        found_non = found_non[:1]
 
     if not return_also_non_process_list:
         return found
@@ -283,6 +366,105 @@ def decorator_process_run_script(function):
     return wrapper
 
 
+class ProcessManifest(object):
+    """
+    A parsed manifest file.
+    The file is only parsed again when its modification time or size changes.
+
+    Args:
+        filepath (str): The path to the manifest file.
+    """
+
+    state_values = {'True': True,
+                    'False': False,
+                    # TODO: remove eventually - this is because of pyside6 conversion bug.
+                    'CheckState.Checked': True,
+                    'CheckState.Unchecked': False,
+                    'CheckState.UnCheck': False}
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+        self.scripts = None
+        self.states = None
+        self.script_index = {}
+        self.children = {}
+
+        self._stamp = None
+
+    def _get_stamp(self):
+        try:
+            file_stat = os.stat(self.filepath)
+        except (OSError, TypeError):
+            return None
+
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _format_state(self, value):
+
+        if value in self.state_values:
+            return self.state_values[value]
+
+        return eval(value)
+
+    def _load(self, stamp):
+
+        self._stamp = stamp
+
+        self.scripts = None
+        self.states = None
+        self.script_index = {}
+        self.children = {}
+
+        if not stamp:
+            return
+
+        lines = util_file.get_file_lines(self.filepath)
+        if not lines:
+            return
+
+        scripts = []
+        states = []
+
+        for line in lines:
+
+            if not line:
+                continue
+
+            states.append(False)
+
+            split_line = line.split()
+            if len(split_line):
+                scripts.append(' '.join(split_line[:-1]))
+
+            if len(split_line) >= 2:
+                states[-1] = self._format_state(split_line[-1])
+
+        for inc, script in enumerate(scripts):
+            self.script_index.setdefault(script, inc)
+
+            if script.find('/') > -1:
+                parent = script[:script.rfind('/')]
+                self.children.setdefault(parent, []).append(script)
+
+        self.scripts = scripts
+        self.states = states
+
+    def update(self):
+        """
+        Parse the file again if it changed on disk.
+        """
+        stamp = self._get_stamp()
+
+        if stamp is None or stamp != self._stamp:
+            self._load(stamp)
+
+        return self
+
+    def clear(self):
+        self._stamp = None
+
+
 class Process(object):
     """
     This class has functions to work on individual processes in the Process Manager.
@@ -315,6 +497,8 @@ class Process(object):
         self._update_options = True
 
         self._option_result_function = None
+        self.option_reads = 0
+        self.option_parses = 0
 
         self._skip_children = None
 
@@ -325,15 +509,21 @@ class Process(object):
         self.option_values = {}
 
         self.option_settings = None
+        self._option_index = None
+        self._option_index_stat = None
         self.settings = None
         self._control_inst = None
         self._data_override = None
         self._runtime_globals = {}
         self.reset_runtime()
         self._data_folder = ''
+        self._manifests = {}
 
     def _setup_options(self):
 
+        if self.option_settings and self.option_settings._batch_depth:
+            return
+
         if not self.option_settings or self._update_options:
             self._load_options()
 
@@ -345,6 +535,70 @@ class Process(object):
         self.option_settings = options
         self.option_settings.set_directory(self._get_override_path(), 'options.json')
 
+    def _invalidate_option_index(self):
+        self._option_index = None
+
+    def _get_option_index(self):
+        """
+        Index of the options keyed by full name and by bare name.
+        Values are parsed lazily and only once per file load.
+        The index is rebuilt when the options change through this process or the file changes on disk.
+        """
+        self._setup_options()
+
+        settings = self.option_settings
+        stat = settings.get_stat()
+
+        index = self._option_index
+
+        if index is not None:
+            if index['settings'] is settings.settings_dict and self._option_index_stat == stat:
+                return index
+
+            if self._option_index_stat != stat:
+                log.debug('Options file changed on disk, reloading')
+                settings.reload(force=True)
+
+        bare = {}
+
+        for key in settings.settings_dict:
+            split_key = key.split('.')
+            name = split_key[-1]
+
+            if name not in bare:
+                bare[name] = []
+            bare[name].append((key, '.'.join(split_key[:-1])))
+
+        index = {'settings': settings.settings_dict,
+                 'bare': bare,
+                 'values': {}}
+
+        self._option_index = index
+        self._option_index_stat = stat
+
+        return index
+
+    def _get_indexed_option(self, key, option_name):
+        """
+        Formatted value of the option with the full name key. Parsing happens only on the first read,
+        the option result function runs on every read and gets option_name.
+        """
+        index = self._get_option_index()
+
+        values = index['values']
+
+        if key not in values:
+            self.option_parses += 1
+            values[key] = self._parse_option_value(index['settings'][key])
+
+        value = values[key]
+
+        # callers are free to edit what they get back
+        if isinstance(value, (list, dict)):
+            value = deepcopy(value)
+
+        return self._get_option_result(value, option_name)
+
     def _setup_settings(self):
 
         if not self.settings:
@@ -397,6 +651,8 @@ class Process(object):
             if not util_file.is_dir(manifest_folder):
                 self.create_code('manifest', 'script.manifest')
 
+            ProcessDirectoryIndex.remove(util_file.get_dirname(path))
+
         return path
 
     def _create_sub_data_folder(self, data_name):
@@ -619,8 +875,6 @@ class Process(object):
 
     def _source_script(self, script):
 
-        util_file.delete_pyc(script)
-
         put = None
         if self._data_override:
             put = self._data_override._put
@@ -648,6 +902,12 @@ class Process(object):
 
     def _format_option_value(self, value, option_name=None):
 
+        new_value = self._parse_option_value(value)
+
+        return self._get_option_result(new_value, option_name)
+
+    def _parse_option_value(self, value):
+
         new_value = value
 
         option_type = None
@@ -695,6 +955,10 @@ class Process(object):
             elif len(new_value) == 1:
                 new_value = new_value[0]
 
+        return new_value
+
+    def _get_option_result(self, new_value, option_name=None):
+
         if self._option_result_function:
             new_value = self._option_result_function(new_value, option_name)
 
@@ -1016,16 +1280,16 @@ class Process(object):
 
         backup_path = self.get_backup_path(directory)
 
-        backup_path = util_file.create_dir('temp_process_backup', backup_path)
+        backup_path = util_file.create_dir(backup_path)
 
         util.show('Backing up to custom directory: %s' % backup_path)
 
-        copy_process(self, backup_path)
-
         version = util_file.VersionFile(backup_path)
-        version.save(comment)
+        version.set_version_folder(backup_path)
+        version.save_folder(self.get_path(), comment, exclude=[self.backup_folder_name, '.version'])
 
-        util_file.delete_dir(backup_path)
+        util.show('Backup copied %s changed files and linked %s unchanged files' % (len(version.copied_files),
+                                                                                    len(version.linked_files)))
 
     # data ---
 
@@ -1039,6 +1303,9 @@ class Process(object):
             bool: True if the supplied name string matches the name of a data folder in the current process.
         """
 
+        if not sub_folder:
+            return name in data.DataFolderIndex.get(self.get_data_path())[2]
+
         path = self.get_data_folder(name, sub_folder)
 
         if not path:
@@ -1124,15 +1391,12 @@ class Process(object):
             str: The name of the data type of the data folder with the same name if it exists.
         """
 
-        data_folder = self.get_data_folder(name)
-        data_file = util_file.join_path(data_folder, 'data.json')
-        if not util_file.is_file(data_file):
-            return
+        folder = data.DataFolderIndex.get_folder(self.get_data_path(), name)
 
-        data_folder = data.DataFolder(name, self.get_data_path())
-        data_type = data_folder.get_data_type()
+        if not folder or 'data.json' not in folder['files']:
+            return
 
-        return data_type
+        return folder['data_type']
 
     def get_data_file_or_folder(self, name, sub_folder_name=None):
         """
@@ -1157,8 +1421,13 @@ class Process(object):
 
         data_folder = self.get_data_file_or_folder(data_name)
 
-        version = util_file.VersionFile(data_folder)
-        return len(version.get_version_numbers())
+        if not data_folder:
+            return 0
+
+        if util_file.is_file(data_folder):
+            data_folder = util_file.get_dirname(data_folder)
+
+        return data.DataFolderIndex.get_version_count(util_file.join_path(data_folder, '.version'))
 
     def get_data_versions(self, data_name):
 
@@ -1195,7 +1464,7 @@ class Process(object):
         """
         directory = self.get_data_path()
 
-        folders = util_file.get_folders(directory)
+        folders = data.DataFolderIndex.get_folders(directory)
         if '.sub' in folders:
             folders.remove('.sub')
 
@@ -1294,9 +1563,9 @@ class Process(object):
 
     def get_data_sub_folder_names(self, data_name):
 
-        sub_folder = self.get_data_sub_path(data_name)
+        sub_folder = util_file.join_path(self.get_data_path(), '%s/.sub' % data_name)
 
-        sub_folders = util_file.get_folders(sub_folder)
+        sub_folders = data.DataFolderIndex.get_folders(sub_folder)
 
         return sub_folders
 
@@ -1593,16 +1862,24 @@ class Process(object):
             bool: If the supplied name string matches the name of a code folder in the current process.
 
         """
-        path = self.get_code_folder(name)
+        folder = self._get_code_folder_entry(name)
 
-        if not path:
-            return False
-        if util_file.is_dir(path):
-            if util_file.is_file_in_dir('data.json', path):
-                return True
+        if not folder:
             return False
 
-        return False
+        return 'data.json' in folder['files']
+
+    def _get_code_folder_entry(self, name):
+
+        if name.endswith('.py'):
+            name = name[:-3]
+
+        if name.endswith('.data'):
+            name = name[:-5]
+
+        path = util_file.join_path(self.get_code_path(), name)
+
+        return data.DataFolderIndex.get_folder(util_file.get_dirname(path), util_file.get_basename(path))
 
     def get_code_path(self):
         """
@@ -1676,66 +1953,58 @@ class Process(object):
             code_names.insert(0, 'manifest')
 
         if include_scripts:
-            result = util_file.get_all_rel_paths(self.get_code_path())
-
-            filter_names = ['.version', '__pycache__', '.pyc']
+            code_names += self._get_code_script_names(self.get_code_path())
 
-            code_path = self.get_code_path()
-
-            visited = {code_path:False}
-
-            for path in result:
+        return code_names
 
-                found = False
-                for name in filter_names:
-                    if path.find(name) > -1:
-                        found = True
-                        break
+    def _get_code_script_names(self, directory, rel_path='', parent_is_data=False):
+        """
+        Files and folders under the code path that are not code folders or inside one.
+        """
 
-                if found:
-                    continue
+        filter_names = ['.version', '__pycache__', '.pyc']
 
-                full_path = util_file.join_path(code_path, path)
+        files, folder_names, folders = data.DataFolderIndex.get(directory)
 
-                if self.is_folder_data(full_path):
-                    continue
+        found = []
+        walk_folders = []
 
-                parent_path = util_file.get_dirname(full_path)
-                parent_is_data = False
+        for name in folder_names + files:
 
-                if parent_path in visited:
-                    parent_is_data = visited[parent_path]
-                else:
-                    parent_is_data = self.is_folder_data(parent_path)
-                    visited[parent_path] = parent_is_data
+            path = rel_path + name
 
-                if parent_is_data:
-                    continue
+            filtered = False
+            for filter_name in filter_names:
+                if path.find(filter_name) > -1:
+                    filtered = True
+                    break
 
-                code_names.append(util_file.fix_slashes(path))
+            if filtered:
+                continue
 
-        return code_names
+            folder = folders.get(name)
+            is_data = bool(folder) and 'data.json' in folder['files']
 
-    def get_code_children(self, code_name):
+            if folder:
+                walk_folders.append((name, is_data))
 
-        found = []
+            if is_data or parent_is_data:
+                continue
 
-        code_name = util_file.remove_extension(code_name)
+            found.append(path)
 
-        scripts, states = self.get_manifest()
+        for name, is_data in walk_folders:
+            found += self._get_code_script_names(util_file.join_path(directory, name), rel_path + name + '/', is_data)
 
-        for script in scripts:
-            if script.find('/') == -1:
-                continue
+        return found
 
-            if script.startswith(code_name + '/'):
+    def get_code_children(self, code_name):
 
-                sub_script = script[len(code_name + '/'):]
+        code_name = util_file.remove_extension(code_name)
 
-                if not sub_script.find('/') > -1:
-                    found.append(script)
+        manifest = self._get_parsed_manifest()
 
-        return found
+        return list(manifest.children.get(code_name, []))
 
     def get_code_type(self, name):
         """
@@ -1746,23 +2015,17 @@ class Process(object):
             str: The code type name of the code folder with the supplied name if the code folder exists. Otherwise return None. Right now only python code type is used by the Process Manager.
         """
 
-        # this was added because data folder is sometimes faulty
-        path = util_file.join_path(self.get_code_path(), name)
-        python_file = util_file.join_path(path, util_file.get_basename(name) + '.py')
+        folder = self._get_code_folder_entry(name)
 
-        data_type = None
-
-        if util_file.is_file(python_file):
-            data_type = 'script.python'
-            return data_type
-
-        fullpath = util_file.join_path(self.get_code_path(), name)
+        if not folder:
+            return
 
-        if self.is_folder_data(fullpath):
-            data_folder = data.DataFolder(name, self.get_code_path())
-            data_type = data_folder.get_data_type()
+        # this was added because data folder is sometimes faulty
+        if util_file.get_basename(name) + '.py' in folder['files']:
+            return 'script.python'
 
-        return data_type
+        if 'data.json' in folder['files']:
+            return folder['data_type']
 
     def get_code_files(self, basename=False, fast_with_less_checking=False):
         """
@@ -2182,6 +2445,15 @@ class Process(object):
 
         if util_file.has_permission(self.option_settings.get_file()):
             self.option_settings.set(name, value)
+            self._invalidate_option_index()
+
+    def batch_options(self):
+        """
+        Context manager. Option edits made inside the with block are written to the options file once when it ends.
+        """
+        self._setup_options()
+
+        return self.option_settings.batch()
 
     def set_option(self, name, value, group=None):
         self._setup_options()
@@ -2192,6 +2464,7 @@ class Process(object):
             name = '%s' % name
 
         self.option_settings.set(name, value)
+        self._invalidate_option_index()
 
     def get_unformatted_option(self, name, group=None):
         self._setup_options()
@@ -2225,16 +2498,24 @@ class Process(object):
         self.option_settings.settings_order.insert(index, name)
 
         self.option_settings._write()
+        self._invalidate_option_index()
 
     def get_option(self, name, group=None):
         """
         Get an option by name and group
         """
-        self._setup_options()
+        self.option_reads += 1
 
-        value = self.get_unformatted_option(name, group)
+        index = self._get_option_index()
 
-        if value is None:
+        key = name
+        if group:
+            key = '%s.%s' % (group, name)
+
+        value = None
+        if index['settings'].get(key) is not None:
+            value = self._get_indexed_option(key, name)
+        else:
 
             match_value = self.get_option_match_and_group(name, return_first=True)
 
@@ -2256,8 +2537,6 @@ class Process(object):
                         util.warning('Could not find option: %s in group: %s' % (name, group))
                 else:
                     util.warning('Could not find option: %s' % name)
-        else:
-            value = self._format_option_value(value, name)
 
         log.info('Get option: name: %s group: %s with value: %s' % (name, group, value))
 
@@ -2271,55 +2550,35 @@ class Process(object):
         Return the matching value and group
         """
 
-        self._setup_options()
-
-        option_dict = self.option_settings.settings_dict
-
-        found = {}
-
-        for key in option_dict:
-
-            split_key = key.split('.')
-            group = '.'.join(split_key[:-1])
+        index = self._get_option_index()
 
-            if split_key[-1] == name:
-                value = None
-                if return_first:
-                    value = self._format_option_value(option_dict[key], key)
-                    return value, group
+        if name not in index['bare']:
+            return None
 
-                found[name] = [value, group]
+        if return_first:
+            key, group = index['bare'][name][0]
+            value = self._get_indexed_option(key, key)
+            return value, group
 
-        if not found:
-            found = None
+        group = index['bare'][name][-1][1]
 
-        return found
+        return {name: [None, group]}
 
     def get_option_match(self, name, return_first=True):
         """
         Try to find a matching option in all the options
         """
 
-        self._setup_options()
-
-        option_dict = self.option_settings.settings_dict
-
-        found = {}
-
-        for key in option_dict:
+        index = self._get_option_index()
 
-            split_key = key.split('.')
-            if split_key[-1] == name:
-                value = None
-                if return_first:
-                    value = self._format_option_value(option_dict[key], key)
-                    return value
-                found[name] = value
+        if name not in index['bare']:
+            return None
 
-        if not found:
-            found = None
+        if return_first:
+            key = index['bare'][name][0][0]
+            return self._get_indexed_option(key, key)
 
-        return found
+        return {name: None}
 
     def set_option_result_function(self, function_inst):
         """
@@ -2367,6 +2626,7 @@ class Process(object):
 
         if self.option_settings:
             self.option_settings.clear()
+            self._invalidate_option_index()
 
     def save_default_option_history(self):
         option_file = self.get_option_file()
@@ -2389,6 +2649,16 @@ class Process(object):
 
     # --- manifest
 
+    def _get_parsed_manifest(self, manifest_file=None):
+
+        if not manifest_file:
+            manifest_file = self.get_manifest_file()
+
+        if manifest_file not in self._manifests:
+            self._manifests[manifest_file] = ProcessManifest(manifest_file)
+
+        return self._manifests[manifest_file].update()
+
     def get_manifest(self, manifest_file=None):
         """
         Returns:
@@ -2397,44 +2667,12 @@ class Process(object):
             States contains the enabled/disabled state of the script.
         """
 
-        if not manifest_file:
-            manifest_file = self.get_manifest_file()
+        manifest = self._get_parsed_manifest(manifest_file)
 
-        if not util_file.exists(manifest_file):
-            return None, None
-
-        lines = util_file.get_file_lines(manifest_file)
-        if not lines:
+        if manifest.scripts is None:
             return None, None
 
-        scripts = []
-        states = []
-
-        for line in lines:
-
-            if not line:
-                continue
-
-            states.append(False)
-
-            split_line = line.split()
-            if len(split_line):
-                script_name = ' '.join(split_line[:-1])
-
-                scripts.append(script_name)
-
-            if len(split_line) >= 2:
-                # TODO: remove eventually - this is because of pyside6 conversion bug. leave in code for a while just in case.
-                if split_line[-1] == 'CheckState.Checked':
-                    state = 'True'
-                elif split_line[-1] == 'CheckState.UnCheck':
-                    state = 'False'
-
-                state = eval(split_line[-1])
-
-                states[-1] = state
-
-        return scripts, states
+        return list(manifest.scripts), list(manifest.states)
 
     def get_manifest_dict(self, manifest_file=None):
         """
@@ -2442,39 +2680,12 @@ class Process(object):
             dict: name of code : state
         """
 
-        if not manifest_file:
-            manifest_file = self.get_manifest_file()
-
-        manifest_dict = {}
+        manifest = self._get_parsed_manifest(manifest_file)
 
-        if not util_file.is_file(manifest_file):
-            return manifest_dict
-
-        lines = util_file.get_file_lines(manifest_file)
+        if manifest.scripts is None:
+            return {}
 
-        if not lines:
-            return manifest_dict
-
-        for line in lines:
-
-            script_name = None
-
-            if not line:
-                continue
-
-            split_line = line.split()
-
-            if len(split_line):
-                script_name = ' '.join(split_line[:-1])
-
-                manifest_dict[script_name] = False
-
-            if len(split_line) >= 2 and script_name:
-                state = eval(split_line[-1])
-
-                manifest_dict[script_name] = state
-
-        return manifest_dict
+        return dict(zip(manifest.scripts, manifest.states))
 
     def get_manifest_folder(self):
         """
@@ -2564,18 +2775,9 @@ class Process(object):
 
     def is_in_manifest(self, entry):
 
-        filename = self.get_manifest_file()
-
-        lines = util_file.get_file_lines(filename)
-
-        for line in lines:
-
-            split_line = line.split(' ')
-
-            if split_line[0] == entry:
-                return True
+        manifest = self._get_parsed_manifest()
 
-        return False
+        return entry in manifest.script_index
 
     def get_manifest_history(self):
 
@@ -2621,18 +2823,19 @@ class Process(object):
             lines.append(line)
 
         result = util_file.write_lines(manifest_file, lines, append=append)
+
+        if manifest_file in self._manifests:
+            self._manifests[manifest_file].clear()
+
         return result
 
     def has_script(self, script_name):
         if not script_name.endswith('.py'):
             script_name = script_name + '.py'
 
-        scripts, states = self.get_manifest()
-
-        if script_name in scripts:
-            return True
+        manifest = self._get_parsed_manifest()
 
-        return False
+        return script_name in manifest.script_index
 
     def get_script_parent(self, script_name):
 
@@ -2717,15 +2920,13 @@ class Process(object):
         if not script_name.endswith('.py'):
             script_name = script_name + '.py'
 
-        scripts, states = self.get_manifest()
+        manifest = self._get_parsed_manifest()
 
-        if scripts is None and states is None:
+        if manifest.scripts is None:
             return False
 
-        for script, state in zip(scripts, states):
-
-            if script == script_name:
-                return state
+        if script_name in manifest.script_index:
+            return manifest.states[manifest.script_index[script_name]]
 
     def set_script_state(self, script_name, bool_value):
         if not script_name.endswith('.py'):
@@ -2977,6 +3178,8 @@ class Process(object):
                 util.error('%s\n' % status)
                 raise Exception('Script did not source. %s' % script)
 
+        main_time = 0.0
+
         if init_passed:
             try:
 
@@ -2986,7 +3189,9 @@ class Process(object):
                         # for legacy, if process was set to None override it with this process
                         module.process = self
 
+                    main_start = time.time()
                     result = module.main()
+                    main_time = time.time() - main_start
                     put = None
                     if self._data_override:
                         put = self._data_override._put
@@ -3017,6 +3222,14 @@ class Process(object):
 
         minutes, seconds = watch.end()
 
+        timing = util_file.SourceCache.timings.get(script)
+        if timing and init_passed:
+            compile_message = '%s seconds' % round(timing['compile'], 3)
+            if timing['cached']:
+                compile_message = 'cached'
+
+            util.show('Compile: %s\tRun: %s seconds' % (compile_message, round(timing['run'] + main_time, 3)))
+
         util.global_tabs = 1
 
         message = ''
@@ -3108,7 +3321,7 @@ class Process(object):
                 message = 'Script: %s in run_script_group.' % script
 
                 temp_log = '\nError: %s' % message
-                util.record_temp_log(temp_log)
+                util.record_temp_log(temp_log, 'error')
 
                 raise Exception(message)
 
@@ -3137,7 +3350,7 @@ class Process(object):
                     message = 'The script group was cancelled before finishing.'
 
                     temp_log = '\nError: %s' % message
-                    util.record_temp_log(temp_log)
+                    util.record_temp_log(temp_log, 'error')
 
                     raise Exception(message)
 
@@ -3190,7 +3403,7 @@ class Process(object):
                         message = 'Script: %s in run_script_group.' % script
 
                         temp_log = '\nError: %s' % message
-                        util.record_temp_log(temp_log)
+                        util.record_temp_log(temp_log, 'error')
 
                         raise Exception(message)
 
@@ -3240,6 +3453,8 @@ class Process(object):
 
         self.option_settings = None
         self._setup_options()
+        self.option_reads = 0
+        self.option_parses = 0
 
         prev_process = os.environ.get('VETALA_CURRENT_PROCESS')
 
@@ -3380,6 +3595,8 @@ class Process(object):
         if minutes is not None:
             util.show('\n\n\nProcess: %s\nPath: %s\nbuilt in %s minutes, %s seconds.\n\n' % (self.get_basename(), self.get_path(), minutes, seconds))
 
+        log.debug('Option reads: %s, parsed: %s' % (self.option_reads, self.option_parses))
+
         util.set_env('VETALA_CURRENT_PROCESS', prev_process)
 
         if manage_node_editor_inst:
@@ -3614,114 +3831,340 @@ def copy(source_file_or_folder, target_file_or_folder, description=''):
         version.save('Copied from %s' % source_file_or_folder)
 
 
-def copy_process(source_process, target_directory=None):
+class ProcessCopy(object):
     """
-    source process is an instance of a process that you want to copy
-    target_process is the instance of a process you want to copy to.
-    If no target_process is specified, the target process will be set to the directory where the source process is located automatically.
-    If there is already a process named the same in the target process, the name will be incremented.
-    If you need to give the copy a specific name, you should rename it after copy.
+    Copy a process by planning every file first and then copying the files on a pool of threads.
+    Version history is left behind, copied data, code and ramen files get a new 'Copied from' version like copy_process did.
+    Set VETALA_COPY_WORKERS to change the number of copy threads.
 
     Args:
-        source_process (instance): The instance of a process.
-        target_directory (str): TODO: Fill description.
+        source_process (Process): The process to copy.
+        target_directory (str): The directory to copy into. Defaults to the directory of the source process.
     """
 
-    if target_directory:
-        parent_directory = util_file.get_dirname(target_directory)
+    workers = 8
+    skip_folders = ['.version', '.backup']
 
-        if parent_directory:
-            if parent_directory == source_process.get_path():
-                util.error('Cannot paste parent under child.  Causes recursion error')
-                return
+    def __init__(self, source_process, target_directory=None):
 
-    sub_folders = source_process.get_sub_processes()
+        self.source_process = source_process
+        self.target_directory = target_directory
 
-    source_name = source_process.get_name()
-    source_name = source_name.split('/')[-1]
+        self.new_name = None
+        self.processes = []
+        self.folders = []
+        self.files = []
+        self.versions = []
 
-    if not target_directory:
-        target_directory = util_file.get_dirname(source_process.get_path())
+        self.total_bytes = 0
+        self.copied_bytes = 0
+        self.copied_files = 0
+        self.errors = []
 
-    if not util_file.has_permission(target_directory):
-        util.warning('Could not get permission in directory: %s' % target_directory)
-        return
+        self.progress_callback = None
 
-    new_name = get_unused_process_name(target_directory, source_name)
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
 
-    new_process = Process()
-    new_process.set_directory(target_directory)
-    new_process.load(new_name)
-    new_process.create()
+    def _get_workers(self):
+        workers = os.environ.get('VETALA_COPY_WORKERS')
 
-    data_folders = source_process.get_data_folders()
-    code_folders = source_process.get_code_names(include_scripts=True)
-    settings = source_process.get_setting_names()
-    ramens = source_process.get_ramen_graphs()
+        try:
+            workers = int(workers)
+        except (TypeError, ValueError):
+            workers = self.workers
 
-    if util.in_maya:
-        progress = core.ProgressBar()
+        return max(1, workers)
 
-    data_count = len(data_folders)
+    def _add_file(self, source, target):
+        size = os.path.getsize(source)
+        self.files.append((source, target, size))
+        self.total_bytes += size
 
-    if data_count:
-        if util.in_maya:
-            progress.set_count(len(data_folders))
-
-        for data_folder in data_folders:
-            if util.in_maya:
-                progress.status('Copying Data: %s' % data_folder)
-                progress.inc()
-            copy_process_data(source_process, new_process, data_folder)
-            if util.in_maya:
-                if progress.break_signaled():
-                    progress.end()
-                    return
+    def _add_tree(self, source_folder, target_folder, data_folder=False):
 
-    manifest_found = False
+        if not util_file.is_dir(source_folder):
+            return
+
+        for root, folders, files in os.walk(source_folder):
+
+            folders[:] = [folder for folder in folders
+                          if folder not in self.skip_folders and
+                          not (data_folder and folder.startswith('.') and folder != '.sub')]
+
+            relative = os.path.relpath(root, source_folder)
+            target_root = os.path.normpath(os.path.join(target_folder, relative))
+
+            self.folders.append(target_root)
+
+            for filename in files:
+                self._add_file(os.path.join(root, filename), os.path.join(target_root, filename))
+
+    def _add_version(self, source_file, source_path, target_path):
+
+        if not source_file or not util_file.exists(source_file):
+            return
+
+        target_file = os.path.normpath(os.path.join(target_path, os.path.relpath(source_file, source_path)))
+        self.versions.append((target_file, 'Copied from %s' % source_file))
 
-    if code_folders:
-        if 'manifest' in code_folders:
-            code_folders.remove('manifest')
-            manifest_found = True
+    def _add_data_versions(self, source_folder, source_path, target_path, code=False):
 
-        code_count = len(code_folders)
-        if code_count:
-            if util.in_maya:
-                progress.set_count(len(code_folders))
-                progress.inc(0)
+        if not util_file.is_dir(source_folder):
+            return
+
+        for root, folders, files in os.walk(source_folder):
+
+            folders[:] = [folder for folder in folders if not folder.startswith('.')]
+
+            if 'data.json' not in files or root == source_folder:
+                continue
+
+            data_folder = data.DataFolder(util_file.get_basename(root), util_file.get_dirname(root))
+            instance = data_folder.get_folder_data_instance()
+
+            if not instance:
+                continue
+
+            if code:
+                self._add_version(instance.get_file(), source_path, target_path)
+                continue
+
+            self._add_version(instance.get_file_direct(), source_path, target_path)
+
+            sub_path = util_file.join_path(root, '.sub')
+            if util_file.is_dir(sub_path):
+                for sub_folder in util_file.get_folders(sub_path):
+                    self._add_version(instance.get_file_direct(sub_folder), source_path, target_path)
+
+    def _plan_process(self, source_process, target_directory, name):
+
+        source_path = source_process.get_path()
+        target_path = util_file.join_path(target_directory, name)
+
+        self.processes.append((target_directory, name))
+
+        data_path = source_process.get_data_path(in_folder=False)
+        code_path = source_process.get_code_path()
+        ramen_path = source_process.get_ramen_path()
+
+        for folder, is_data in ((data_path, True), (code_path, False), (ramen_path, False)):
+            if not folder:
+                continue
+            target_folder = os.path.join(target_path, os.path.relpath(folder, source_path))
+            self._add_tree(folder, target_folder, is_data)
+
+        self._add_data_versions(data_path, source_path, target_path)
+        self._add_data_versions(code_path, source_path, target_path, code=True)
+
+        for graph in source_process.get_ramen_graphs() or []:
+            self._add_version(source_process.get_ramen_file(graph), source_path, target_path)
+
+        for setting in source_process.get_setting_names():
+            filepath = source_process.get_setting_file(setting)
+            if filepath and util_file.is_file(filepath):
+                self._add_file(filepath, os.path.join(target_path, os.path.relpath(filepath, source_path)))
+
+        for sub_folder in source_process.get_sub_processes():
+            self._plan_process(source_process.get_sub_process(sub_folder), target_path, sub_folder)
+
+    def _copy_file(self, source, target, size):
+
+        if self._cancel.is_set():
+            return False
+
+        try:
+            shutil.copyfile(source, target)
+        except (IOError, OSError) as error:
+            with self._lock:
+                self.errors.append('%s: %s' % (source, error))
+            return False
 
-            for code_folder in code_folders:
-                if util.in_maya:
-                    progress.status('Copying Code: %s' % code_folder)
+        with self._lock:
+            self.copied_bytes += size
+            self.copied_files += 1
+
+        return True
+
+    def _save_version(self, filepath, comment):
+
+        if self._cancel.is_set():
+            return
+
+        version = util_file.VersionFile(filepath)
+        version.save(comment)
+
+    def _run_pool(self, function, jobs, progress=None):
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._get_workers()) as executor:
+
+            futures = [executor.submit(function, *job) for job in jobs]
+
+            for future in concurrent.futures.as_completed(futures):
+                # jobs cancelled below still come back here
+                if future.cancelled():
+                    continue
+
+                future.result()
+
+                if self.progress_callback:
+                    self.progress_callback(self.copied_bytes, self.total_bytes)
+
+                if progress:
+                    progress.status('Copying process: %s of %s MB' % (self.copied_bytes // 1048576,
+                                                                      self.total_bytes // 1048576))
                     progress.inc()
-                copy_process_code(source_process, new_process, code_folder)
-                if util.in_maya:
                     if progress.break_signaled():
-                        progress.end()
-                        return
+                        self.cancel()
 
-    if util.in_maya:
-        progress.end()
+                if self._cancel.is_set():
+                    for other_future in futures:
+                        other_future.cancel()
 
-    for sub_folder in sub_folders:
+    def plan(self):
+        """
+        Find every file to copy without copying anything.
 
-        sub_process = new_process.get_sub_process(sub_folder)
-        source_sub_process = source_process.get_sub_process(sub_folder)
+        Returns:
+            int: The total number of bytes to copy.
+        """
 
-        if not sub_process.is_process():
-            copy_process(source_sub_process, new_process.get_path())
+        source_name = self.source_process.get_name()
+        source_name = source_name.split('/')[-1]
 
-    if manifest_found:
-        copy_process_code(source_process, new_process, 'manifest')
+        if not self.target_directory:
+            self.target_directory = util_file.get_dirname(self.source_process.get_path())
 
-    for setting in settings:
-        copy_process_setting(source_process, new_process, setting)
+        self.new_name = get_unused_process_name(self.target_directory, source_name)
+
+        self.processes = []
+        self.folders = []
+        self.files = []
+        self.versions = []
+        self.total_bytes = 0
+
+        self._plan_process(self.source_process, self.target_directory, self.new_name)
+
+        return self.total_bytes
+
+    def report(self):
+        util.show('Copy %s to %s: %s files, %s folders, %s MB' % (self.source_process.get_path(),
+                                                                  util_file.join_path(self.target_directory,
+                                                                                      self.new_name),
+                                                                  len(self.files),
+                                                                  len(self.folders),
+                                                                  round(self.total_bytes / 1048576.0, 2)))
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def run(self):
+        """
+        Copy the planned files, planning first if needed.
+
+        Returns:
+            Process: The new process, or None if the copy was cancelled.
+        """
+
+        if not self.new_name:
+            self.plan()
+
+        self.report()
+
+        watch = util.StopWatch()
+        watch.start('Copy process', feedback=False)
+
+        for directory, name in self.processes:
+            process_inst = Process()
+            process_inst.set_directory(directory)
+            process_inst.load(name)
+            process_inst.create()
+
+        for folder in self.folders:
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+        progress = None
+        if util.in_maya:
+            progress = core.ProgressBar('Copying process', len(self.files) + len(self.versions))
+
+        self._run_pool(self._copy_file, self.files, progress)
+
+        if not self._cancel.is_set():
+            self._run_pool(self._save_version, self.versions, progress)
+
+        if progress:
+            progress.end()
+
+        for source, target, size in self.files:
+            if target in util_file.SettingsFile.__cache_settings__:
+                util_file.SettingsFile.__cache_settings__.pop(target)
+
+        ProcessDirectoryIndex.remove(self.target_directory)
+
+        for error in self.errors:
+            util.warning('Could not copy %s' % error)
+
+        minutes, seconds = watch.end()
+
+        if self._cancel.is_set():
+            util.warning('Process copy cancelled after %s of %s files.' % (self.copied_files, len(self.files)))
+            return
+
+        util.show('Copied %s files, %s MB in %s seconds' % (self.copied_files,
+                                                            round(self.copied_bytes / 1048576.0, 2),
+                                                            seconds))
+
+        new_process = Process()
+        new_process.set_directory(self.target_directory)
+        new_process.load(self.new_name)
+
+        return new_process
+
+
+def copy_process(source_process, target_directory=None, dry_run=False):
+    """
+    source process is an instance of a process that you want to copy
+    target_process is the instance of a process you want to copy to.
+    If no target_process is specified, the target process will be set to the directory where the source process is located automatically.
+    If there is already a process named the same in the target process, the name will be incremented.
+    If you need to give the copy a specific name, you should rename it after copy.
+
+    Args:
+        source_process (instance): The instance of a process.
+        target_directory (str): The directory to copy the process into.
+        dry_run (bool): Only plan the copy and report its size.
+
+    Returns:
+        Process: The new process. With dry_run, the planned ProcessCopy instead.
+    """
+
+    if target_directory:
+        parent_directory = util_file.get_dirname(target_directory)
+
+        if parent_directory:
+            if parent_directory == source_process.get_path():
+                util.error('Cannot paste parent under child.  Causes recursion error')
+                return
+
+    if not target_directory:
+        target_directory = util_file.get_dirname(source_process.get_path())
+
+    if not util_file.has_permission(target_directory):
+        util.warning('Could not get permission in directory: %s' % target_directory)
+        return
+
+    process_copy = ProcessCopy(source_process, target_directory)
+    process_copy.plan()
 
-    for ramen in ramens:
-        copy_process_ramen(source_process, new_process, ramen)
+    if dry_run:
+        process_copy.report()
+        return process_copy
 
-    return new_process
+    return process_copy.run()
 
 
 def copy_process_into(source_process, target_process, merge_sub_folders=False):
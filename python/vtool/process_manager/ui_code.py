@@ -1,8 +1,6 @@
 # Copyright (C) 2024 Louis Vottero louis.vot@gmail.com    All rights reserved.
 
 import subprocess
-import re
-import threading
 import os
 
 from .. import qt_ui, qt
@@ -568,7 +566,6 @@ class CodeCompleter(qt_ui.PythonCompleter):
 
         if module_name == 'put':
             found = {}
-            lock = threading.Lock()
 
             if hasattr(self, 'name') and hasattr(self, 'process_inst'):
                 name = self.name
@@ -581,16 +578,14 @@ class CodeCompleter(qt_ui.PythonCompleter):
                     fast_with_less_checks=True
                 )
 
-                threads = []
                 for script in scripts:
                     if script.endswith(check_name):
                         break
-                    thread = threading.Thread(target=get_puts_in_file, args=(script, found, lock))
-                    threads.append(thread)
-                    thread.start()
 
-                for thread in threads:
-                    thread.join()
+                    for value in util_file.SymbolIndex.get_puts(script):
+                        found[value] = None
+
+                util_file.SymbolIndex.save()
 
                 put_value = get_put(text)
                 if put_value:
@@ -611,7 +606,8 @@ class CodeCompleter(qt_ui.PythonCompleter):
             if process_file.endswith('.pyc'):
                 process_file = process_file[:-4] + '.py'
 
-            functions, _ = util_file.get_ast_class_sub_functions(process_file, 'Process')
+            functions, _ = util_file.SymbolIndex.get_class_members(process_file, 'Process')
+            util_file.SymbolIndex.save()
 
             return functions
 
@@ -641,14 +637,13 @@ class CodeCompleter(qt_ui.PythonCompleter):
 
 def get_put(text):
 
-    find = re.findall(r'\bput\.([A-Za-z_]\w*)\s*=', text)
+    find = util_file.SymbolIndex.put_pattern.findall(text)
     return find
 
 
 def get_puts_in_file(filepath, accum_dict, lock):
-    check_text = util_file.get_file_text(filepath)
 
-    put_value = get_put(check_text)
+    put_value = util_file.SymbolIndex.get_puts(filepath)
     if put_value:
         with lock:
             for value in put_value:
@@ -898,30 +898,27 @@ class DataTreeWidget(qt_ui.FileTreeWidget):
 
         for foldername in folders:
 
+            folder_entry = data.DataFolderIndex.get_folder(data_path, foldername)
+            if not folder_entry:
+                continue
+
             item = DataItem()
             item.setSizeHint(0, qt.QtCore.QSize(util.scale_dpi(200), util.scale_dpi(25)))
             item.setText(0, foldername)
 
-            data_file = util_file.join_path(data_path, '%s/data.json' % foldername)
-            old_data_file = util_file.join_path(data_path, '%s/data.type' % foldername)
             folder_path = util_file.join_path(data_path, foldername)
 
-            sub_folder = None
             data_type = None
 
-            if util_file.is_file(data_file):
-
-                sub_folder, data_type = process_tool.get_data_current_sub_folder_and_type(foldername)
-            elif util_file.is_file(old_data_file):
-                sub_folder, data_type = process_tool.get_data_current_sub_folder_and_type(foldername)
-
-            sub_folders = []
+            if 'data.json' in folder_entry['files']:
+                data_type = folder_entry['data_type']
+            elif 'data.type' in folder_entry['files']:
+                data_type = process_tool.get_data_current_sub_folder_and_type(foldername)[1]
 
             if data_type not in data_name_map:
 
                 nice_name = 'Folder'
-                sub_path = util_file.join_path(data_path, foldername)
-                sub_folders = util_file.get_folders(sub_path, recursive=False)
+                sub_folders = folder_entry['folders']
 
                 if sub_folders:
                     temp_item = qt.QTreeWidgetItem(item)
@@ -2217,6 +2214,7 @@ class SaveSkinFileWidget(DataSaveFileWidget):
 
         version_up = qt.QCheckBox('Version Up on Export')
         single_file = qt.QCheckBox('Single File')
+        binary = qt.QCheckBox('Binary Weights')
         blend_weights = qt.QCheckBox('Dual Quat Blend Weights')
         long_names = qt.QCheckBox('Force Long Mesh Names')
 
@@ -2235,6 +2233,7 @@ class SaveSkinFileWidget(DataSaveFileWidget):
         self.export_layout.addWidget(blend_weights)
         self.export_layout.addWidget(version_up)
         self.export_layout.addWidget(single_file)
+        self.export_layout.addWidget(binary)
         self.export_layout.addWidget(long_names)
 
         self.import_layout.addSpacing(5)
@@ -2252,6 +2251,7 @@ class SaveSkinFileWidget(DataSaveFileWidget):
 
         self.version_up = version_up
         self.single_file = single_file
+        self.binary = binary
         self.blend_weights = blend_weights
         self.long_names = long_names
         self.add_at_front = add
@@ -2262,6 +2262,7 @@ class SaveSkinFileWidget(DataSaveFileWidget):
         blend_weights.stateChanged.connect(self._set_blend_weights)
         version_up.stateChanged.connect(self._set_version_up)
         single_file.stateChanged.connect(self._set_single_file)
+        binary.stateChanged.connect(self._set_binary)
         long_names.stateChanged.connect(self._set_long_names)
         add.stateChanged.connect(self._set_add_at_front)
 
@@ -2269,6 +2270,7 @@ class SaveSkinFileWidget(DataSaveFileWidget):
 
         version_up = True
         single_file = False
+        binary = False
         blend_weights = False
         long_names = False
 
@@ -2278,6 +2280,9 @@ class SaveSkinFileWidget(DataSaveFileWidget):
         if self.data_class.settings.has_setting('single file'):
             single_file = self.data_class.settings.get('single file')
 
+        if self.data_class.settings.has_setting('binary'):
+            binary = self.data_class.settings.get('binary')
+
         if self.data_class.settings.has_setting('blend weights'):
             blend_weights = self.data_class.settings.get('blend weights')
 
@@ -2292,12 +2297,13 @@ class SaveSkinFileWidget(DataSaveFileWidget):
                 return
 
         self.data_class.export_data(comment, single_file=single_file, version_up=version_up,
-                                    blend_weights=blend_weights, long_names=long_names)
+                                    blend_weights=blend_weights, long_names=long_names, binary=binary)
         self.file_changed.emit()
 
     def _export_selected_data(self):
         version_up = True
         single_file = False
+        binary = False
         blend_weights = True
         long_names = False
 
@@ -2307,6 +2313,9 @@ class SaveSkinFileWidget(DataSaveFileWidget):
         if self.data_class.settings.has_setting('single file'):
             single_file = self.data_class.settings.get('single file')
 
+        if self.data_class.settings.has_setting('binary'):
+            binary = self.data_class.settings.get('binary')
+
         if self.data_class.settings.has_setting('blend weights'):
             blend_weights = self.data_class.settings.get('blend weights')
 
@@ -2332,7 +2341,8 @@ class SaveSkinFileWidget(DataSaveFileWidget):
                                     single_file=single_file,
                                     version_up=version_up,
                                     blend_weights=blend_weights,
-                                    long_names=long_names)
+                                    long_names=long_names,
+                                    binary=binary)
         self.file_changed.emit()
 
     def _delete_skins(self):
@@ -2383,6 +2393,11 @@ class SaveSkinFileWidget(DataSaveFileWidget):
         if single_file_state:
             self.single_file.setChecked(True)
 
+        binary_state = self.data_class.settings.get('binary')
+
+        if binary_state and not single_file_state:
+            self.binary.setChecked(True)
+
         blend_weight_state = self.data_class.settings.get('blend weights')
 
         if not blend_weight_state and self.data_class.settings.has_setting('blend weights'):
@@ -2420,9 +2435,20 @@ class SaveSkinFileWidget(DataSaveFileWidget):
 
         if state == qt.QtCore.Qt.Checked:
             self.data_class.set_single_file(True)
+            self.binary.setChecked(False)
         else:
             self.data_class.set_single_file(False)
 
+    def _set_binary(self):
+
+        state = self.binary.checkState()
+
+        if state == qt.QtCore.Qt.Checked:
+            self.data_class.set_binary(True)
+            self.single_file.setChecked(False)
+        else:
+            self.data_class.set_binary(False)
+
     def _set_long_names(self):
         state = self.long_names.checkState()
 
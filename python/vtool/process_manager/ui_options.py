@@ -553,32 +553,34 @@ class ProcessOptionPalette(qt_ui.BasicWidget):
             if not util_file.has_permission(self.directory):
                 return
 
-        if clear == True:
-            self._write_all()
+        with self.process_inst.batch_options():
 
-        if clear == False:
+            if clear == True:
+                self._write_all()
 
-            this_widget = self
+            if clear == False:
 
-            item_count = this_widget.child_layout.count()
+                this_widget = self
 
-            for inc in range(0, item_count):
-                item = self.child_layout.itemAt(inc)
-                widget = item.widget()
+                item_count = this_widget.child_layout.count()
+
+                for inc in range(0, item_count):
+                    item = self.child_layout.itemAt(inc)
+                    widget = item.widget()
 
-                widget_type = widget.option_type
+                    widget_type = widget.option_type
 
-                name = self._get_path(widget)
+                    name = self._get_path(widget)
 
-                value = widget.get_value()
+                    value = widget.get_value()
 
-                self.process_inst.add_option(name, value, None, widget_type)
+                    self.process_inst.add_option(name, value, None, widget_type)
 
-            if type(self) is ProcessReferenceGroup:
-                name = self._get_path(self)
-                value = self.get_value()
+                if type(self) is ProcessReferenceGroup:
+                    name = self._get_path(self)
+                    value = self.get_value()
 
-                self.process_inst.add_option(name, value, True, self.option_type)
+                    self.process_inst.add_option(name, value, True, self.option_type)
 
         self.value_change.emit()
 
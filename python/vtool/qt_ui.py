@@ -5931,7 +5931,8 @@ class PythonCompleter(qt.QCompleter):
                         sub_variables = self.current_sub_variables
 
                 if not sub_functions:
-                    result = util_file.get_ast_class_sub_functions(path, sub_part)
+                    result = util_file.SymbolIndex.get_class_members(path, sub_part)
+                    util_file.SymbolIndex.save()
                     if result:
                         sub_functions, sub_variables = result
                         if sub_functions:
@@ -4,6 +4,7 @@ from . import util as util_ramen
 from .. import util, util_file
 from .ui_lib import ui_nodes
 from . import rigs
+from . import rigs_maya
 from .. import unreal_lib
 
 
@@ -61,6 +62,27 @@ def step_ui(node_view):
     node_view.eval_step = increment
 
 
+@util_ramen.decorator_undo('Eval')
+def run_dirty(nodes=None):
+    """
+    Run only the nodes that are dirty, in evaluation order.
+    Without nodes the cached order of all registered nodes is used, so nothing is re-sorted.
+    """
+
+    if nodes is None:
+        nodes = ui_nodes.get_eval_order()
+
+    ran = []
+
+    for node in nodes:
+        if not node.dirty:
+            continue
+        node.run(send_output=False)
+        ran.append(node)
+
+    return ran
+
+
 @util_ramen.decorator_undo('Eval')
 def run(nodes, increment=-1):
 
@@ -72,6 +94,9 @@ def run(nodes, increment=-1):
 
     visited = {}
 
+    if util.in_maya:
+        rigs_maya.RigSetIndex.clear()
+
     util.show('\nRunning Items ------------------------------\n')
 
     if increment == -1:
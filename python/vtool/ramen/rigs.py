@@ -1,5 +1,7 @@
 # Copyright (C) 2024 Louis Vottero louis.vot@gmail.com    All rights reserved.
 
+import contextlib
+
 from . import util as ramen_util
 
 from vtool import util
@@ -37,6 +39,53 @@ class RigState(object):
     CREATED = 2
 
 
+class RigEdit(object):
+    """
+    Rigs whose attributes were set inside an edit() block and still need a rebuild.
+    """
+    depth = 0
+    rigs = []
+
+    @classmethod
+    def add(cls, rig):
+        if rig not in cls.rigs:
+            cls.rigs.append(rig)
+
+    @classmethod
+    def discard(cls, rig):
+        if rig in cls.rigs:
+            cls.rigs.remove(rig)
+
+
+@contextlib.contextmanager
+def edit():
+    """
+    Attribute sets inside the with block do not rebuild their rig right away.
+    Each edited rig is created once when the outermost block ends, unless it was created inside the block after its last edit.
+    Blocks can be nested. If a block raises, the rebuilds queued inside it are dropped.
+    Rebuilds queued by an outer block before it are kept.
+    """
+    RigEdit.depth += 1
+
+    queued = list(RigEdit.rigs)
+    edited = []
+
+    try:
+        yield
+    except:
+        RigEdit.rigs = [rig for rig in RigEdit.rigs if rig in queued]
+        raise
+    finally:
+        RigEdit.depth -= 1
+
+        if not RigEdit.depth:
+            edited = RigEdit.rigs
+            RigEdit.rigs = []
+
+    for rig in edited:
+        rig.create()
+
+
 class Attributes(object):
 
     def __init__(self):
@@ -393,7 +442,10 @@ class Rig(Base):
                         setattr(self.rig_util, input_entry, value)
                     else:
                         if in_maya:
-                            self.create()
+                            if RigEdit.depth:
+                                RigEdit.add(self)
+                            else:
+                                self.create()
                         if in_unreal:
                             if self.rig_util.is_built():
                                 self.rig_util._set_attr_on_function(input_entry_name, value)
@@ -457,6 +509,15 @@ class Rig(Base):
             return self.rig_util.is_built()
         return False
 
+    def updates_in_place(self, attribute_name):
+        """
+        Returns:
+            bool: True if setting attribute_name edits the built rig in place, so the rig does not need to be created again.
+        """
+        if self.has_rig_util():
+            return self.rig_util.updates_in_place(attribute_name)
+        return False
+
     def has_rig_util(self):
         if self.rig_util:
             return True
@@ -471,6 +532,8 @@ class Rig(Base):
 
     def create(self):
 
+        RigEdit.discard(self)
+
         if self.state == RigState.CREATED:
             if self.rig_util and self.rig_util.is_built():
                 return
@@ -497,6 +560,8 @@ class Rig(Base):
     def delete(self):
         util.show('\tDeleting Rig %s' % self.__class__.__name__)
 
+        RigEdit.discard(self)
+
         if self.rig_util and not self.rig_util.is_valid():
             self.load()
 
@@ -690,6 +755,9 @@ class PlatformUtilRig(object):
     def is_built(self):
         return
 
+    def updates_in_place(self, attribute_name):
+        return False
+
     def delete(self):
         pass
 
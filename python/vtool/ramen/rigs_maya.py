@@ -215,6 +215,126 @@ class Control(object):
                 cmds.scale(x, y, z, components, relative=True)
 
 
+class RigSetIndex(object):
+    """
+    Scene index of ramen rig sets by ramen_uuid, with the controls and joints connected to each set.
+    Built from one ls the first time a rig looks up its set, then kept up to date as MayaUtil creates, renames, fills and deletes sets.
+    Controls and joints are read from the set the first time they are asked for.
+    eval.run clears it so each evaluation starts from the scene.
+    """
+    sets = None
+    set_names = set()
+
+    @classmethod
+    def _list_sets(cls):
+        found = cmds.ls('*.ramen_uuid', objectsOnly=True, recursive=True)
+        if not found:
+            return []
+
+        return cmds.ls(found, type='objectSet') or []
+
+    @classmethod
+    def _build(cls, set_names=None):
+
+        if set_names is None:
+            set_names = cls._list_sets()
+
+        cls.sets = {}
+        cls.set_names = set(set_names)
+
+        for set_name in set_names:
+            ramen_uuid = cmds.getAttr('%s.ramen_uuid' % set_name)
+
+            # the first set listed wins, like the scene search did
+            if not ramen_uuid or ramen_uuid in cls.sets:
+                continue
+
+            cls.sets[ramen_uuid] = {'set': set_name, 'control': None, 'joint': None}
+
+    @classmethod
+    def get_set(cls, ramen_uuid):
+        """
+        Returns:
+            str: The rig set tagged with ramen_uuid, or None.
+        """
+
+        if cls.sets is None:
+            cls._build()
+
+        entry = cls.sets.get(ramen_uuid)
+
+        if entry and cmds.objExists(entry['set']):
+            return entry['set']
+
+        # missing or gone, only build again if sets were added, renamed or deleted outside the index
+        set_names = cls._list_sets()
+
+        if set(set_names) != cls.set_names:
+            cls._build(set_names)
+            entry = cls.sets.get(ramen_uuid)
+
+            if entry:
+                return entry['set']
+
+    @classmethod
+    def get_members(cls, ramen_uuid, set_name, attribute_name):
+        """
+        Args:
+            attribute_name (str): 'control' or 'joint', the multi message on the set.
+
+        Returns:
+            list: The nodes connected to the multi message.
+        """
+        entry = None
+        if cls.sets is not None:
+            entry = cls.sets.get(ramen_uuid)
+
+        if entry and entry['set'] == set_name and entry[attribute_name] is not None:
+            return list(entry[attribute_name])
+
+        members = attr.get_multi_message(set_name, attribute_name)
+
+        if entry and entry['set'] == set_name:
+            entry[attribute_name] = list(members)
+
+        return members
+
+    @classmethod
+    def add(cls, ramen_uuid, set_name):
+        if cls.sets is None:
+            return
+
+        entry = cls.sets.get(ramen_uuid)
+
+        if entry:
+            cls.set_names.discard(entry['set'])
+
+        cls.sets[ramen_uuid] = {'set': set_name, 'control': None, 'joint': None}
+        cls.set_names.add(set_name)
+
+    @classmethod
+    def reset_members(cls, ramen_uuid):
+        if not cls.sets or ramen_uuid not in cls.sets:
+            return
+
+        entry = cls.sets[ramen_uuid]
+        entry['control'] = None
+        entry['joint'] = None
+
+    @classmethod
+    def remove(cls, ramen_uuid):
+        if not cls.sets or ramen_uuid not in cls.sets:
+            return
+
+        entry = cls.sets.pop(ramen_uuid)
+        cls.set_names.discard(entry['set'])
+
+    @classmethod
+    def clear(cls):
+        cls.sets = None
+        cls.set_names = set()
+
+
 class MayaUtil(rigs.PlatformUtilRig):
 
     def __init__(self):
@@ -238,6 +358,7 @@ class MayaUtil(rigs.PlatformUtilRig):
             if set_name != self.set:
                 new_name = cmds.rename(self.set, set_name)
                 self.set = new_name
+                RigSetIndex.add(self.rig.uuid, self.set)
 
             return
 
@@ -260,6 +381,8 @@ class MayaUtil(rigs.PlatformUtilRig):
 
         cmds.setAttr('%s.ramen_uuid' % self.set, self.rig.uuid, type='string')
 
+        RigSetIndex.add(self.rig.uuid, self.set)
+
     def _add_to_set(self, nodes):
 
         if not self.set:
@@ -436,7 +559,7 @@ class MayaUtilRig(MayaUtil):
 
     def _get_set_controls(self):
 
-        controls = attr.get_multi_message(self.set, 'control')
+        controls = RigSetIndex.get_members(self.rig.uuid, self.set, 'control')
 
         self._controls = controls
         self.rig.attr.set('controls', controls)
@@ -533,7 +656,7 @@ class MayaUtilRig(MayaUtil):
                      *identity_matrix, type="matrix")
 
     def _get_unbuild_joints(self):
-        return attr.get_multi_message(self.set, 'joint')
+        return RigSetIndex.get_members(self.rig.uuid, self.set, 'joint')
 
     def _build_rig(self, joints):
         return
@@ -653,6 +776,8 @@ class MayaUtilRig(MayaUtil):
         for control in self._controls:
             attr.append_multi_message(self.set, 'control', control)
 
+        RigSetIndex.reset_members(self.rig.uuid)
+
         self.rig.attr.set('controls', self._controls)
 
     def is_valid(self):
@@ -668,6 +793,22 @@ class MayaUtilRig(MayaUtil):
         # Maya needs to rebuild a bunch of nodes, etc
         # return self.is_valid()
 
+    def updates_in_place(self, attribute_name):
+        """
+        Cosmetic attributes, ones that do not affect the rig outputs and have a property here like color and shape,
+        are applied to the built controls. Anything else, like joints or parent, needs a rebuild.
+        """
+        if self.rig.attr.affects_output(attribute_name):
+            return False
+
+        if not isinstance(getattr(type(self), attribute_name, None), property):
+            return False
+
+        if not self._controls:
+            return False
+
+        return self.is_valid()
+
     @property
     def parent(self):
         return self.rig.attr.get('parent')
@@ -751,19 +892,10 @@ class MayaUtilRig(MayaUtil):
     def load(self):
         super(MayaUtilRig, self).load()
 
-        self.set = None
-        sets = cmds.ls(type='objectSet')
-
-        for set_name in sets:
-            if not core.exists('%s.ramen_uuid' % set_name):
-                continue
-
-            ramen_uuid = cmds.getAttr('%s.ramen_uuid' % set_name)
+        self.set = RigSetIndex.get_set(self.rig.uuid)
 
-            if ramen_uuid == self.rig.uuid:
-                self.set = set_name
-                self._get_set_controls()
-                break
+        if self.set:
+            self._get_set_controls()
 
         self.rig.state = rigs.RigState.LOADED
 
@@ -777,6 +909,7 @@ class MayaUtilRig(MayaUtil):
             return
 
         attr.fill_multi_message(self.set, 'joint', joints)
+        RigSetIndex.reset_members(self.rig.uuid)
 
         self._build_rig(joints)
 
@@ -807,6 +940,7 @@ class MayaUtilRig(MayaUtil):
 
             attr.clear_multi(self.set, 'joint')
             attr.clear_multi(self.set, 'control')
+            RigSetIndex.reset_members(self.rig.uuid)
 
             result = core.remove_non_existent(self._mult_matrix_nodes)
             if result:
@@ -854,6 +988,8 @@ class MayaUtilRig(MayaUtil):
             cmds.delete(self.set)
         self.set = None
 
+        RigSetIndex.remove(self.rig.uuid)
+
     def get_name(self, prefix=None, description=None):
 
         side = self.rig.attr.get('side')
@@ -2255,7 +2391,7 @@ class MayaFootRollRig(MayaUtilRig):
         attr.connect_equal_condition('%s.switch' % self._pass_joints[0], '%s.visibility' % self._controls[0], vis_values[1])
 
     def _get_unbuild_joints(self):
-        joints = attr.get_multi_message(self.set, 'joint')
+        joints = RigSetIndex.get_members(self.rig.uuid, self.set, 'joint')
         if joints:
             return joints[1:]
 
@@ -2575,6 +2711,8 @@ class MayaAimMultiAtCurveRig(MayaUtilRig):
         for control in controls:
             attr.append_multi_message(self.set, 'control', control)
 
+        RigSetIndex.reset_members(self.rig.uuid)
+
         self.rig.attr.set('controls', self._controls_aim)
 
     def _get_controls_to_parent(self, controls):
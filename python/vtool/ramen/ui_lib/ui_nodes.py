@@ -744,6 +744,7 @@ class NodeView(object):
 
         source_socket.lines.append(line)
         target_socket.lines.append(line)
+        invalidate_eval_order()
 
         line_count = len(source_socket.lines)
         line.number = line_count
@@ -2881,6 +2882,7 @@ class NodeSocket(AttributeItem):
     def add_line(self, line_item):
 
         self.lines.append(line_item)
+        invalidate_eval_order()
 
         self.update_line_count(line_item)
         self.check_draw_number()
@@ -2895,6 +2897,8 @@ class NodeSocket(AttributeItem):
             if line_item in self.lines:
                 self.lines.remove(line_item)
 
+            invalidate_eval_order()
+
         self.check_draw_number()
 
     def remove_line(self, line_item):
@@ -2913,6 +2917,7 @@ class NodeSocket(AttributeItem):
                 self.lines.remove(line_item)
 
             removed = True
+            invalidate_eval_order()
 
         if removed:
             scene = self.graphic.scene()
@@ -3221,6 +3226,7 @@ class NodeLine(object):
 
             source_socket.lines.append(self)
             target_socket.lines.append(self)
+            invalidate_eval_order()
 
             line_count = len(source_socket.lines)
             self.number = line_count
@@ -3252,6 +3258,7 @@ class NodeLine(object):
 
 
 __nodes__ = {}
+__eval_order__ = None
 
 
 class GraphicsItem(LibGraphicsItem):
@@ -3567,6 +3574,7 @@ class NodeItem(object):
         self._build_items()
 
         __nodes__[self.uuid] = self
+        invalidate_eval_order()
 
     def __getattribute__(self, item):
         if item == 'run':
@@ -3676,6 +3684,7 @@ class NodeItem(object):
             widget.value = value
 
     def _disconnect_lines(self):
+        invalidate_eval_order()
         other_sockets = {}
 
         for name in self._in_sockets:
@@ -3759,36 +3768,44 @@ class NodeItem(object):
                     node.rig.set_attr(socket.name, value)
 
     def _dirty_outputs(self):
-        if self.rig.has_rig_util() and in_unreal:
-            return
+        """
+        Mark every node downstream of this one dirty.
+        Only connections into sockets that affect the target rig's output are followed.
 
-        sockets = self._out_sockets
+        Returns:
+            set: The nodes that were marked dirty.
+        """
+        dirty_nodes = set()
 
-        self._visited_nodes = []
+        if self.rig.has_rig_util() and in_unreal:
+            return dirty_nodes
 
-        if sockets:
+        stack = [self]
 
-            for socket_name in sockets:
-                self._dirty_out_connection(socket_name)
+        while stack:
+            node = stack.pop()
 
-    def _dirty_out_connection(self, socket_name):
-        output_sockets = self.get_outputs(socket_name)
+            for socket_name in node._out_sockets:
+                for socket in node.get_outputs(socket_name):
+                    if not socket:
+                        continue
 
-        for socket in output_sockets:
-            if not socket:
-                continue
+                    out_node = socket.get_parent()
+                    if out_node in dirty_nodes:
+                        continue
 
-            node = socket.get_parent()
-            if node in self._visited_nodes:
-                continue
+                    if not out_node.rig.attr.affects_output(socket.name):
+                        continue
 
-            node_socket_name = socket.name
+                    out_node.dirty = True
+                    dirty_nodes.add(out_node)
 
-            if node.rig.attr.affects_output(node_socket_name):
-                node.dirty = True
-                node._dirty_outputs()
+                    if out_node.rig.has_rig_util() and in_unreal:
+                        continue
 
-            self._visited_nodes.append(node)
+                    stack.append(out_node)
+
+        return dirty_nodes
 
     def _track_socket(self, socket):
         self._custom_sockets.append(socket)
@@ -4272,34 +4289,35 @@ class NodeItem(object):
         if self.graphic:
             self.graphic.set_running(True)
 
-        if run_inputs:
-            self.run_inputs()
+        # attribute sets on this rig and on the outputs rebuild each rig once
+        with rigs.edit():
+            if run_inputs:
+                self.run_inputs()
 
-        self._implement_run(socket)
-        if self.graphic:
-            self.graphic.set_running(False)
+            self._implement_run(socket)
+            if self.graphic:
+                self.graphic.set_running(False)
 
-        if not auto_update:
-            run_outputs = False
+            if not auto_update:
+                run_outputs = False
 
-        if send_output:
-            if run_outputs:
-                items = _get_nodes()
-                nodes = get_node_eval_order(items)
+            if send_output:
+                if run_outputs:
 
-                run_output = False
+                    run_output = False
 
-                if socket:
-                    self._set_output_values()
-                    if self.rig.attr.affects_output(socket):
-                        run_output = True
+                    if socket:
+                        self._set_output_values()
+                        if self.rig.attr.affects_output(socket):
+                            run_output = True
 
-                if run_output:
-                    self._dirty_outputs()
+                    if run_output:
+                        dirty_nodes = self._dirty_outputs()
 
-                    for node in nodes:
-                        if node.dirty:
-                            node.run(send_output=False)
+                        if dirty_nodes:
+                            for node in get_eval_order():
+                                if node in dirty_nodes and node.dirty:
+                                    node.run(send_output=False)
 
         if socket:
             util.show('\tDone: %s.%s' % (self.__class__.__name__, socket))
@@ -4355,13 +4373,14 @@ class NodeItem(object):
         if self.graphic:
             self.graphic.setPos(qt.QtCore.QPointF(position[0], position[1]))
 
-        for widget_name in item_dict['widget_value']:
-            value = item_dict['widget_value'][widget_name]['value']
-            widget = self.get_widget(widget_name)
+        with rigs.edit():
+            for widget_name in item_dict['widget_value']:
+                value = item_dict['widget_value'][widget_name]['value']
+                widget = self.get_widget(widget_name)
 
-            self._set_widget_socket(widget_name, value, widget)
+                self._set_widget_socket(widget_name, value, widget)
 
-            self.rig.attr.set(widget_name, value)
+                self.rig.attr.set(widget_name, value)
 
         if 'custom_sockets' in item_dict:
             for socket_name in item_dict['custom_sockets']:
@@ -5502,7 +5521,7 @@ class RigItem(NodeItem):
             self.rig.dirty = True
             update_socket_value(socket, update_rig=True)
 
-            if not self.rig.is_built():
+            if not self.rig.is_built() and not self.rig.updates_in_place(socket.name):
                 self.load_rig()
                 self.rig.create()
                 self.rig.set_layer(self.layer)
@@ -6052,6 +6071,9 @@ def _get_nodes():
         if node_inst.invalid:
             duplicate_nodes.pop(node)
 
+    if len(duplicate_nodes) != len(__nodes__):
+        invalidate_eval_order()
+
     __nodes__ = duplicate_nodes
 
     return __nodes__.values()
@@ -6061,6 +6083,7 @@ def _clear_nodes():
     global __nodes__
 
     __nodes__ = {}
+    invalidate_eval_order()
     return __nodes__
 
 
@@ -6068,10 +6091,36 @@ def _remove_node(uuid):
 
     global __nodes__
     __nodes__.pop(uuid)
+    invalidate_eval_order()
 
     return __nodes__.values()
 
 
+def invalidate_eval_order():
+    """
+    Drop the cached evaluation order.
+    Call this after any structural edit to the graph, adding or removing nodes or lines.
+    """
+    global __eval_order__
+    __eval_order__ = None
+
+
+def get_eval_order():
+    """
+    Evaluation order of all registered nodes.
+    The order is cached until invalidate_eval_order is called, so value edits do not re-sort the graph.
+
+    Returns:
+        list: Nodes in evaluation order.
+    """
+    global __eval_order__
+
+    if __eval_order__ is None:
+        __eval_order__ = get_node_eval_order(_get_nodes())
+
+    return __eval_order__
+
+
 @util_ramen.decorator_undo('Update Socket')
 def update_socket_value(socket, update_rig=False, eval_targets=False):
 
@@ -6116,6 +6165,8 @@ def connect_socket(source_socket, target_socket, run_target=True):
     util.show('Connect socket %s.%s into %s.%s' % (source_node.name,
                                                    source_socket.name, target_node.name, target_socket.name))
 
+    invalidate_eval_order()
+
     widget = target_node.get_widget(target_socket.name)
     if widget:
         widget.set_title_only(True)
@@ -6184,6 +6235,8 @@ def connect_socket(source_socket, target_socket, run_target=True):
 
 def disconnect_socket(source_socket, target_socket, run_target=True):
 
+    invalidate_eval_order()
+
     if not auto_update:
         return
 
@@ -6672,27 +6725,47 @@ def handle_unreal_bundles(nodes):
 
 
 def post_order(end_nodes, filter_nodes):
+    """
+    Order nodes so every node comes after all of the nodes it feeds.
+    Walks up the input connections from end_nodes. Where a node is reached more than once, its last visit decides its place.
+
+    Args:
+        end_nodes (list): Nodes to start walking up from.
+        filter_nodes (list): Only these nodes are returned.
+
+    Returns:
+        list: Nodes from filter_nodes, end nodes first.
+    """
     node_set = set(filter_nodes)
     results = []
     visited = set()
 
-    def traverse(node):
-        if node is None or node in visited:
-            if node in node_set:
-                results.remove(node)
-            else:
-                return
-        visited.add(node)
-        if node in node_set:
-            results.append(node)
-        parents = node.get_input_connected_nodes()
+    # The last visit order of a pre order walk up the inputs is the reverse of a post order walk
+    # that takes end nodes and inputs in reverse. That walk only needs to visit each node once.
+    for end_node in reversed(end_nodes):
+        if end_node is None or end_node in visited:
+            continue
 
-        for parent in parents:
-            traverse(parent)
+        visited.add(end_node)
+        stack = [(end_node, reversed(end_node.get_input_connected_nodes()))]
 
-    for end_node in end_nodes:
-        traverse(end_node)
+        while stack:
+            node, parents = stack[-1]
 
+            parent = next(parents, None)
+            while parent is not None and parent in visited:
+                parent = next(parents, None)
+
+            if parent is not None:
+                visited.add(parent)
+                stack.append((parent, reversed(parent.get_input_connected_nodes())))
+                continue
+
+            stack.pop()
+            if node in node_set:
+                results.append(node)
+
+    results.reverse()
     return results
 
 
@@ -6727,12 +6800,19 @@ def pre_order(start_nodes, filter_nodes):
 
     node_set = set(filter_nodes)
     results = []
+    result_set = set()
     visited = set()
+    traversed = set()
 
-    def traverse(node):
+    def add_result(node):
+        if node in node_set and not node in result_set:
+            result_set.add(node)
+            results.append(node)
 
-        if node is None:
-            return
+    def traverse(node):
+        """
+        Generator for one node's walk. It yields the nodes to walk next, in the order a recursive walk would visit them.
+        """
 
         children = []
 
@@ -6741,15 +6821,13 @@ def pre_order(start_nodes, filter_nodes):
 
             if not in_node in visited:
                 visited.add(in_node)
-                if in_node in node_set and not in_node in results:
-                    results.append(in_node)
+                add_result(in_node)
 
             eval_outputs = in_node.get_output_connected_nodes('Eval OUT')
             for eval_out in eval_outputs:
                 if not eval_out in visited:
                     visited.add(eval_out)
-                    if eval_out in node_set and not eval_out in results:
-                        results.append(eval_out)
+                    add_result(eval_out)
 
         joints = node.get_input_connected_nodes('joints')
         for joint in joints:
@@ -6757,8 +6835,7 @@ def pre_order(start_nodes, filter_nodes):
 
             if not joint in visited:
                 visited.add(joint)
-                if joint in node_set and not joint in results:
-                    results.append(joint)
+                add_result(joint)
 
             if joint_outputs:
 
@@ -6771,32 +6848,28 @@ def pre_order(start_nodes, filter_nodes):
                             continue
                         if not input_item in visited:
                             visited.add(input_item)
-                        if input_item in node_set and not input_item in results:
-                            results.append(input_item)
+                        add_result(input_item)
 
                     if not joint_output in visited:
                         visited.add(joint_output)
-                        if joint_output in node_set and not joint_output in results:
-                            results.append(joint_output)
+                        add_result(joint_output)
 
         parents = node.get_input_connected_nodes('parent')
         for parent in parents:
             if not parent in visited:
                 visited.add(parent)
-                if parent in node_set and not parent in results:
-                    results.append(parent)
+                add_result(parent)
 
         all_ins = node.get_input_connected_nodes()
 
         for input_item in all_ins:
 
             if not input_item in visited:
-                traverse(input_item)
+                yield input_item
 
         if not node in visited:
             visited.add(node)
-        if node in node_set and not node in results:
-            results.append(node)
+        add_result(node)
 
         if type(node) == BundleItem:
 
@@ -6810,21 +6883,39 @@ def pre_order(start_nodes, filter_nodes):
             start_nodes = get_start_nodes(sub_children)
 
             for child in start_nodes:
-                traverse(child)
+                yield child
 
-            traverse(input_node)
+            yield input_node
 
-            traverse(output_node)
+            yield output_node
 
         children += node.get_output_connected_nodes()
 
         if children:
             for child in children:
-                traverse(child)
+                yield child
+
+        # walking a node again once its walk has finished only reaches nodes that are already visited and in
+        # results, so skipping it keeps the order of the recursive walk, diamonds included
+        traversed.add(node)
 
     for start_node in start_nodes:
-        if not start_node in visited:
-            traverse(start_node)
+        if start_node is None or start_node in visited:
+            continue
+
+        stack = [traverse(start_node)]
+
+        while stack:
+            try:
+                next_node = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            if next_node is None or next_node in traversed:
+                continue
+
+            stack.append(traverse(next_node))
 
     return results
 
@@ -6836,7 +6927,11 @@ def pre_order_depth(start_nodes, filter_nodes):
 
     depth_dict = {}
 
-    def traverse(node, depth=0):
+    stack = [(start_node, 0) for start_node in reversed(start_nodes)]
+
+    while stack:
+        node, depth = stack.pop()
+
         if not depth_dict.get(node, None):
             depth_dict[node] = depth
         elif depth_dict[node] < depth:
@@ -6881,7 +6976,7 @@ def pre_order_depth(start_nodes, filter_nodes):
                     depth_dict[node] += 1
 
         if node is None or node in visited:
-            return
+            continue
         visited.add(node)
         if node in node_set:
             results.append(node)
@@ -6890,12 +6985,8 @@ def pre_order_depth(start_nodes, filter_nodes):
 
         depth += 1
 
-        if children:
-            for child in children:
-                traverse(child, depth)
-
-    for start_node in start_nodes:
-        traverse(start_node)
+        for child in reversed(children):
+            stack.append((child, depth))
 
     results = get_nodes_at_depth(results, depth_dict)
     return results, depth_dict
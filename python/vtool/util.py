@@ -14,6 +14,8 @@ import os
 import uuid
 import inspect
 import ast
+import json
+import collections
 
 from html.parser import HTMLParser
 import builtins as py_builtins
@@ -35,7 +37,6 @@ except ImportError: in_houdini = False
 try: import nuke; in_nuke = True
 except ImportError: in_nuke = False
 
-temp_log = ''
 last_temp_log = ''
 
 global_tabs = 1
@@ -537,29 +538,91 @@ def suggest_env(name, value):
         set_env(name, value)
 
 
-def start_temp_log():
+class TempLog(object):
+    """
+    Bounded buffer of log records kept while a process script runs.
+    Records are only joined into text when the log ends.
+    Set VETALA_TEMP_LOG_JSONL to a file path to also append every record to it as a JSON line.
+    """
+
+    max_records = 100000
+
+    def __init__(self):
+        self.active = False
+        self.records = collections.deque(maxlen=self.max_records)
+        self.dropped = 0
+        self._jsonl_file = None
+
+    def start(self, jsonl_path=None):
+        self.active = True
+        self.records.clear()
+        self.dropped = 0
+
+        if not jsonl_path:
+            jsonl_path = os.environ.get('VETALA_TEMP_LOG_JSONL')
+
+        if jsonl_path and not self._jsonl_file:
+            try:
+                self._jsonl_file = open(jsonl_path, 'a')
+            except (IOError, OSError):
+                self._jsonl_file = None
+
+    def record(self, value, level='info'):
+        if not self.active:
+            return
+
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+
+        record = (time.time(), level, value)
+        self.records.append(record)
+
+        if self._jsonl_file:
+            self._jsonl_file.write(json.dumps({'time': record[0],
+                                               'level': level,
+                                               'text': value.strip('\n')}) + '\n')
+
+    def get_text(self):
+        text = ''.join([record[2] for record in self.records])
+        text = text.replace('\t', '  ')
+
+        if self.dropped:
+            text = '\n... %s earlier records dropped ...%s' % (self.dropped, text)
+
+        return text
+
+    def end(self):
+        self.active = False
+
+        if self._jsonl_file:
+            self._jsonl_file.close()
+            self._jsonl_file = None
+
+        text = self.get_text()
+        self.records.clear()
+
+        return text
+
+
+temp_log = TempLog()
+
+
+def start_temp_log(jsonl_path=None):
     set_env('VETALA_KEEP_TEMP_LOG', 'True')
-    global temp_log
-    temp_log = ''
+    temp_log.start(jsonl_path)
 
 
-def record_temp_log(value):
-    global temp_log
-    if os.environ.get('VETALA_KEEP_TEMP_LOG') == 'True':
-        value = value.replace('\t', '  ')
-        temp_log += value
+def record_temp_log(value, level='info'):
+    temp_log.record(value, level)
 
 
 def end_temp_log():
-    global temp_log
     global last_temp_log
 
     set_env('VETALA_KEEP_TEMP_LOG', 'False')
-    value = temp_log
+    value = temp_log.end()
     if value:
-        last_temp_log = temp_log
-
-        temp_log = ''
+        last_temp_log = value
 
     return value
 
@@ -943,7 +1006,7 @@ def warning(*args):
             cmds.warning('V: \t%s' % string_value)
         else:
             print(text)
-        record_temp_log('\nWarning!:  %s' % string_value)
+        record_temp_log('\nWarning!:  %s' % string_value, 'warning')
 
     except:
         raise RuntimeError
@@ -961,7 +1024,7 @@ def error(*args):
             # do not remove
             print(text)
 
-        record_temp_log('\n%s' % string_value)
+        record_temp_log('\n%s' % string_value, 'error')
 
     except:
         raise RuntimeError
@@ -2,6 +2,7 @@
 
 from collections import OrderedDict
 import json
+import re
 import sys
 import os
 import shutil
@@ -18,6 +19,13 @@ import time
 import hashlib
 import codecs
 import pkgutil
+import array
+import struct
+import marshal
+import importlib.util
+import contextlib
+import threading
+import atexit
 
 from . import util
 from . import logger
@@ -133,6 +141,218 @@ def get_current_vetala_process_path():
     return filepath
 
 
+class VersionStore(object):
+    """
+    Content addressed storage for a version folder.
+    Each unique file is stored once in .store under its hash. Version files are hard links into the store,
+    so they stay normal files and folders for anything that reads them.
+    Stored files are read only, since editing one would edit every version that links to it.
+    VersionFile.restore copies a version back as new writable files.
+    An index of source path, modified time and size lets unchanged files skip hashing and copying.
+
+    Args:
+        version_folder (str): The version folder that holds the store.
+    """
+
+    def __init__(self, version_folder):
+        self.version_folder = version_folder
+        self.store_folder = join_path(version_folder, '.store')
+        self.index_file = join_path(self.store_folder, 'index.json')
+
+        self._index = None
+
+        self.copied = []
+        self.linked = []
+
+    def _get_index(self):
+
+        if self._index is None:
+            self._index = {}
+
+            if os.path.isfile(self.index_file):
+                try:
+                    with open(self.index_file, 'r') as open_file:
+                        self._index = json.load(open_file)
+                except (IOError, OSError, ValueError):
+                    self._index = {}
+
+        return self._index
+
+    def _save_index(self):
+
+        if self._index is None:
+            return
+
+        if not os.path.isdir(self.store_folder):
+            os.makedirs(self.store_folder)
+
+        temp_file = self.index_file + '.temp'
+
+        with open(temp_file, 'w') as open_file:
+            json.dump(self._index, open_file)
+
+        os.replace(temp_file, self.index_file)
+
+    def _get_hash(self, filepath):
+
+        hasher = hashlib.sha1()
+
+        with open(filepath, 'rb') as open_file:
+            for chunk in iter(lambda: open_file.read(1048576), b''):
+                hasher.update(chunk)
+
+        return hasher.hexdigest()
+
+    def _get_blob_path(self, digest):
+        return join_path(self.store_folder, '%s/%s' % (digest[:2], digest[2:]))
+
+    def add_file(self, filepath, filepath_destination):
+        """
+        Store the file and link it to the destination.
+
+        Returns:
+            str: The hash of the file content.
+        """
+
+        file_stat = os.stat(filepath)
+        stamp = [file_stat.st_mtime_ns, file_stat.st_size]
+
+        index = self._get_index()
+        key = os.path.abspath(filepath)
+
+        digest = None
+        blob = None
+
+        entry = index.get(key)
+        if entry and entry[:2] == stamp:
+            blob = self._get_blob_path(entry[2])
+            if os.path.isfile(blob):
+                digest = entry[2]
+
+        if not digest:
+            digest = self._get_hash(filepath)
+            blob = self._get_blob_path(digest)
+            index[key] = stamp + [digest]
+
+        if os.path.isfile(blob):
+            self.linked.append(filepath)
+        else:
+            blob_folder = get_dirname(blob)
+            if not os.path.isdir(blob_folder):
+                os.makedirs(blob_folder)
+
+            temp_blob = blob + '.temp'
+            shutil.copyfile(filepath, temp_blob)
+            os.chmod(temp_blob, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(temp_blob, blob)
+
+            self.copied.append(filepath)
+
+        # writing into an existing link, e.g. the default version, would change the content it shares
+        if os.path.lexists(filepath_destination):
+            self.remove_file(filepath_destination)
+
+        try:
+            os.link(blob, filepath_destination)
+        except OSError:
+            shutil.copyfile(blob, filepath_destination)
+
+        return digest
+
+    def add(self, path, path_destination, exclude=None):
+        """
+        Store a file or a folder and recreate it at the destination.
+        The version folder is skipped if it lives inside the folder.
+
+        Args:
+            path (str): The file or folder to store.
+            path_destination (str): Where to recreate it.
+            exclude (list): Folder names to skip while walking a folder.
+
+        Returns:
+            str: The destination path.
+        """
+
+        if is_file(path):
+            self.add_file(path, path_destination)
+            self._save_index()
+            return path_destination
+
+        version_folder = os.path.normpath(self.version_folder)
+        exclude = exclude or []
+
+        for root, folders, files in os.walk(path):
+
+            folders[:] = [folder for folder in folders
+                          if folder not in exclude and
+                          os.path.normpath(os.path.join(root, folder)) != version_folder]
+
+            relative = os.path.relpath(root, path)
+            root_destination = os.path.normpath(os.path.join(path_destination, relative))
+
+            if not os.path.isdir(root_destination):
+                os.makedirs(root_destination)
+
+            for filename in files:
+                self.add_file(os.path.join(root, filename), os.path.join(root_destination, filename))
+
+        self._save_index()
+
+        return path_destination
+
+    def remove_file(self, filepath):
+        """
+        Remove a stored file or a version file that links to one.
+        """
+
+        try:
+            os.remove(filepath)
+        except OSError:
+            # windows does not remove read only files
+            os.chmod(filepath, stat.S_IREAD | stat.S_IWRITE)
+            os.remove(filepath)
+
+    def restore_file(self, filepath, filepath_destination):
+        """
+        Copy a version file to the destination as a new writable file, not a link into the store.
+        """
+
+        if os.path.lexists(filepath_destination):
+            self.remove_file(filepath_destination)
+
+        shutil.copyfile(filepath, filepath_destination)
+
+    def clean(self):
+        """
+        Remove stored files that no version links to anymore.
+
+        Returns:
+            int: The number of stored files removed.
+        """
+
+        if not os.path.isdir(self.store_folder):
+            return 0
+
+        removed = 0
+
+        for root, folders, files in os.walk(self.store_folder, topdown=False):
+
+            for filename in files:
+                blob = os.path.join(root, filename)
+
+                if blob == self.index_file:
+                    continue
+
+                if filename.endswith('.temp') or os.stat(blob).st_nlink < 2:
+                    self.remove_file(blob)
+                    removed += 1
+
+            if root != self.store_folder and not os.listdir(root):
+                os.rmdir(root)
+
+        return removed
+
+
 class VersionFile(object):
     """
     Convenience to version a file or folder.
@@ -152,6 +372,10 @@ class VersionFile(object):
         self.version_name = 'version'
         self.version_folder = None
         self.updated_old = False
+        self.use_store = True
+
+        self.copied_files = []
+        self.linked_files = []
 
     def _prep_directories(self):
         self._create_version_folder()
@@ -220,6 +444,15 @@ class VersionFile(object):
         self._create_version_folder()
         self._create_comment_file()
 
+        if self.use_store and exists(self.filepath):
+            try:
+                VersionStore(self.version_folder).add(self.filepath, filename)
+                return
+            except (IOError, OSError):
+                util.warning('Could not store version in %s. Copying instead.' % self.version_folder)
+                if is_dir(filename):
+                    shutil.rmtree(filename, onerror=delete_read_only_error)
+
         if is_dir(self.filepath):
             copy_dir(self.filepath, filename)
         if is_file(self.filepath):
@@ -229,6 +462,7 @@ class VersionFile(object):
         """
         Save a comment to a log file.
         version_file name is always version.1, version.2, etc.
+        The save time is written with the comment, since stored versions share the modified time of their content.
 
         Args:
             comment (str)
@@ -247,7 +481,8 @@ class VersionFile(object):
         comment.replace('"', '\"')
 
         write_lines(self.comment_file,
-                    ['version = %s; comment = "%s"; user = "%s"' % (version, comment, user)],
+                    ['version = %s; comment = "%s"; user = "%s"; date = "%s"' % (version, comment, user,
+                                                                              get_date_and_time())],
                     append=True)
 
     def save(self, comment=None):
@@ -277,6 +512,54 @@ class VersionFile(object):
 
         return inc_file_name
 
+    def save_folder(self, folder_path, comment=None, exclude=None):
+        """
+        Save a version that holds a snapshot of another folder, under that folder's name.
+        Files unchanged since the last snapshot are hard linked from the store, only changed files are copied.
+        After saving, copied_files and linked_files list what was done.
+
+        Args:
+            folder_path (str): The folder to snapshot.
+            comment (str): The comment to add to the version.
+            exclude (list): Folder names to leave out of the snapshot.
+
+        Returns:
+            str: The new version file name
+        """
+
+        self._prep_directories()
+
+        if comment is None:
+            comment = ' '
+
+        inc_file_name = self._increment_version_file_name()
+        destination = join_path(inc_file_name, get_basename(folder_path))
+
+        store = VersionStore(self.version_folder)
+        self.copied_files = store.copied
+        self.linked_files = store.linked
+
+        stored = False
+
+        if self.use_store:
+            try:
+                store.add(folder_path, destination, exclude)
+                stored = True
+            except (IOError, OSError):
+                util.warning('Could not store version in %s. Copying instead.' % self.version_folder)
+                if is_dir(inc_file_name):
+                    shutil.rmtree(inc_file_name, onerror=delete_read_only_error)
+
+        if not stored:
+            ignore = None
+            if exclude:
+                ignore = shutil.ignore_patterns(*exclude)
+            shutil.copytree(folder_path, destination, ignore=ignore)
+
+        self.save_comment(comment, inc_file_name)
+
+        return inc_file_name
+
     def save_default(self):
 
         self._prep_directories()
@@ -333,6 +616,15 @@ class VersionFile(object):
         """
         self.version_folder_name = name
 
+    def set_use_store(self, bool_value):
+        """
+        Store versions once by content and hard link them into the version folder, instead of copying.
+
+        Args:
+            bool_value (bool)
+        """
+        self.use_store = bool_value
+
     def set_version_name(self, name):
         """
         Set the version name.
@@ -354,6 +646,47 @@ class VersionFile(object):
         """
         return self._get_version_path(version_int)
 
+    def restore(self, version_int, path=None):
+        """
+        Copy a version back. The copies are new writable files, so editing them leaves every version as it was.
+        Files that are not in the version are left in place.
+
+        Args:
+            version_int (int): The version number.
+            path (str): Where to restore to. By default the versioned file or folder.
+
+        Returns:
+            str: The restored path.
+        """
+
+        version_path = self.get_version_path(version_int)
+
+        if not exists(version_path):
+            util.warning('Version %s not found at %s' % (version_int, version_path))
+            return
+
+        if not path:
+            path = self.filepath
+
+        store = VersionStore(get_dirname(version_path))
+
+        if is_file(version_path):
+            store.restore_file(version_path, path)
+            return path
+
+        for root, folders, files in os.walk(version_path):
+
+            relative = os.path.relpath(root, version_path)
+            root_destination = os.path.normpath(os.path.join(path, relative))
+
+            if not os.path.isdir(root_destination):
+                os.makedirs(root_destination)
+
+            for filename in files:
+                store.restore_file(os.path.join(root, filename), os.path.join(root_destination, filename))
+
+        return path
+
     def get_version_comment(self, version_int):
         """
         Get the version comment.
@@ -435,7 +768,11 @@ class VersionFile(object):
                 version_file = join_path(self.filepath, '%s/%s' % (self.version_folder_name, version_file))
 
                 file_size = get_filesize(version_file)
-                modified = get_last_modified_date(version_file)
+
+                if 'date' in line_info_dict:
+                    modified = line_info_dict['date'][1:-1]
+                else:
+                    modified = get_last_modified_date(version_file)
 
                 datas.append([version, comment, user, file_size, modified, version_file])
 
@@ -600,16 +937,28 @@ class VersionFile(object):
 
         path = self.get_version_path(version_number)
 
+        store = VersionStore(get_dirname(path))
+
         if is_file(path):
-            delete_file(path)
+            store.remove_file(path)
         else:
+            for root, folders, files in os.walk(path):
+                for filename in files:
+                    store.remove_file(os.path.join(root, filename))
+
             delete_dir(path)
 
+        store.clean()
+
 
 class SettingsFile(object):
 
     __cache_settings__ = {}
 
+    # instances with a delayed write waiting, written at exit
+    __delayed_writes__ = set()
+    __delayed_lock__ = threading.Lock()
+
     def __init__(self):
 
         self.directory = None
@@ -621,6 +970,13 @@ class SettingsFile(object):
         self.write = None
         self._has_json = None
 
+        self._batch_depth = 0
+        self._write_pending = False
+
+        self._write_delay = 0
+        self._write_timer = None
+        self._lock = threading.RLock()
+
     def _get_json_file(self):
         if not self.filepath:
             return
@@ -758,8 +1114,45 @@ class SettingsFile(object):
 
     def _write(self):
 
-        result = self._write_json()
-        return result
+        with self._lock:
+            if self._batch_depth:
+                self._write_pending = True
+                return
+
+            if self._write_delay:
+                self._write_pending = True
+                self._start_write_timer()
+                return
+
+            self._write_pending = False
+            result = self._write_json()
+            return result
+
+    def _start_write_timer(self):
+        """
+        Restart the single delayed write timer. Call with the lock held.
+        """
+
+        if self._write_timer:
+            self._write_timer.cancel()
+
+        timer = threading.Timer(self._write_delay, self._write_from_timer)
+        timer.daemon = True
+        self._write_timer = timer
+
+        with self.__class__.__delayed_lock__:
+            self.__class__.__delayed_writes__.add(self)
+
+        timer.start()
+
+    def _write_from_timer(self):
+
+        with self._lock:
+            # a timer that was replaced after it fired does nothing
+            if threading.current_thread() is not self._write_timer:
+                return
+
+            self.flush()
 
     def _write_json(self):
 
@@ -807,7 +1200,7 @@ class SettingsFile(object):
                 self.filepath = old
 
         self._read()
-        self._write_json()
+        self._write()
 
     def set(self, name, value):
 
@@ -827,13 +1220,14 @@ class SettingsFile(object):
                 if cache_value == value and type(value) != OrderedDict:
                     return
 
-        self.settings_dict[name] = value
+        with self._lock:
+            self.settings_dict[name] = value
 
-        if name not in self.settings_order:
-            self.settings_order.append(name)
+            if name not in self.settings_order:
+                self.settings_order.append(name)
 
-        self._write()
-        self.__class__.__cache_settings__[self.filepath] = [self.settings_dict, self.settings_order]
+            self._write()
+            self.__class__.__cache_settings__[self.filepath] = [self.settings_dict, self.settings_order]
 
     def get(self, name):
 
@@ -878,16 +1272,95 @@ class SettingsFile(object):
 
     def clear(self):
 
-        self.settings_dict = {}
-        self.settings_order = []
+        with self._lock:
+            self.settings_dict = {}
+            self.settings_order = []
 
-        self._write()
-        self.__class__.__cache_settings__[self.filepath] = [self.settings_dict, self.settings_order]
+            self._write()
+            self.__class__.__cache_settings__[self.filepath] = [self.settings_dict, self.settings_order]
 
-    def reload(self):
+    def reload(self, force=False):
+        """
+        Args:
+            force (bool): Drop the cached settings and read the file from disk again.
+        """
+        if force and not self._write_pending:
+            self.__class__.__cache_settings__.pop(self.filepath, None)
 
         self._read_json()
 
+    def get_stat(self):
+        """
+        Returns:
+            tuple: (mtime_ns, size) of the settings file, or None if it does not exist.
+        """
+        if not self.filepath:
+            return
+
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return
+
+        return stat.st_mtime_ns, stat.st_size
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Buffer changes made inside the with block and write the file once when the block ends.
+        Batches can be nested, only the outermost one writes.
+        """
+        self._batch_depth += 1
+
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth and self._write_pending:
+                self._write()
+
+    def set_write_delay(self, seconds):
+        """
+        Debounce writes. Changes are written once no new change has arrived for the given seconds.
+        Use this for edits that arrive quickly from the ui. A value of 0 writes immediately again.
+        Pending changes are also written by flush() and when Python exits.
+        """
+        with self._lock:
+            self._write_delay = seconds
+
+            if not seconds:
+                self.flush()
+
+    def flush(self):
+        """
+        Write any pending changes now.
+        """
+        with self._lock:
+            if self._write_timer:
+                self._write_timer.cancel()
+                self._write_timer = None
+
+            with self.__class__.__delayed_lock__:
+                self.__class__.__delayed_writes__.discard(self)
+
+            if not self._write_pending or self._batch_depth:
+                return
+
+            self._write_pending = False
+            return self._write_json()
+
+    @classmethod
+    def flush_all(cls):
+        """
+        Write the pending changes of every settings file with a delayed write waiting.
+        """
+        with cls.__delayed_lock__:
+            settings = list(cls.__delayed_writes__)
+
+        for setting in settings:
+            setting.flush()
+
     def set_directory(self, directory, filename='settings.json'):
         self.directory = directory
 
@@ -911,6 +1384,9 @@ class SettingsFile(object):
         return self.filepath
 
 
+atexit.register(SettingsFile.flush_all)
+
+
 class ControlNameFromSettingsFile(util.ControlName):
 
     def __init__(self, directory=None):
@@ -1676,6 +2152,41 @@ def get_file_lines(filepath):
     return text.splitlines() if text else []
 
 
+def read_weight_file(filepath):
+    """
+    Read a weights file where each line is a list of numbers.
+    Runs in worker processes so it should only rely on the standard library.
+    Lines that can't be parsed are skipped and reported instead of failing the whole file.
+
+    Args:
+        filepath (str): The path to the weights file.
+
+    Returns:
+        tuple: (list of array.array('d'), one per line, seconds spent reading, list of skipped line numbers)
+    """
+
+    start = time.time()
+
+    arrays = []
+    skipped = []
+
+    lines = [line.strip() for line in get_file_lines(filepath)]
+
+    for inc, line in enumerate(filter(None, lines)):
+
+        try:
+            try:
+                values = json.loads(line)
+            except ValueError:
+                values = ast.literal_eval(line)
+
+            arrays.append(array.array('d', values))
+        except Exception:
+            skipped.append(inc)
+
+    return arrays, time.time() - start, skipped
+
+
 def set_json(filepath, data, append=False, sort_keys=True):
     """
     Write data to a JSON file.
@@ -2627,35 +3138,364 @@ def remove_modules_at_path(path):
         sys.modules.pop(module)
 
 
+class SourceCache(object):
+    """
+    Bytecode cache for sourced scripts, kept outside the process tree.
+    Entries are keyed on the script path and checked against the script's modified time and size.
+    The cache lives in the user's vetala settings directory. Set VETALA_CODE_CACHE to choose another directory.
+    Cached code is only loaded from a directory and files owned by the current user that others can not write to.
+    """
+
+    header = struct.Struct('<4sQQ')
+
+    # script path: {'compile': seconds, 'run': seconds, 'cached': bool}
+    timings = {}
+
+    @classmethod
+    def get_directory(cls):
+
+        directory = os.environ.get('VETALA_CODE_CACHE')
+
+        if not directory:
+            settings_directory = os.environ.get('VETALA_SETTINGS')
+
+            if not settings_directory:
+                settings_directory = get_default_directory()
+
+            directory = join_path(settings_directory, 'code_cache')
+
+        return directory
+
+    @classmethod
+    def is_trusted(cls, path):
+        """
+        Returns:
+            bool: True if path is owned by the current user and no one else can write to it.
+        """
+
+        if not hasattr(os, 'getuid'):
+            # windows keeps the settings directory inside the user's profile
+            return True
+
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return False
+
+        if stat_result.st_uid != os.getuid():
+            return False
+
+        if stat_result.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return False
+
+        return True
+
+    @classmethod
+    def get_cache_path(cls, script_path):
+
+        script_path = os.path.abspath(script_path)
+        name = hashlib.sha1(script_path.encode('utf-8')).hexdigest()
+        tag = sys.implementation.cache_tag
+
+        return join_path(cls.get_directory(), '%s.%s.pyc' % (name, tag))
+
+    @classmethod
+    def get_code(cls, script_path):
+        """
+        Get the code object for a script, compiling it only when the cache is out of date.
+
+        Returns:
+            tuple: (code, compile seconds, True if the code came from the cache)
+        """
+
+        stat_result = os.stat(script_path)
+        stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        cache_path = cls.get_cache_path(script_path)
+
+        code = cls._read(cache_path, stamp)
+        if code:
+            return code, 0.0, True
+
+        start = time.time()
+
+        with open(script_path, 'rb') as fin:
+            source = fin.read()
+
+        code = compile(source, script_path, 'exec', dont_inherit=True)
+
+        compile_time = time.time() - start
+
+        cls._write(cache_path, stamp, code)
+
+        return code, compile_time, False
+
+    @classmethod
+    def clear(cls):
+        directory = cls.get_directory()
+
+        if is_dir(directory):
+            shutil.rmtree(directory, ignore_errors=True)
+
+        cls.timings = {}
+
+    @classmethod
+    def _read(cls, cache_path, stamp):
+
+        if not cls.is_trusted(get_dirname(cache_path)) or not cls.is_trusted(cache_path):
+            return
+
+        try:
+            with open(cache_path, 'rb') as fin:
+                header = fin.read(cls.header.size)
+                if len(header) != cls.header.size:
+                    return
+
+                magic, mtime, size = cls.header.unpack(header)
+                if magic != importlib.util.MAGIC_NUMBER or (mtime, size) != stamp:
+                    return
+
+                return marshal.loads(fin.read())
+
+        except (IOError, OSError, ValueError, EOFError, TypeError):
+            return
+
+    @classmethod
+    def _write(cls, cache_path, stamp, code):
+
+        temp_path = '%s.%s' % (cache_path, os.getpid())
+
+        try:
+            directory = get_dirname(cache_path)
+            if not is_dir(directory):
+                os.makedirs(directory, 0o700)
+
+            if not cls.is_trusted(directory):
+                log.info('Not caching bytecode in %s, it is not owned by the user or others can write to it' %
+                         directory)
+                return
+
+            with os.fdopen(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as fout:
+                fout.write(cls.header.pack(importlib.util.MAGIC_NUMBER, stamp[0], stamp[1]))
+                fout.write(marshal.dumps(code))
+
+            os.replace(temp_path, cache_path)
+
+        except (IOError, OSError, ValueError):
+            log.info('Could not cache bytecode for %s' % cache_path)
+
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+
+class SymbolIndex(object):
+    """
+    Symbols found in code files for the code editor completions.
+    Entries are keyed on the file path and checked against the file's modified time and size,
+    so a file is only read again after it changes. The index is saved between sessions next to the SourceCache.
+    """
+
+    put_pattern = re.compile(r'\bput\.([A-Za-z_]\w*)\s*=')
+
+    # path: {'stamp': [mtime_ns, size], 'puts': list, 'classes': {class name: [functions, variables]}}
+    entries = None
+    file_reads = 0
+    _dirty = False
+
+    @classmethod
+    def get_path(cls):
+        return join_path(SourceCache.get_directory(), 'symbol_index.json')
+
+    @classmethod
+    def get_puts(cls, filepath):
+        """
+        Returns:
+            list: Names assigned to put in the file, e.g. put.joints = ...
+        """
+        entry = cls._get_entry(filepath)
+
+        if entry is None:
+            return []
+
+        if entry['puts'] is None:
+            entry['puts'] = cls.put_pattern.findall(cls._read(filepath) or '')
+            cls._dirty = True
+
+        return entry['puts']
+
+    @classmethod
+    def get_class_members(cls, filepath, class_name):
+        """
+        Same result as get_ast_class_sub_functions.
+
+        Returns:
+            tuple: (functions, variables)
+        """
+        entry = cls._get_entry(filepath)
+
+        if entry is None:
+            return None, None
+
+        if class_name not in entry['classes']:
+            functions, variables = cls._get_class_members(filepath, class_name)
+            entry['classes'][class_name] = [functions, variables]
+            cls._dirty = True
+
+        return tuple(entry['classes'][class_name])
+
+    @classmethod
+    def save(cls):
+        if not cls._dirty or cls.entries is None:
+            return
+
+        path = cls.get_path()
+        temp_path = '%s.%s' % (path, os.getpid())
+
+        try:
+            directory = get_dirname(path)
+            if not is_dir(directory):
+                os.makedirs(directory, 0o700)
+
+            with open(temp_path, 'w') as fout:
+                json.dump(cls.entries, fout)
+
+            os.replace(temp_path, path)
+            cls._dirty = False
+
+        except (IOError, OSError, ValueError, TypeError):
+            log.info('Could not save symbol index %s' % path)
+
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+    @classmethod
+    def clear(cls):
+        cls.entries = {}
+        cls._dirty = False
+
+        path = cls.get_path()
+        if is_file(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @classmethod
+    def _load(cls):
+        cls.entries = {}
+
+        path = cls.get_path()
+
+        if not is_file(path):
+            return
+
+        try:
+            with open(path, 'r') as fin:
+                entries = json.load(fin)
+        except (IOError, OSError, ValueError):
+            return
+
+        if isinstance(entries, dict):
+            cls.entries = entries
+
+    @classmethod
+    def _get_entry(cls, filepath):
+
+        if cls.entries is None:
+            cls._load()
+
+        filepath = os.path.abspath(filepath)
+
+        try:
+            stat_result = os.stat(filepath)
+        except OSError:
+            return
+
+        stamp = [stat_result.st_mtime_ns, stat_result.st_size]
+
+        entry = cls.entries.get(filepath)
+
+        if not entry or entry.get('stamp') != stamp:
+            entry = {'stamp': stamp, 'puts': None, 'classes': {}}
+            cls.entries[filepath] = entry
+            cls._dirty = True
+
+        return entry
+
+    @classmethod
+    def _read(cls, filepath):
+        cls.file_reads += 1
+        return get_file_text(filepath)
+
+    @classmethod
+    def _get_class_members(cls, filepath, class_name):
+
+        file_text = cls._read(filepath)
+        if not file_text:
+            return None, None
+
+        try:
+            ast_tree = ast.parse(file_text)
+        except SyntaxError:
+            return None, None
+
+        defined_dict = {}
+
+        for node in ast_tree.body:
+            if isinstance(node, ast.ClassDef):
+                defined_dict[node.name] = node
+
+        result = get_ast_class_defined_functions(defined_dict, class_name)
+
+        if not result:
+            return None, None
+
+        return result
+
+
 def source_python_module(code_directory):
+    """
+    Source a python file into a new module.
+    Compiled code is reused from SourceCache when the file has not changed, but the module namespace is always new.
+
+    Returns:
+        module instance: The module, or the traceback string if the file failed to compile or run.
+    """
 
     try:
         remove_sourced_code(code_directory)
 
-        original_dont_write_bytecode = sys.dont_write_bytecode
-        sys.dont_write_bytecode = True
+        module_name = hashlib.md5(code_directory.encode('utf-8')).hexdigest()
 
-        fin = None
         try:
-            fin = open(code_directory, 'r')
-            module_name = hashlib.md5(
-                code_directory.encode('utf-8') if sys.version_info[0] >= 3 else code_directory
-            ).hexdigest()
+            code, compile_time, cached = SourceCache.get_code(code_directory)
+
+            spec = importlib.util.spec_from_file_location(module_name, code_directory)
+            module_inst = importlib.util.module_from_spec(spec)
+            module_inst.__cached__ = SourceCache.get_cache_path(code_directory)
+
+            sys.modules[module_name] = module_inst
+
+            start = time.time()
+            exec(code, module_inst.__dict__)
+            run_time = time.time() - start
+
+            SourceCache.timings[code_directory] = {'compile': compile_time,
+                                                   'run': run_time,
+                                                   'cached': cached}
 
-            module_inst = imp.load_source(module_name, code_directory, fin)
             return module_inst
 
         except Exception:
+            sys.modules.pop(module_name, None)
             return traceback.format_exc()
 
-        finally:
-            if fin:
-                try:
-                    fin.close()
-                except Exception:
-                    pass
-            sys.dont_write_bytecode = original_dont_write_bytecode
-
     except ImportError:
         traceback.print_exc(file=sys.stderr)
         return None
@@ -2967,7 +3807,18 @@ def get_ast_class_sub_functions(module_path, class_name):
     if not defined:
         return None, None
 
-    if class_name in defined:
+    return get_ast_class_defined_functions(defined_dict, class_name)
+
+
+def get_ast_class_defined_functions(defined_dict, class_name):
+    """
+    Args:
+        defined_dict (dict): class name: ast.ClassDef, as returned by get_defined_classes.
+
+    Returns:
+        tuple: (functions, variables) of the class and the classes it inherits from in defined_dict.
+    """
+    if class_name in defined_dict:
         class_node = defined_dict[class_name]
 
         parents = []
@@ -2,6 +2,11 @@
 
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 def clampf(minimum, x, maximum):
     """
@@ -329,6 +334,401 @@ class BoundingBox(object):
         return found
 
 
+class PointTree(object):
+    """
+    KD-tree of 3D points for nearest, radius and mirror queries.
+    Build it once and query it as often as needed instead of measuring every point on every query.
+    When NumPy is available, batch queries (get_closest_many, get_mirror_indices) run vectorized on a grid of cells,
+    and the KD-tree is only built for single queries.
+
+    Args:
+        points (list): List of [0,0,0] vectors. Queries return indices into this list.
+        leaf_size (int): The most points a leaf holds before it gets split.
+    """
+
+    # about how many point to query distances the vectorized searches measure at once
+    brute_chunk = 1000000
+
+    def __init__(self, points, leaf_size=16):
+
+        self.points = [(point[0], point[1], point[2]) for point in points]
+        self.leaf_size = max(1, leaf_size)
+
+        self._root = None
+        self._array = None
+        self._cells = {}
+
+        if self.points and numpy is not None:
+            self._array = numpy.array(self.points, dtype=float)
+
+    def __len__(self):
+        return len(self.points)
+
+    def _get_root(self):
+
+        if self._root is None and self.points:
+            self._root = self._build(list(range(len(self.points))))
+
+        return self._root
+
+    def _build(self, indices):
+
+        if len(indices) <= self.leaf_size:
+            return None, indices
+
+        points = self.points
+
+        axis = None
+        spread = 0
+
+        for sub_axis in range(3):
+            values = [points[inc][sub_axis] for inc in indices]
+            sub_spread = max(values) - min(values)
+
+            if sub_spread > spread:
+                spread = sub_spread
+                axis = sub_axis
+
+        if axis is None:
+            # every point is in the same spot
+            return None, indices
+
+        indices.sort(key=lambda inc: points[inc][axis])
+
+        middle = len(indices) // 2
+        split = points[indices[middle]][axis]
+
+        return axis, split, self._build(indices[:middle]), self._build(indices[middle:])
+
+    def _get_cell_keys(self, cells):
+        # collisions only add candidates, every candidate is measured
+        return cells[:, 0] * 73856093 ^ cells[:, 1] * 19349663 ^ cells[:, 2] * 83492791
+
+    def _get_cells(self, cell_size):
+
+        if cell_size not in self._cells:
+            keys = self._get_cell_keys(numpy.floor(self._array / cell_size).astype(numpy.int64))
+            order = numpy.argsort(keys, kind='stable')
+
+            keys, starts, counts = numpy.unique(keys[order], return_index=True, return_counts=True)
+
+            self._cells[cell_size] = order, keys, starts, counts
+
+        return self._cells[cell_size]
+
+    def _get_span(self):
+        return float((self._array.max(axis=0) - self._array.min(axis=0)).max())
+
+    def _closest_in_cells(self, queries, radius):
+        """
+        Vectorized closest point within radius of each query.
+        Cells are twice the radius across, so the cell of a query and its neighbors on the nearer side of each axis
+        hold every point within the radius.
+
+        Returns:
+            tuple: (index array, squared distance array), -1 and inf where no point was found.
+        """
+        span = self._get_span()
+
+        # keep cell coordinates small enough for int64 however small the radius
+        cell_size = max(radius * 2, span * 1e-6) or 1.0
+
+        # mesh points lie on a surface, so a cell holds about its share of the span squared
+        share = min(1.0, 8 * (cell_size / span) ** 2) if span else 1.0
+
+        if share >= 0.25:
+            return self._closest_brute(queries, radius * radius)
+
+        found = numpy.full(len(queries), -1, dtype=numpy.int64)
+        found_distance = numpy.full(len(queries), numpy.inf)
+
+        chunk = max(1, int(self.brute_chunk // max(1.0, share * len(self.points))))
+
+        for start in range(0, len(queries), chunk):
+            sub_found, sub_distance = self._closest_in_cells_chunk(queries[start:start + chunk], radius, cell_size)
+
+            found[start:start + chunk] = sub_found
+            found_distance[start:start + chunk] = sub_distance
+
+        return found, found_distance
+
+    def _closest_in_cells_chunk(self, queries, radius, cell_size):
+
+        order, cell_keys, cell_starts, cell_counts = self._get_cells(cell_size)
+
+        scaled = queries / cell_size
+        query_cells = numpy.floor(scaled).astype(numpy.int64)
+        sides = numpy.where(scaled - query_cells < 0.5, -1, 1)
+
+        query_count = len(queries)
+        query_ids = []
+        point_ids = []
+
+        for x in (0, 1):
+            for y in (0, 1):
+                for z in (0, 1):
+                    keys = self._get_cell_keys(query_cells + sides * (x, y, z))
+
+                    cell = numpy.minimum(numpy.searchsorted(cell_keys, keys), len(cell_keys) - 1)
+                    counts = numpy.where(cell_keys[cell] == keys, cell_counts[cell], 0)
+
+                    total = int(counts.sum())
+                    if not total:
+                        continue
+
+                    first = numpy.repeat(cell_starts[cell] - (numpy.cumsum(counts) - counts), counts)
+
+                    query_ids.append(numpy.repeat(numpy.arange(query_count), counts))
+                    point_ids.append(order[first + numpy.arange(total)])
+
+        found = numpy.full(query_count, -1, dtype=numpy.int64)
+        found_distance = numpy.full(query_count, numpy.inf)
+
+        if not query_ids:
+            return found, found_distance
+
+        query_ids = numpy.concatenate(query_ids)
+        point_ids = numpy.concatenate(point_ids)
+
+        distance = ((self._array[point_ids] - queries[query_ids]) ** 2).sum(axis=1)
+
+        close = distance <= radius * radius
+        query_ids = query_ids[close]
+        point_ids = point_ids[close]
+        distance = distance[close]
+
+        # per query the smallest distance wins, then the lowest index, like the KD-tree
+        sort = numpy.lexsort((point_ids, distance, query_ids))
+        query_ids = query_ids[sort]
+
+        first = numpy.ones(len(query_ids), dtype=bool)
+        first[1:] = query_ids[1:] != query_ids[:-1]
+
+        found[query_ids[first]] = point_ids[sort][first]
+        found_distance[query_ids[first]] = distance[sort][first]
+
+        return found, found_distance
+
+    def _closest_brute(self, queries, max_squared):
+        """
+        Vectorized closest point by measuring every point, a chunk of queries at a time.
+        """
+        found = numpy.full(len(queries), -1, dtype=numpy.int64)
+        found_distance = numpy.full(len(queries), numpy.inf)
+
+        chunk = max(1, self.brute_chunk // len(self.points))
+
+        for start in range(0, len(queries), chunk):
+            sub_queries = queries[start:start + chunk]
+
+            distance = ((sub_queries[:, None, :] - self._array[None, :, :]) ** 2).sum(axis=2)
+
+            # argmin returns the lowest index when points are equally close
+            closest = distance.argmin(axis=1)
+            closest_distance = distance[numpy.arange(len(sub_queries)), closest]
+
+            close = closest_distance <= max_squared
+
+            found[start:start + chunk][close] = closest[close]
+            found_distance[start:start + chunk][close] = closest_distance[close]
+
+        return found, found_distance
+
+    def _get_closest_many_numpy(self, points, max_distance):
+
+        queries = numpy.array(points, dtype=float).reshape(-1, 3)
+
+        if max_distance is not None:
+            found, found_distance = self._closest_in_cells(queries, max_distance)
+
+        elif len(queries) * len(self.points) <= self.brute_chunk * 10:
+            found, found_distance = self._closest_brute(queries, numpy.inf)
+
+        else:
+            # start near the point spacing and widen the search for the queries that found nothing
+            span = self._get_span()
+            radius = span / math.sqrt(len(self.points))
+
+            found, found_distance = self._closest_in_cells(queries, radius)
+            missing = numpy.flatnonzero(found == -1)
+
+            while len(missing):
+                radius *= 2
+
+                if radius > span:
+                    sub_found, sub_distance = self._closest_brute(queries[missing], numpy.inf)
+                else:
+                    sub_found, sub_distance = self._closest_in_cells(queries[missing], radius)
+
+                found[missing] = sub_found
+                found_distance[missing] = sub_distance
+
+                missing = missing[sub_found == -1]
+
+        return [(int(index), math.sqrt(distance)) if index != -1 else None
+                for index, distance in zip(found.tolist(), found_distance.tolist())]
+
+    def _closest(self, node, point, best):
+
+        axis = node[0]
+
+        if axis is None:
+            points = self.points
+
+            for inc in node[1]:
+                other = points[inc]
+
+                x = other[0] - point[0]
+                y = other[1] - point[1]
+                z = other[2] - point[2]
+
+                distance = x * x + y * y + z * z
+
+                if distance < best[0] or (distance == best[0] and inc < best[1]):
+                    best[0] = distance
+                    best[1] = inc
+
+            return
+
+        difference = point[axis] - node[1]
+
+        if difference < 0:
+            near, far = node[2], node[3]
+        else:
+            near, far = node[3], node[2]
+
+        self._closest(near, point, best)
+
+        if difference * difference <= best[0]:
+            self._closest(far, point, best)
+
+    def _within_radius(self, node, point, radius, found):
+
+        axis = node[0]
+
+        if axis is None:
+            points = self.points
+            radius_squared = radius * radius
+
+            for inc in node[1]:
+                other = points[inc]
+
+                x = other[0] - point[0]
+                y = other[1] - point[1]
+                z = other[2] - point[2]
+
+                if x * x + y * y + z * z < radius_squared:
+                    found.append(inc)
+
+            return
+
+        difference = point[axis] - node[1]
+
+        if difference < radius:
+            self._within_radius(node[2], point, radius, found)
+        if difference > -radius:
+            self._within_radius(node[3], point, radius, found)
+
+    def get_closest(self, point, max_distance=None):
+        """
+        Args:
+            point (list): [0,0,0] vector.
+            max_distance (float): Only look this far. Bounded searches stay fast even when nothing is close.
+
+        Returns:
+            tuple: (index, distance) of the closest point, or None if no point was found.
+            When points are equally close the lowest index wins.
+        """
+        if self._get_root() is None:
+            return
+
+        # the index starts past the end so a point exactly at max_distance still counts
+        best = [float('inf'), len(self.points)]
+
+        if max_distance is not None:
+            best[0] = max_distance * max_distance
+
+        self._closest(self._root, point, best)
+
+        if best[1] == len(self.points):
+            return
+
+        return best[1], math.sqrt(best[0])
+
+    def get_closest_many(self, points, max_distance=None):
+        """
+        Returns:
+            list: get_closest result for each of the given points.
+        """
+        if self._array is not None and len(points):
+            return self._get_closest_many_numpy(points, max_distance)
+
+        return [self.get_closest(point, max_distance) for point in points]
+
+    def get_within_radius(self, point, radius):
+        """
+        Returns:
+            list: Sorted indices of the points closer than radius to point.
+        """
+        found = []
+
+        if self._get_root() is not None:
+            self._within_radius(self._root, point, radius, found)
+
+        found.sort()
+
+        return found
+
+    def get_mirror_indices(self, axis='X', tolerance=0.0001):
+        """
+        Find the mirrored partner of every point.
+
+        Args:
+            axis (str): 'X', 'Y' or 'Z'.
+            tolerance (float): How far the mirrored position can be from its partner.
+
+        Returns:
+            list: The partner index for each point, or None where no point sits at the mirrored position.
+        """
+        mirrored = [mirror_vector(point, axis) for point in self.points]
+
+        return [closest[0] if closest else None for closest in self.get_closest_many(mirrored, tolerance)]
+
+
+def get_mirror_map(points, axis='X', tolerance=0.0001, point_tree=None):
+    """
+    Map every point to its mirrored partner in one pass.
+    Points without a partner within tolerance fall back to the point closest to their mirrored position.
+
+    Args:
+        points (list): List of [0,0,0] vectors.
+        axis (str): 'X', 'Y' or 'Z'.
+        tolerance (float): How far the mirrored position can be from its partner.
+        point_tree (PointTree): Reuse a tree already built from points.
+
+    Returns:
+        tuple: (list of partner indices, list of the point indices that used the fallback)
+    """
+    if not point_tree:
+        point_tree = PointTree(points)
+
+    mirrored = [mirror_vector(point, axis) for point in point_tree.points]
+
+    closest = point_tree.get_closest_many(mirrored, tolerance)
+
+    fallback = [inc for inc, found in enumerate(closest) if not found]
+
+    if fallback:
+        fallback_closest = point_tree.get_closest_many([mirrored[inc] for inc in fallback])
+
+        for inc, found in zip(fallback, fallback_closest):
+            closest[inc] = found
+
+    mirror_map = [found[0] for found in closest]
+
+    return mirror_map, fallback
+
+
 def fade_sine(percent_value):
     input_value = math.pi * percent_value
     return math.sin(input_value)